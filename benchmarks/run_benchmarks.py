@@ -0,0 +1,418 @@
+"""
+Performance benchmarks of confidence-planner.
+
+Measures the per-call latency and throughput of every scalar and vectorized interval, sample size, and confidence
+level function, of the estimate_* wrappers for every registered method, of percentiles_ci over growing numbers of
+bootstrap replicates, of plot_classifier_intervals over growing numbers of models, and the cold import time of the
+package. Results are written as JSON and can be compared against a stored baseline:
+
+    python benchmarks/run_benchmarks.py --output results.json --baseline benchmarks/baseline.json
+
+The command exits with status 1 when a benchmark is slower than its baseline by more than the threshold factor. A
+new baseline is recorded with --output benchmarks/baseline.json. Timings depend on the machine, so baselines should
+be recorded on the machine (or CI runner type) they are compared on.
+"""
+
+import argparse
+import datetime
+import inspect
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, ROOT)
+
+import confidence_planner as cp  # noqa: E402
+from confidence_planner import confidence_planner as core  # noqa: E402
+
+RESULTS_VERSION = 1
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+# Benchmarks slower than the baseline by more than this factor are reported as regressions.
+DEFAULT_THRESHOLD = 1.25
+
+BATCH_SIZE = 10000
+REPLICATE_COUNTS = (100, 1000, 10000, 100000)
+MODEL_COUNTS = (10, 100, 500)
+
+_ESTIMATOR_NAME = re.compile(
+    r"_(ci|sample_size|confidence_level)(_batch|_from_counts)?$"
+)
+
+
+def _scalar_parameters():
+    replicates = np.random.default_rng(0).normal(0.8, 0.02, 1000).clip(0, 1)
+    return {
+        "sample_size": 1000,
+        "accuracy": 0.8,
+        "confidence_level": 0.95,
+        "interval_radius": 0.05,
+        "n_splits": 10,
+        "accuracies": replicates.tolist(),
+        "successes": 800,
+        "trials": 1000,
+    }
+
+
+def _batch_parameters(size):
+    rng = np.random.default_rng(0)
+    trials = rng.integers(100, 100000, size)
+    return {
+        "sample_size": trials,
+        "accuracy": rng.uniform(0.5, 0.99, size),
+        "confidence_level": rng.choice([0.9, 0.95, 0.99], size),
+        "interval_radius": rng.uniform(0.01, 0.1, size),
+        "n_splits": 10,
+        # 100 models with 1000 bootstrap replicates each
+        "accuracies": rng.normal(0.8, 0.02, (100, 1000)).clip(0, 1),
+        "successes": np.floor(trials * rng.uniform(0.5, 0.99, size)),
+        "trials": trials,
+    }
+
+
+def estimator_benchmarks(batch_size: int = BATCH_SIZE):
+    """
+    Returns (name, group, callable, items) tuples for all public interval, sample size and confidence level
+    functions of the core module, and for the unchecked kernels of the scalar interval functions. Vectorized
+    functions are called with batch_size parameter values.
+    """
+    scalar, batch = _scalar_parameters(), _batch_parameters(batch_size)
+    benchmarks = []
+    for name, function in sorted(vars(core).items()):
+        if (
+            name.startswith("_")
+            or not inspect.isfunction(function)
+            or function.__module__ != core.__name__
+            or not _ESTIMATOR_NAME.search(name)
+            or name.startswith("estimate_")
+        ):
+            continue
+        vectorized = not name.endswith(("_ci", "_sample_size", "_confidence_level"))
+        values = batch if vectorized else scalar
+        parameters = inspect.signature(function).parameters
+        kwargs = {
+            parameter: values[parameter]
+            for parameter, spec in parameters.items()
+            if spec.default is inspect.Parameter.empty
+        }
+        if "accuracies" in kwargs:
+            items = len(kwargs["accuracies"])
+        else:
+            items = batch_size if vectorized else 1
+        benchmarks.append(
+            (
+                name,
+                "batch" if vectorized else "scalar",
+                (lambda f=function, k=kwargs: f(**k)),
+                items,
+            )
+        )
+        if name in core._UNCHECKED_KERNELS:
+            # The same call without validation, to compare with the checked function
+            benchmarks.append(
+                (
+                    f"unchecked({name})",
+                    "unchecked",
+                    (lambda f=cp.unchecked(name), k=kwargs: f(**k)),
+                    1,
+                )
+            )
+    return benchmarks
+
+
+def wrapper_benchmarks():
+    """
+    Returns (name, group, callable, items) tuples for the estimate_* wrappers with every registered method.
+    """
+    values = _scalar_parameters()
+    n, acc, conf, radius, k = (
+        values["sample_size"],
+        values["accuracy"],
+        values["confidence_level"],
+        values["interval_radius"],
+        values["n_splits"],
+    )
+    replicates = values["accuracies"]
+    benchmarks = []
+    for method in cp.available_methods("interval"):
+        accuracy = replicates if cp.get_method(method).uses_replicates else acc
+        benchmarks.append(
+            (
+                f"estimate_confidence_interval[{method}]",
+                "estimate",
+                (
+                    lambda m=method, a=accuracy: cp.estimate_confidence_interval(
+                        n, a, conf, k, m
+                    )
+                ),
+                1,
+            )
+        )
+    for method in cp.available_methods("sample_size"):
+        benchmarks.append(
+            (
+                f"estimate_sample_size[{method}]",
+                "estimate",
+                (lambda m=method: cp.estimate_sample_size(radius, conf, k, m)),
+                1,
+            )
+        )
+    for method in cp.available_methods("confidence_level"):
+        benchmarks.append(
+            (
+                f"estimate_confidence_level[{method}]",
+                "estimate",
+                (
+                    lambda m=method: cp.estimate_confidence_level(
+                        n, radius, k, m, accuracies=replicates
+                    )
+                ),
+                1,
+            )
+        )
+    return benchmarks
+
+
+def percentile_benchmarks(replicate_counts=REPLICATE_COUNTS):
+    """
+    Returns (name, group, callable, items) tuples for percentiles_ci with growing numbers of bootstrap replicates.
+    """
+    rng = np.random.default_rng(0)
+    benchmarks = []
+    for count in replicate_counts:
+        replicates = rng.normal(0.8, 0.02, count).clip(0, 1).tolist()
+        benchmarks.append(
+            (
+                f"percentiles_ci[{count}]",
+                "percentiles",
+                (lambda r=replicates: cp.percentiles_ci(r, 0.95)),
+                count,
+            )
+        )
+    return benchmarks
+
+
+def plot_benchmarks(model_counts=MODEL_COUNTS):
+    """
+    Returns (name, group, callable, items) tuples for plot_classifier_intervals with growing numbers of models,
+    including rendering of the figure with the Agg backend.
+    """
+
+    def plot(names, sizes, accuracies):
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        figure = cp.plot_classifier_intervals(names, sizes, accuracies, "holdout")
+        figure.canvas.draw()
+        plt.close(figure)
+
+    rng = np.random.default_rng(0)
+    benchmarks = []
+    for count in model_counts:
+        names = [f"model {i}" for i in range(count)]
+        sizes = rng.integers(100, 10000, count)
+        accuracies = rng.uniform(0.5, 0.99, count)
+        benchmarks.append(
+            (
+                f"plot_classifier_intervals[{count}]",
+                "plot",
+                (lambda a=(names, sizes, accuracies): plot(*a)),
+                count,
+            )
+        )
+    return benchmarks
+
+
+def measure(function, min_time: float = 0.05, repeats: int = 5) -> list:
+    """
+    Returns the time per call in seconds of each of the repeats. The function is called once before timing, so that
+    lazy imports and caches do not count, and the number of calls per repeat is increased until a repeat takes at
+    least min_time seconds.
+    """
+    function()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        timings.append((time.perf_counter() - start) / number)
+    return timings
+
+
+def measure_import(repeats: int = 5) -> list:
+    """
+    Returns the cold import time of confidence_planner in seconds, measured in a new interpreter for each repeat.
+    """
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import confidence_planner\n"
+        "print(time.perf_counter() - start)"
+    )
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([ROOT, env.get("PYTHONPATH", "")])
+    return [
+        float(subprocess.check_output([sys.executable, "-c", code], env=env, cwd=ROOT))
+        for _ in range(repeats)
+    ]
+
+
+def _entry(group, timings, items):
+    median = statistics.median(timings)
+    return {
+        "group": group,
+        "seconds": median,
+        "min_seconds": min(timings),
+        "repeats": len(timings),
+        "items": items,
+        "items_per_second": items / median if median > 0 else None,
+    }
+
+
+def run(pattern: str = None, quick: bool = False, log=None) -> dict:
+    """
+    Runs all benchmarks whose name contains pattern and returns the results as a JSON-serializable dict.
+
+    Parameters
+    ----------
+    pattern : str
+        Optional. Only benchmarks whose name contains this string are run.
+    quick : bool
+        Whether to use fewer and shorter repeats and smaller problem sizes, e.g., for smoke tests. Default: False.
+    log : file-like
+        Optional. Stream to which progress is written.
+    """
+    min_time, repeats = (0.005, 3) if quick else (0.05, 5)
+    benchmarks = (
+        estimator_benchmarks(1000 if quick else BATCH_SIZE)
+        + wrapper_benchmarks()
+        + percentile_benchmarks(REPLICATE_COUNTS[:2] if quick else REPLICATE_COUNTS)
+        + plot_benchmarks(MODEL_COUNTS[:1] if quick else MODEL_COUNTS)
+    )
+
+    results = {}
+    if pattern is None or pattern in "import":
+        results["import"] = _entry("import", measure_import(repeats), 1)
+        if log is not None:
+            print(
+                f"{'import':60s} {_format_seconds(results['import']['seconds'])}",
+                file=log,
+            )
+    for name, group, function, items in benchmarks:
+        if pattern is not None and pattern not in name:
+            continue
+        results[name] = _entry(group, measure(function, min_time, repeats), items)
+        if log is not None:
+            print(f"{name:60s} {_format_seconds(results[name]['seconds'])}", file=log)
+
+    return {
+        "version": RESULTS_VERSION,
+        "metadata": {
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "quick": quick,
+        },
+        "benchmarks": results,
+    }
+
+
+def compare(
+    results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD
+) -> list:
+    """
+    Compares benchmark results with a baseline. Returns (name, baseline seconds, seconds, ratio) tuples of the
+    benchmarks present in both with the same problem size, sorted from the largest slowdown. Ratios above threshold
+    are regressions.
+    """
+    if baseline.get("version") != RESULTS_VERSION:
+        raise Exception(
+            f'Baseline version should be {RESULTS_VERSION}, not "{baseline.get("version")}"'
+        )
+    comparison = []
+    for name, entry in results["benchmarks"].items():
+        before = baseline["benchmarks"].get(name)
+        if before is not None and before["items"] == entry["items"]:
+            before = before["seconds"]
+            comparison.append(
+                (name, before, entry["seconds"], entry["seconds"] / before)
+            )
+    return sorted(comparison, key=lambda row: row[3], reverse=True)
+
+
+def _format_seconds(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", help="JSON file the results are written to.")
+    parser.add_argument(
+        "--baseline",
+        help=f"JSON results to compare with. Default: {os.path.relpath(DEFAULT_BASELINE)} when it exists.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Slowdown factor above which a benchmark is a regression. Default: %(default)s.",
+    )
+    parser.add_argument(
+        "--filter", help="Only run benchmarks whose name contains this string."
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Fewer repeats and smaller problems."
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.filter, args.quick, log=sys.stdout)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+
+    baseline_path = args.baseline
+    if baseline_path is None and os.path.exists(DEFAULT_BASELINE):
+        baseline_path = DEFAULT_BASELINE
+    if baseline_path is None or (
+        args.output and os.path.abspath(args.output) == os.path.abspath(baseline_path)
+    ):
+        return 0
+
+    with open(baseline_path) as file:
+        comparison = compare(results, json.load(file), args.threshold)
+    regressions = [row for row in comparison if row[3] > args.threshold]
+    print(f"\nComparison with {baseline_path}:")
+    for name, before, after, ratio in comparison:
+        flag = "  REGRESSION" if ratio > args.threshold else ""
+        print(
+            f"{name:60s} {_format_seconds(before)} -> {_format_seconds(after)} ({ratio:5.2f}x){flag}"
+        )
+    print(f"{len(regressions)} regression(s) out of {len(comparison)} benchmarks.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
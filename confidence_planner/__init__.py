@@ -1 +1,70 @@
+import importlib
+
 from .confidence_planner import *
+from .results import *
+from .bootstrap import *
+from .registry import *
+
+# Submodules and attributes are only imported on first access, so that ``import confidence_planner`` stays cheap for
+# code that only needs the estimators: plotting pulls in matplotlib, and the batch utilities pull in multiprocessing
+# and concurrent.futures.
+_LAZY_MODULES = {
+    "parallel": ["estimate_batch"],
+    "tables": ["PlanningTable", "build_planning_table"],
+    "online": ["OnlineEvaluator"],
+    "sequential": ["ConfidenceSequence", "sequential_evaluation"],
+    "grouped": ["grouped_confidence_intervals"],
+    "crossval": [
+        "CrossValidationTracker",
+        "corrected_resampled_t_ci",
+        "corrected_resampled_t_ci_batch",
+    ],
+    "dataframe": ["add_confidence_intervals", "iter_confidence_intervals"],
+    "instrumentation": [
+        "Instrumentation",
+        "disable_instrumentation",
+        "enable_instrumentation",
+        "instrument",
+        "is_instrumented",
+    ],
+}
+_LAZY_ATTRIBUTES = {
+    "plotting": ("plotting", None),
+    "plot_classifier_intervals": ("plotting", "plot_classifier_intervals"),
+    "render_classifier_intervals": ("plotting", "render_classifier_intervals"),
+}
+for _module_name, _attributes in _LAZY_MODULES.items():
+    _LAZY_ATTRIBUTES[_module_name] = (_module_name, None)
+    _LAZY_ATTRIBUTES.update((name, (_module_name, name)) for name in _attributes)
+
+# Star imports export the public names of every submodule; lazy ones are resolved through __getattr__ on first use.
+__all__ = (
+    confidence_planner.__all__
+    + results.__all__
+    + bootstrap.__all__
+    + registry.__all__
+    + [name for name, (_, attribute) in _LAZY_ATTRIBUTES.items() if attribute]
+)
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+def _load_lazy_modules():
+    # Resolves the lazy attributes of every submodule except plotting (used by instrumentation, which patches the
+    # functions of all loaded modules).
+    for name, (module_name, _) in _LAZY_ATTRIBUTES.items():
+        if module_name in _LAZY_MODULES and name not in globals():
+            __getattr__(name)
@@ -0,0 +1,396 @@
+import math
+import struct
+import numpy as np
+
+from .confidence_planner import _check_batch, is_trusted
+from .results import Interval
+
+__all__ = ["PercentileSketch", "bootstrap_accuracies", "bootstrap_accuracy_chunks"]
+
+_SKETCH_MAGIC = b"CPQS"
+_SKETCH_VERSION = 1
+_SKETCH_HEADER = struct.Struct("<4sBIQQI")
+
+# Default number of bootstrap replicates generated at once.
+BOOTSTRAP_CHUNK_SIZE = 2**20
+
+
+def _correct_predictions(y_true, y_pred, correct, allow_empty: bool = False):
+    if correct is None:
+        if y_true is None or y_pred is None:
+            raise Exception(
+                "Provide either the correct parameter or both y_true and y_pred."
+            )
+        y_true, y_pred = np.asarray(y_true).ravel(), np.asarray(y_pred).ravel()
+        if y_true.shape != y_pred.shape:
+            raise Exception(
+                f"y_true and y_pred should have the same length, not {y_true.size} and {y_pred.size}"
+            )
+        correct = y_true == y_pred
+    else:
+        correct = np.asarray(correct).ravel()
+        if not is_trusted():
+            _check_batch(
+                (correct != 0) & (correct != 1),
+                "Each element of correct should be a boolean or 0/1.",
+            )
+
+    if correct.size == 0 and not allow_empty:
+        raise Exception("At least one prediction is needed to bootstrap accuracy.")
+
+    return int(np.count_nonzero(correct)), correct.size
+
+
+def bootstrap_accuracy_chunks(
+    y_true=None,
+    y_pred=None,
+    n_bootstraps: int = 1000,
+    correct=None,
+    seed=None,
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+):
+    """
+    Generates bootstrap replicate accuracies in chunks of at most chunk_size values. Resampling n examples with
+    replacement is equivalent to drawing the number of correctly classified examples from a binomial distribution, so
+    each replicate costs a single random draw regardless of the test set size and no index arrays are materialized.
+    Each chunk uses its own generator spawned from a SeedSequence, so results are reproducible for a given seed and
+    chunk_size.
+
+    Parameters
+    ----------
+    y_true : array-like
+        Optional. True labels of the test examples. Used together with y_pred when correct is not given.
+    y_pred : array-like
+        Optional. Predicted labels of the test examples.
+    n_bootstraps : int
+        Number of bootstrap replicates. Must be greater than 0. Default: 1000.
+    correct : array-like
+        Optional. Boolean (or 0/1) vector indicating which test examples were classified correctly.
+    seed : int or numpy.random.SeedSequence
+        Optional. Seed for reproducible resampling.
+    chunk_size : int
+        Maximum number of replicates generated at once. Default: 2**20.
+    """
+    if n_bootstraps <= 0:
+        raise Exception(
+            f'Number of bootstraps must be an integer greater than 0, not "{n_bootstraps}"'
+        )
+    if chunk_size <= 0:
+        raise Exception(
+            f'Chunk size must be an integer greater than 0, not "{chunk_size}"'
+        )
+    n_correct, n = _correct_predictions(y_true, y_pred, correct)
+
+    seed_sequence = (
+        seed
+        if isinstance(seed, np.random.SeedSequence)
+        else np.random.SeedSequence(seed)
+    )
+    return _generate_accuracy_chunks(
+        n_correct, n, n_bootstraps, seed_sequence, chunk_size
+    )
+
+
+def _generate_accuracy_chunks(n_correct, n, n_bootstraps, seed_sequence, chunk_size):
+    n_chunks = -(-n_bootstraps // chunk_size)
+    for i, child in enumerate(seed_sequence.spawn(n_chunks)):
+        size = min(chunk_size, n_bootstraps - i * chunk_size)
+        rng = np.random.default_rng(child)
+        yield rng.binomial(n, n_correct / n, size=size) / n
+
+
+def bootstrap_accuracies(
+    y_true=None,
+    y_pred=None,
+    n_bootstraps: int = 1000,
+    correct=None,
+    seed=None,
+    chunk_size: int = BOOTSTRAP_CHUNK_SIZE,
+) -> np.ndarray:
+    """
+    Returns an array of bootstrap replicate accuracies, which can be passed directly to percentiles_ci,
+    percentiles_confidence_level, or estimate_confidence_interval with method='bootstrap'. See
+    bootstrap_accuracy_chunks for a description of the resampling procedure and the parameters. To summarize very
+    large numbers of replicates in bounded memory, feed bootstrap_accuracy_chunks into a PercentileSketch instead.
+
+    Parameters
+    ----------
+    y_true : array-like
+        Optional. True labels of the test examples. Used together with y_pred when correct is not given.
+    y_pred : array-like
+        Optional. Predicted labels of the test examples.
+    n_bootstraps : int
+        Number of bootstrap replicates. Must be greater than 0. Default: 1000.
+    correct : array-like
+        Optional. Boolean (or 0/1) vector indicating which test examples were classified correctly.
+    seed : int or numpy.random.SeedSequence
+        Optional. Seed for reproducible resampling.
+    chunk_size : int
+        Maximum number of replicates generated at once. Default: 2**20.
+    """
+    chunks = bootstrap_accuracy_chunks(
+        y_true, y_pred, n_bootstraps, correct, seed, chunk_size
+    )
+    accuracies = np.empty(n_bootstraps)
+    start = 0
+    for chunk in chunks:
+        accuracies[start : start + chunk.size] = chunk
+        start += chunk.size
+
+    return accuracies
+
+
+class PercentileSketch:
+    """
+    Streaming, mergeable accumulator of bootstrap accuracies that answers percentile queries in bounded memory.
+
+    Replicates are stored exactly until their number exceeds exact_limit, so for typical bootstrap runs
+    confidence_interval returns exactly the same bounds as percentiles_ci. Past that point the replicates are
+    compacted into a KLL quantile sketch that keeps at most about 3 * k values. The normalized rank error of the
+    reported percentiles is then O(1/k); with the default k = 200 it stays below 1% of the number of replicates with
+    high probability. Sketches built in separate processes can be combined with merge and transferred with
+    to_bytes / from_bytes.
+
+    Parameters
+    ----------
+    k : int
+        Accuracy parameter of the sketch. Larger values reduce the rank error and increase memory. Must be at least 8.
+    exact_limit : int
+        Number of replicates kept exactly before the sketch starts compacting them. Default: 10000.
+    seed : int
+        Optional. Seed of the random generator used when compacting, for reproducible sketches.
+    """
+
+    def __init__(self, k: int = 200, exact_limit: int = 10000, seed: int = None):
+        if k < 8:
+            raise Exception(f'Sketch parameter k must be at least 8, not "{k}"')
+        if exact_limit < 0:
+            raise Exception(f'Exact limit must not be negative, not "{exact_limit}"')
+
+        self.k = int(k)
+        self.exact_limit = int(exact_limit)
+        self.n = 0
+        self._levels = [np.empty(0)]
+        # Chunks added since the last compaction, concatenated into the lowest level only when needed.
+        self._buffer = []
+        self._buffered = 0
+        # Number of values stored in the levels, and the number above which the sketch is compacted.
+        self._stored = 0
+        self._limit = max(self.exact_limit, self.k)
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def is_exact(self) -> bool:
+        """
+        True while all replicates are stored without compaction.
+        """
+        return len(self._levels) == 1
+
+    @property
+    def retained(self) -> int:
+        """
+        Number of values currently held in memory.
+        """
+        return self._stored + self._buffered
+
+    def update(self, accuracies):
+        """
+        Adds a single bootstrap accuracy or a chunk of accuracies to the sketch.
+
+        Parameters
+        ----------
+        accuracies : float or array-like
+            Accuracies obtained for bootstrap samples. Should be between 0 and 1.
+        """
+        values = np.asarray(accuracies, dtype=float).ravel()
+        if values.size == 0:
+            return self
+        if not is_trusted():
+            _check_batch(
+                (values < 0) | (values > 1), "Each accuracy should by between <0, 1>."
+            )
+
+        self._buffer.append(values)
+        self._buffered += values.size
+        self.n += values.size
+        if self._stored + self._buffered > self._limit:
+            self._compress()
+        return self
+
+    def merge(self, other: "PercentileSketch"):
+        """
+        Adds all replicates summarized by another sketch to this one.
+
+        Parameters
+        ----------
+        other : PercentileSketch
+            Sketch created with the same k parameter.
+        """
+        if other.k != self.k:
+            raise Exception(
+                f"Only sketches with the same k can be merged, not {self.k} and {other.k}"
+            )
+
+        self._flush()
+        other._flush()
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self._stored += other._stored
+        self.n += other.n
+        self._compress()
+        return self
+
+    def percentile(self, q):
+        """
+        Returns the q-th percentile(s) of the accumulated accuracies, using the same linear interpolation as
+        numpy.percentile.
+
+        Parameters
+        ----------
+        q : float or array-like
+            Percentile(s) to compute. Should be between 0 and 100.
+        """
+        if self.n == 0:
+            raise Exception("The sketch is empty. Add bootstrap accuracies first.")
+
+        self._flush()
+        if self.is_exact:
+            return np.percentile(self._levels[0], q)
+
+        values = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [np.full(items.size, 2**level) for level, items in enumerate(self._levels)]
+        )
+        order = np.argsort(values, kind="stable")
+        values, cumulative = values[order], np.cumsum(weights[order])
+
+        position = (self.n - 1) * np.asarray(q, dtype=float) / 100
+        below, above = np.floor(position), np.ceil(position)
+        value_below = values[np.searchsorted(cumulative, below, side="right")]
+        value_above = values[np.searchsorted(cumulative, above, side="right")]
+        return value_below + (position - below) * (value_above - value_below)
+
+    def confidence_interval(self, confidence_level: float) -> Interval:
+        """
+        Returns the percentile confidence interval for the given confidence level, in the same form as percentiles_ci.
+
+        Parameters
+        ----------
+        confidence_level : float
+            Desired confidence level. Should be between 0 and 1.
+        """
+        if confidence_level <= 0 or confidence_level >= 1:
+            raise Exception(
+                f'Confidence level should be between 0 and 1, not "{confidence_level}".'
+            )
+
+        lower_bound, upper_bound = self.percentile(
+            [
+                100 * ((1 - confidence_level) / 2),
+                100 * (confidence_level + (1 - confidence_level) / 2),
+            ]
+        )
+        return Interval(
+            min(max(0.0, lower_bound), 1.0), min(max(0.0, upper_bound), 1.0)
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the sketch into a compact binary representation.
+        """
+        self._flush()
+        sizes = np.array([items.size for items in self._levels], dtype="<u8")
+        header = _SKETCH_HEADER.pack(
+            _SKETCH_MAGIC,
+            _SKETCH_VERSION,
+            self.k,
+            self.exact_limit,
+            self.n,
+            len(self._levels),
+        )
+        values = np.concatenate(self._levels).astype("<f8")
+        return header + sizes.tobytes() + values.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes, seed: int = None) -> "PercentileSketch":
+        """
+        Restores a sketch serialized with to_bytes.
+
+        Parameters
+        ----------
+        data : bytes
+            Serialized sketch.
+        seed : int
+            Optional. Seed of the random generator used for further compactions.
+        """
+        if len(data) < _SKETCH_HEADER.size:
+            raise Exception("Data does not contain a serialized percentile sketch.")
+        magic, version, k, exact_limit, n, n_levels = _SKETCH_HEADER.unpack_from(data)
+        if magic != _SKETCH_MAGIC or version != _SKETCH_VERSION:
+            raise Exception("Data does not contain a serialized percentile sketch.")
+
+        # Level sizes and values are checked against the payload before anything is allocated, so truncated or
+        # corrupt data raises instead of producing a sketch with inconsistent weights.
+        offset = _SKETCH_HEADER.size
+        if n_levels == 0 or len(data) - offset < 8 * n_levels:
+            raise Exception("Serialized percentile sketch is truncated or corrupt.")
+        sizes = np.frombuffer(data, dtype="<u8", count=n_levels, offset=offset)
+        offset += sizes.nbytes
+        sizes = [int(size) for size in sizes]
+        if len(data) - offset != 8 * sum(sizes) or n != sum(
+            size << level for level, size in enumerate(sizes)
+        ):
+            raise Exception("Serialized percentile sketch is truncated or corrupt.")
+        values = np.frombuffer(data, dtype="<f8", offset=offset).astype(float)
+        if np.logical_not((values >= 0) & (values <= 1)).any():
+            raise Exception("Serialized percentile sketch is truncated or corrupt.")
+
+        sketch = cls(k=k, exact_limit=exact_limit, seed=seed)
+        sketch.n = n
+        sketch._levels = np.split(values, np.cumsum(sizes)[:-1].astype(int))
+        sketch._stored = values.size
+        sketch._limit = sketch._max_retained()
+        return sketch
+
+    def _flush(self):
+        if self._buffer:
+            self._levels[0] = np.concatenate([self._levels[0]] + self._buffer)
+            self._stored += self._buffered
+            self._buffer = []
+            self._buffered = 0
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(int(math.ceil(self.k * (2 / 3) ** depth)), 2)
+
+    def _max_retained(self) -> int:
+        if self.is_exact:
+            return max(self.exact_limit, self.k)
+        return sum(self._capacity(level) for level in range(len(self._levels)))
+
+    def _compress(self):
+        self._flush()
+        # As in KLL, only the lowest level over its capacity is compacted in each pass, until the sketch fits in its
+        # total capacity again, so higher levels are compacted no more often than needed.
+        self._limit = self._max_retained()
+        while self._stored > self._limit:
+            level = 0
+            while self._levels[level].size <= self._capacity(level):
+                level += 1
+            if level + 1 == len(self._levels):
+                self._levels.append(np.empty(0))
+                self._limit = self._max_retained()
+
+            # Every other value of the sorted level is promoted with double weight. The random offset keeps the rank
+            # error unbiased; an odd value out stays on the current level.
+            items = np.sort(self._levels[level])
+            odd = items.size % 2
+            offset = self._rng.integers(2)
+            promoted = items[offset : items.size - odd : 2]
+            self._levels[level + 1] = np.concatenate(
+                [self._levels[level + 1], promoted]
+            )
+            self._levels[level] = items[items.size - odd :]
+            self._stored -= items.size - odd - promoted.size
@@ -0,0 +1,409 @@
+import argparse
+import csv
+import itertools
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .parallel import _COLUMNS, _OUTPUTS, estimate_batch
+
+__all__ = ["main"]
+
+# Default number of rows read, evaluated, and written at once.
+CLI_CHUNK_SIZE = 10000
+
+_FORMATS = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+
+def _format(path, explicit):
+    if explicit is not None:
+        return explicit
+    if path is None or path == "-":
+        return "csv"
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in _FORMATS:
+        raise Exception(
+            f'Cannot infer the format of "{path}". Use --input-format or --output-format.'
+        )
+    return _FORMATS[extension]
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise Exception(
+            "Reading and writing Parquet files requires pyarrow (pip install pyarrow)."
+        )
+    return pyarrow
+
+
+def _chunks(rows, chunk_size):
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _read(path, input_format, chunk_size):
+    # Yields lists of at most chunk_size rows, so that only one chunk per worker is held in memory.
+    if input_format == "parquet":
+        if path == "-":
+            raise Exception("Parquet input must be read from a file, not stdin.")
+        pyarrow = _import_pyarrow()
+        parquet_file = pyarrow.parquet.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunk_size):
+            yield batch.to_pylist()
+        return
+
+    stream = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+    try:
+        if input_format == "csv":
+            rows = csv.DictReader(stream)
+        else:
+            rows = (json.loads(line) for line in stream if line.strip())
+        yield from _chunks(rows, chunk_size)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+class _Writer:
+    def __init__(self, path, output_format, outputs):
+        self.path = path
+        self.format = output_format
+        self.outputs = list(outputs) + ["error"]
+        self.stream = None
+        self.writer = None
+        self.fields = None
+
+    def write(self, rows, results):
+        if self.format == "parquet":
+            self._write_parquet(rows, results)
+            return
+
+        if self.stream is None:
+            if self.path is None or self.path == "-":
+                self.stream = sys.stdout
+            else:
+                self.stream = open(self.path, "w", newline="", encoding="utf-8")
+        if self.fields is None:
+            self.fields = [name for name in rows[0] if name not in self.outputs]
+        # Missing outputs are written as empty CSV cells or JSON nulls.
+        outputs = [
+            [None if value != value else value for value in results[name]]
+            for name in self.outputs
+        ]
+
+        if self.format == "jsonl":
+            for row, values in zip(rows, zip(*outputs)):
+                row = dict(row, **dict(zip(self.outputs, values)))
+                self.stream.write(json.dumps(row) + "\n")
+        else:
+            if self.writer is None:
+                self.writer = csv.writer(self.stream)
+                self.writer.writerow(self.fields + self.outputs)
+            self.writer.writerows(
+                [row.get(name) for name in self.fields] + list(values)
+                for row, values in zip(rows, zip(*outputs))
+            )
+        self.stream.flush()
+
+    def _write_parquet(self, rows, results):
+        pyarrow = _import_pyarrow()
+        if self.path is None or self.path == "-":
+            raise Exception("Parquet output must be written to a file, not stdout.")
+        table = pyarrow.Table.from_pylist(rows)
+        table = table.select(
+            [name for name in table.column_names if name not in self.outputs]
+        )
+        table = pyarrow.Table.from_arrays(
+            table.columns + [pyarrow.array(results[name]) for name in self.outputs],
+            names=table.column_names + self.outputs,
+        )
+        if self.writer is None:
+            self.writer = pyarrow.parquet.ParquetWriter(self.path, table.schema)
+        self.writer.write_table(table.cast(self.writer.schema))
+
+    def close(self):
+        if self.format == "parquet":
+            if self.writer is not None:
+                self.writer.close()
+        elif self.stream is not None and self.stream is not sys.stdout:
+            self.stream.close()
+
+
+def _missing(value):
+    return value is None or value == ""
+
+
+def _parse_number(value, name):
+    if isinstance(value, str):
+        value = value.strip()
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        number = math.nan
+    if math.isnan(number):
+        raise Exception(f'Invalid value "{value}" in the "{name}" column.')
+    return number
+
+
+def _parse_column(cells, name, default, messages):
+    # Parses a column of cells into floats. Rows with missing or invalid cells get an error message in messages.
+    missing = [_missing(cell) for cell in cells]
+    if any(missing):
+        cells = [
+            (math.nan if default is None else default) if is_missing else cell
+            for cell, is_missing in zip(cells, missing)
+        ]
+        if default is None:
+            for i in itertools.compress(range(len(cells)), missing):
+                messages[i] = messages[i] or f'Missing value in the "{name}" column.'
+
+    try:
+        column = np.asarray(cells, dtype=float)
+    except (TypeError, ValueError):
+        column = None
+    if column is not None:
+        # NaN cells are invalid unless the row already has an error.
+        unexplained = np.isnan(column) & np.equal(messages, None)
+        if not unexplained.any():
+            return column
+
+    # Cells are parsed one at a time to report the invalid ones.
+    values = []
+    for i, cell in enumerate(cells):
+        try:
+            if isinstance(cell, str) and name == "accuracy" and cell.startswith("["):
+                # Bootstrap accuracies given as a JSON list
+                cell = json.loads(cell)
+            if isinstance(cell, list):
+                values.append([_parse_number(item, name) for item in cell])
+            else:
+                values.append(_parse_number(cell, name))
+        except Exception as e:
+            messages[i] = messages[i] or str(e)
+            values.append(math.nan)
+    if any(isinstance(value, list) for value in values):
+        return values
+    return np.asarray(values, dtype=float)
+
+
+def _evaluate(kind, rows, defaults):
+    n_rows = len(rows)
+    messages = [None] * n_rows
+    cells = {name: [row.get(name) for row in rows] for name, _ in _COLUMNS[kind]}
+
+    if kind == "interval" and any("trials" in row for row in rows):
+        # Counts are converted to the sample size and accuracy of rows without an accuracy.
+        for i, row in enumerate(rows):
+            if _missing(cells["accuracy"][i]) and not _missing(row.get("trials")):
+                try:
+                    trials = _parse_number(row["trials"], "trials")
+                    successes = _parse_number(row.get("successes"), "successes")
+                except Exception as e:
+                    messages[i] = str(e)
+                    continue
+                cells["sample_size"][i] = trials
+                cells["accuracy"][i] = successes / trials if trials > 0 else 0.0
+
+    requests = {}
+    for name, default in _COLUMNS[kind]:
+        if defaults.get(name) is not None:
+            default = defaults[name]
+        requests[name] = _parse_column(cells[name], name, default, messages)
+    requests["method"] = [
+        defaults["method"] if _missing(row.get("method")) else str(row["method"])
+        for row in rows
+    ]
+
+    valid = np.array([message is None for message in messages], dtype=bool)
+    rows_valid = np.flatnonzero(valid)
+    results = {name: np.full(n_rows, np.nan) for name in _OUTPUTS[kind]}
+    if rows_valid.size:
+        requests = {
+            name: (
+                column[valid]
+                if isinstance(column, np.ndarray)
+                else [column[i] for i in rows_valid]
+            )
+            for name, column in requests.items()
+        }
+        outputs = estimate_batch(
+            requests, kind=kind, backend="serial", chunk_size=rows_valid.size
+        )
+        for name in _OUTPUTS[kind]:
+            results[name][rows_valid] = outputs[name]
+        for i, message in zip(rows_valid, outputs["error"]):
+            messages[i] = message
+
+    results = {name: values.tolist() for name, values in results.items()}
+    if kind == "sample_size":
+        results["sample_size"] = [
+            None if message is not None else int(value)
+            for value, message in zip(results["sample_size"], messages)
+        ]
+    results["error"] = messages
+    return results
+
+
+def _evaluate_chunks(kind, chunks, defaults, jobs):
+    # Evaluates chunks in input order. With several processes, at most two chunks per process are pending at once.
+    if jobs == 1:
+        for rows in chunks:
+            yield rows, _evaluate(kind, rows, defaults)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = []
+        for rows in chunks:
+            pending.append((rows, executor.submit(_evaluate, kind, rows, defaults)))
+            if len(pending) >= 2 * jobs:
+                rows, future = pending.pop(0)
+                yield rows, future.result()
+        for rows, future in pending:
+            yield rows, future.result()
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog="confidence-planner",
+        description="Estimates accuracy confidence intervals, sample sizes, or confidence levels for every row of "
+        "a CSV, JSONL, or Parquet file. Rows are read, evaluated with the vectorized estimators, and written in "
+        "chunks, so files larger than memory can be processed. Each output row contains the input columns, the "
+        "estimate, and an error column with a message for rows that could not be evaluated.",
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="Input file, or - to read CSV or JSONL from stdin. Default: stdin.",
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="Output file. Default: stdout."
+    )
+    parser.add_argument(
+        "-k",
+        "--kind",
+        choices=list(_COLUMNS),
+        default="interval",
+        help="Estimate computed for each row. For 'interval' the input columns are sample_size and accuracy (or "
+        "successes and trials); for 'sample_size' interval_radius; for 'confidence_level' sample_size and "
+        "interval_radius. All kinds accept the optional confidence_level, method, n_splits, and accuracy columns. "
+        "Default: interval.",
+    )
+    parser.add_argument("--input-format", choices=["csv", "jsonl", "parquet"])
+    parser.add_argument("--output-format", choices=["csv", "jsonl", "parquet"])
+    parser.add_argument(
+        "-c",
+        "--confidence-level",
+        type=float,
+        help="Confidence level of rows without a confidence_level value.",
+    )
+    parser.add_argument(
+        "-m",
+        "--method",
+        default="holdout",
+        help="Method of rows without a method value. Default: holdout.",
+    )
+    parser.add_argument(
+        "--n-splits",
+        type=int,
+        help="Number of folds of rows without an n_splits value.",
+    )
+    parser.add_argument(
+        "--interval-radius",
+        type=float,
+        help="Interval radius of rows without an interval_radius value.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=CLI_CHUNK_SIZE,
+        help=f"Number of rows processed at once. Default: {CLI_CHUNK_SIZE}.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes. Default: 1.",
+    )
+    parser.add_argument(
+        "--errors",
+        choices=["coerce", "raise"],
+        default="coerce",
+        help="'coerce' to write rows that cannot be evaluated with an error message, or 'raise' to stop at the "
+        "first such row. Default: coerce.",
+    )
+    return parser
+
+
+def main(argv=None) -> int:
+    """
+    Entry point of the confidence-planner command. Returns the exit status: 0 on success and 1 when the input
+    cannot be processed (or, with --errors raise, when a row cannot be evaluated).
+    """
+    args = _parser().parse_args(argv)
+    writer = None
+    try:
+        if args.chunk_size <= 0:
+            raise Exception(
+                f'Chunk size must be an integer greater than 0, not "{args.chunk_size}"'
+            )
+        if args.jobs <= 0:
+            raise Exception(
+                f'Number of jobs must be an integer greater than 0, not "{args.jobs}"'
+            )
+        input_format = _format(args.input, args.input_format)
+        output_format = _format(
+            args.output,
+            args.output_format
+            or (
+                input_format
+                if args.output == "-" and input_format != "parquet"
+                else None
+            ),
+        )
+        defaults = {
+            "confidence_level": args.confidence_level,
+            "method": args.method,
+            "n_splits": args.n_splits,
+            "interval_radius": args.interval_radius,
+        }
+
+        writer = _Writer(args.output, output_format, _OUTPUTS[args.kind])
+        chunks = _read(args.input, input_format, args.chunk_size)
+        offset = 0
+        for rows, results in _evaluate_chunks(args.kind, chunks, defaults, args.jobs):
+            if args.errors == "raise":
+                for i, message in enumerate(results["error"]):
+                    if message is not None:
+                        raise Exception(f"Row {offset + i}: {message}")
+            writer.write(rows, results)
+            offset += len(rows)
+    except Exception as e:
+        print(f"confidence-planner: error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if writer is not None:
+            writer.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,52 +1,279 @@
+import contextlib
+import contextvars
 import math
 import numpy as np
 import functools
-import scipy.stats as st
-from statsmodels.stats.proportion import proportion_confint
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
 
-
-def _min_max(value, low: float = 0.0, high: float = 1.0) -> list:
-    if isinstance(value, list):
-        assert value[0] <= value[1]
-        value[0] = min(max(low, value[0]), high)
-        value[1] = min(max(low, value[1]), high)
+from .registry import EstimationMethod, get_method, register_method
+from .results import Interval
+
+__all__ = [
+    "BatchValidationError",
+    "CRITICAL_VALUE_CACHE_SIZE",
+    "T_TO_NORMAL_DF",
+    "cap",
+    "clear_critical_value_cache",
+    "clopper_pearson_ci",
+    "clopper_pearson_ci_batch",
+    "clopper_pearson_ci_from_counts",
+    "clopper_pearson_confidence_level",
+    "clopper_pearson_confidence_level_batch",
+    "clopper_pearson_sample_size",
+    "clopper_pearson_sample_size_batch",
+    "critical_value",
+    "critical_value_cache_info",
+    "cross_validation_ci",
+    "cross_validation_ci_batch",
+    "cross_validation_confidence_level",
+    "cross_validation_confidence_level_batch",
+    "cross_validation_sample_size",
+    "cross_validation_sample_size_batch",
+    "estimate_confidence_interval",
+    "estimate_confidence_level",
+    "estimate_sample_size",
+    "is_trusted",
+    "langford_ci",
+    "langford_ci_batch",
+    "langford_confidence_level",
+    "langford_confidence_level_batch",
+    "langford_sample_size",
+    "langford_sample_size_batch",
+    "percentiles_ci",
+    "percentiles_confidence_level",
+    "percentiles_confidence_level_batch",
+    "t_test_ci",
+    "t_test_ci_batch",
+    "t_test_confidence_level",
+    "t_test_confidence_level_batch",
+    "t_test_sample_size",
+    "t_test_sample_size_batch",
+    "trusted",
+    "unchecked",
+    "wilson_ci",
+    "wilson_ci_batch",
+    "wilson_ci_from_counts",
+    "wilson_confidence_level",
+    "wilson_confidence_level_batch",
+    "wilson_sample_size",
+    "wilson_sample_size_batch",
+    "z_test_ci",
+    "z_test_ci_batch",
+    "z_test_confidence_level",
+    "z_test_confidence_level_batch",
+    "z_test_sample_size",
+    "z_test_sample_size_batch",
+]
+
+# Creates Interval instances without a Python-level __new__ call.
+_new_interval = tuple.__new__
+
+
+def _min_max(value, low: float = 0.0, high: float = 1.0):
+    # Conditional expressions have the same semantics as min(max(low, x), high), but avoid two builtin calls per bound.
+    # Pairs of bounds are returned as an immutable Interval.
+    if value.__class__ is tuple or value.__class__ is list:
+        lower, upper = value
+        assert lower <= upper
+        lower = lower if lower > low else low
+        upper = upper if upper > low else low
+        return _new_interval(
+            Interval, (high if high < lower else lower, high if high < upper else upper)
+        )
     else:
-        value = max(low, value)
-        value = min(value, high)
+        value = value if value > low else low
+        value = high if high < value else value
 
     return value
 
 
+# Set inside the trusted() context manager, which skips parameter validation.
+_TRUSTED = contextvars.ContextVar("confidence_planner_trusted", default=False)
+
+
+@contextlib.contextmanager
+def trusted():
+    """
+    Context manager that skips parameter validation in the functions of the package, for inputs that have already
+    been validated once (for example with a single vectorized check of a whole table of requests). Results are still
+    capped to the <0, 1> range, but invalid parameters give undefined results instead of exceptions. The mode only
+    applies to the current thread or asyncio task.
+    """
+    token = _TRUSTED.set(True)
+    try:
+        yield
+    finally:
+        _TRUSTED.reset(token)
+
+
+def unchecked(function):
+    """
+    Returns the unchecked kernel of a scalar interval function: wilson_ci, clopper_pearson_ci, langford_ci,
+    z_test_ci, t_test_ci, or cross_validation_ci. The kernel takes the same parameters and returns the same capped
+    Interval, but calls no validation or wrapper code, which otherwise dominates the runtime of the closed-form
+    methods. It is meant for parameters that have already been validated, e.g. with one vectorized check of a whole
+    table; invalid parameters give undefined results.
+
+    Parameters
+    ----------
+    function : function or str
+        Public interval function or its name.
+    """
+    name = getattr(function, "__name__", function)
+    if name not in _UNCHECKED_KERNELS:
+        raise Exception(
+            f'No unchecked kernel for "{name}". Should be one of: {", ".join(_UNCHECKED_KERNELS)}.'
+        )
+    return _UNCHECKED_KERNELS[name]
+
+
+def is_trusted() -> bool:
+    """
+    Returns True when parameter validation is skipped, i.e., inside the trusted() context manager.
+    """
+    return _TRUSTED.get()
+
+
+class BatchValidationError(Exception):
+    """
+    Raised by vectorized functions when some elements of their array parameters are invalid. The indices attribute
+    contains the flat indices of all offending elements in the (broadcast) parameter array and shape its shape, so
+    that invalid rows can be reported or dropped without checking them one by one.
+    """
+
+    def __init__(self, reason: str, indices: np.ndarray, shape: tuple):
+        self.reason = reason
+        self.indices = indices
+        self.shape = shape
+        shown = indices[:10].tolist()
+        if len(shape) > 1:
+            shown = list(
+                zip(*(axis.tolist() for axis in np.unravel_index(shown, shape)))
+            )
+        more = ", ..." if indices.size > 10 else ""
+        super().__init__(
+            f"{reason} Some were found outside of this range, at indices: {str(shown)[:-1]}{more}]"
+        )
+
+
+def _check_batch(invalid, reason: str):
+    invalid = np.asarray(invalid)
+    if invalid.any():
+        raise BatchValidationError(reason, np.flatnonzero(invalid), invalid.shape)
+
+
 def _check_n_acc_conf(n: int, acc: float, conf: float, n_splits: int = 1):
-    if n <= 0:
+    if _TRUSTED.get():
+        return
+    if not n > 0:
         raise Exception(
             f'Number of samples must be an integer greater than 0, not "{n}"'
         )
 
-    if acc < 0.0 or acc > 1.0:
+    if not 0.0 <= acc <= 1.0:
         raise Exception(f"Accuracy should by between <0, 1>, not {acc}")
 
-    if conf <= 0.0 or conf >= 1.0:
+    if not 0.0 < conf < 1.0:
         raise Exception(f"Confidence level should be between (0, 1), not {conf}")
 
-    if n_splits <= 0:
+    if not n_splits > 0:
         raise Exception(
             f'Number of folds must be an integer greater tha 0, not "{n_splits}"'
         )
 
 
+def _check_n_acc_conf_batch(n, acc, conf, n_splits=1):
+    if _TRUSTED.get():
+        return
+    _check_batch(
+        np.logical_not(n > 0),
+        "Each number of samples must be an integer greater than 0.",
+    )
+
+    _check_batch(
+        np.logical_not((acc >= 0.0) & (acc <= 1.0)),
+        "Each accuracy should by between <0, 1>.",
+    )
+
+    _check_batch(
+        np.logical_not((conf > 0.0) & (conf < 1.0)),
+        "Each confidence level should be between (0, 1).",
+    )
+
+    _check_batch(
+        np.logical_not(n_splits > 0),
+        "Each number of folds must be an integer greater than 0.",
+    )
+
+
+def _broadcast_n_acc_conf(sample_size, accuracy, confidence_level, n_splits=1):
+    n, acc, conf, n_splits = np.broadcast_arrays(
+        np.asarray(sample_size, dtype=float),
+        np.asarray(accuracy, dtype=float),
+        np.asarray(confidence_level, dtype=float),
+        np.asarray(n_splits, dtype=float),
+    )
+    _check_n_acc_conf_batch(n, acc, conf, n_splits)
+
+    for view in (n, acc, conf, n_splits):
+        view.flags.writeable = False
+
+    return n, acc, conf, n_splits
+
+
+def _check_counts_conf_batch(successes, trials, conf):
+    if _TRUSTED.get():
+        return
+    _check_batch(
+        np.logical_not(trials > 0),
+        "Each number of trials must be an integer greater than 0.",
+    )
+
+    _check_batch(
+        np.logical_not((successes >= 0) & (successes <= trials)),
+        "Each number of successes should be between 0 and the number of trials.",
+    )
+
+    _check_batch(
+        np.logical_not((conf > 0.0) & (conf < 1.0)),
+        "Each confidence level should be between (0, 1).",
+    )
+
+
+def _broadcast_counts_conf(successes, trials, confidence_level):
+    successes, trials, conf = np.broadcast_arrays(
+        np.asarray(successes),
+        np.asarray(trials),
+        np.asarray(confidence_level, dtype=float),
+    )
+    _check_counts_conf_batch(successes, trials, conf)
+
+    return successes, trials, conf
+
+
+def _clip(values, lower: float = 0.0, upper: float = 1.0):
+    # Kernel results are freshly allocated arrays, so they are clipped in place. Numpy scalars, returned for 0-d
+    # inputs, cannot be written to.
+    if isinstance(values, np.ndarray) and values.flags.writeable:
+        return np.clip(values, lower, upper, out=values)
+    return np.clip(values, lower, upper)
+
+
+def _clip_batch(low, high, lower: float = 0.0, upper: float = 1.0) -> tuple:
+    return _clip(low, lower, upper), _clip(high, lower, upper)
+
+
 def _check_accuracies_conf_radius(accuracies, confidence_level, interval_radius=0.5):
-    if np.any(accuracies < 0) or np.any(accuracies > 1):
+    if _TRUSTED.get():
+        return
+    if not np.all((accuracies >= 0) & (accuracies <= 1)):
         raise Exception(
             f"Each accuracy should by between <0, 1>. Some were found outside of this range."
         )
-    if confidence_level <= 0 or confidence_level >= 1:
+    if not 0 < confidence_level < 1:
         raise Exception(
             f'Confidence level should be between 0 and 1, not "{confidence_level}".'
         )
-    if interval_radius < 0 or interval_radius > 0.5:
+    if not 0 <= interval_radius <= 0.5:
         raise Exception(
             f'Interval radius should be between 0 and 0.5, not "{interval_radius}"'
         )
@@ -55,36 +282,114 @@ def _check_accuracies_conf_radius(accuracies, confidence_level, interval_radius=
 def _check_radius_conf(
     confidence_level: float, interval_radius: float, n_splits: int = 1
 ):
-    if interval_radius < 0 or interval_radius > 0.5:
+    if _TRUSTED.get():
+        return
+    if not 0 <= interval_radius <= 0.5:
         raise Exception(
             f'Difference should by between <0, 0.5>, not "{interval_radius}"'
         )
-    if confidence_level <= 0 or confidence_level >= 1:
+    if not 0 < confidence_level < 1:
         raise Exception(
             f'Confidence level should be between (0, 1), not "{confidence_level}"'
         )
-    if n_splits <= 0:
+    if not n_splits > 0:
         raise Exception(
             f'Number of folds must be an integer greater tha 0, not "{n_splits}"'
         )
 
 
 def _check_n_radius(sample_size: float, interval_radius: float, n_splits: int = 1):
-    if interval_radius < 0 or interval_radius > 0.5:
+    if _TRUSTED.get():
+        return
+    if not 0 <= interval_radius <= 0.5:
         raise Exception(
             f'Interval radius should be between 0 and 0.5, not "{interval_radius}"'
         )
-    if sample_size <= 0:
+    if not sample_size > 0:
         raise Exception(
             f'Sample size must be an integer greater tha 0, not "{n_splits}"'
         )
 
-    if n_splits <= 0:
+    if not n_splits > 0:
         raise Exception(
             f'Number of folds must be an integer greater tha 0, not "{n_splits}"'
         )
 
 
+# Maximum number of (distribution, confidence level, degrees of freedom) critical values kept in memory.
+CRITICAL_VALUE_CACHE_SIZE = 1024
+# Degrees of freedom from which the t-distribution quantile is replaced by the normal quantile. At this point the two
+# differ by less than 1e-5 for confidence levels up to 0.999.
+T_TO_NORMAL_DF = 10**6
+
+
+@functools.lru_cache(maxsize=CRITICAL_VALUE_CACHE_SIZE)
+def _cached_critical_value(distribution: str, confidence_level: float, df: float):
+    import scipy.stats as st
+
+    if distribution == "norm":
+        return st.norm.ppf(1 - (1 - confidence_level) / 2)
+    else:
+        return st.t.ppf(1 - (1 - confidence_level) / 2, df)
+
+
+def critical_value(confidence_level: float, df: float = None) -> float:
+    """
+    Returns the two-sided critical value (the 1 - (1 - confidence_level) / 2 quantile) of the normal distribution or,
+    when df is given, of the t-distribution. Values are memoized in a bounded LRU cache keyed by distribution,
+    confidence level, and degrees of freedom. For df >= T_TO_NORMAL_DF the normal quantile is returned.
+
+    Parameters
+    ----------
+    confidence_level : float
+        Confidence level. Should be between 0 and 1.
+    df : float
+        Optional. Degrees of freedom of the t-distribution. When None, the normal distribution is used.
+    """
+    if df is None or df >= T_TO_NORMAL_DF:
+        return _cached_critical_value("norm", float(confidence_level), None)
+    else:
+        return _cached_critical_value("t", float(confidence_level), float(df))
+
+
+def _critical_value_batch(confidence_level, df=None):
+    conf, df = np.broadcast_arrays(
+        np.asarray(confidence_level, dtype=float),
+        np.asarray(np.inf if df is None else df, dtype=float),
+    )
+    if conf.size == 0:
+        return np.empty(conf.shape)
+    normal = df >= T_TO_NORMAL_DF
+
+    # A single confidence level (the common case) with a single distribution takes one cached lookup.
+    first_conf, first_df = conf.flat[0], df.flat[0]
+    if (conf == first_conf).all() and (normal.all() or (df == first_df).all()):
+        value = critical_value(first_conf, None if normal.flat[0] else first_df)
+        return np.full(conf.shape, value)
+
+    # Otherwise the quantiles are computed in one vectorized call, with the same expressions as critical_value.
+    import scipy.stats as st
+
+    q = 1 - (1 - conf) / 2
+    if normal.all():
+        return st.norm.ppf(q)
+    return np.where(normal, st.norm.ppf(q), st.t.ppf(q, np.where(normal, 1.0, df)))
+
+
+def critical_value_cache_info():
+    """
+    Returns hit, miss, and size statistics of the critical value cache used by critical_value.
+    """
+    return _cached_critical_value.cache_info()
+
+
+def clear_critical_value_cache():
+    """
+    Removes all memoized critical values and resets the cache statistics.
+    """
+    _cached_critical_value.cache_clear()
+
+
 def cap(low, high):
     def wrapper(f):
         @functools.wraps(f)
@@ -97,8 +402,32 @@ def cap(low, high):
     return wrapper
 
 
-@cap(low=0.0, high=1.0)
-def wilson_ci(sample_size: int, accuracy: float, confidence_level: float) -> list:
+def _symmetric_interval(accuracy, radius):
+    # Capped accuracy +/- radius. For a valid accuracy the lower bound cannot exceed 1 nor the upper bound fall below
+    # 0, so each bound is only clipped on one side, with the same result as _min_max.
+    low, high = accuracy - radius, accuracy + radius
+    return _new_interval(
+        Interval, (low if low > 0.0 else 0.0, high if high < 1.0 else 1.0)
+    )
+
+
+def _wilson_bounds(count, nobs, z):
+    q = count / nobs
+    z2 = z**2
+    denom = 1 + z2 / nobs
+    center = (q + z2 / (2 * nobs)) / denom
+    dist = z * np.sqrt(q * (1.0 - q) / nobs + z2 / (4.0 * nobs**2)) / denom
+    return center - dist, center + dist
+
+
+def _wilson_ci(sample_size, accuracy, confidence_level):
+    low, high = _wilson_bounds(
+        accuracy * sample_size, sample_size, critical_value(confidence_level)
+    )
+    return _min_max((low, high))
+
+
+def wilson_ci(sample_size: int, accuracy: float, confidence_level: float) -> Interval:
     """
     Returns a confidence interval according to the Wilson approximation, based on the number of holdout
     test samples, obtained accuracy, and desired confidence level.
@@ -113,18 +442,80 @@ def wilson_ci(sample_size: int, accuracy: float, confidence_level: float) -> lis
         Desired confidence level. Should be between 0 and 1.
     """
     _check_n_acc_conf(sample_size, accuracy, confidence_level)
+    return _wilson_ci(sample_size, accuracy, confidence_level)
+
+
+def wilson_ci_batch(sample_size, accuracy, confidence_level) -> tuple:
+    """
+    Vectorized version of wilson_ci. The sample_size, accuracy and confidence_level parameters are broadcast against
+    each other and a tuple of two arrays (lower and upper interval bounds) is returned. Each element is equal to the
+    result of calling wilson_ci with the corresponding scalars.
+
+    Parameters
+    ----------
+    sample_size : int or array-like
+        Numbers of samples used in test sets.
+    accuracy : float or array-like
+        Accuracies obtained on the test sets. Should be between 0 and 1.
+    confidence_level : float or array-like
+        Desired confidence levels. Should be between 0 and 1.
+    """
+    n, acc, conf, _ = _broadcast_n_acc_conf(sample_size, accuracy, confidence_level)
 
-    low, high = proportion_confint(
-        accuracy * sample_size, sample_size, alpha=1 - confidence_level, method="wilson"
+    low, high = _wilson_bounds(acc * n, n, _critical_value_batch(conf))
+    return _clip_batch(low, high)
+
+
+def wilson_ci_from_counts(successes, trials, confidence_level) -> tuple:
+    """
+    Returns Wilson score confidence intervals computed directly from the numbers of correct predictions and test
+    samples. All parameters can be array-like and are broadcast against each other. Returns a tuple of two arrays
+    (lower and upper interval bounds).
+
+    Parameters
+    ----------
+    successes : int or array-like
+        Numbers of correctly classified test samples. Should be between 0 and trials.
+    trials : int or array-like
+        Numbers of samples used in test sets. Must be greater than 0.
+    confidence_level : float or array-like
+        Desired confidence levels. Should be between 0 and 1.
+    """
+    k, n, conf = _broadcast_counts_conf(successes, trials, confidence_level)
+
+    low, high = _wilson_bounds(
+        k.astype(float), n.astype(float), _critical_value_batch(conf)
     )
-    int_conf = [low, high]
-    return int_conf
+    return _clip_batch(low, high)
+
+
+def _clopper_pearson_bounds(count, nobs, confidence_level):
+    from scipy.special import betaincinv
+
+    count, nobs = np.asarray(count, dtype=float), np.asarray(nobs, dtype=float)
+    alpha_2 = (1 - np.asarray(confidence_level, dtype=float)) / 2
+    no_successes = count <= 0
+    no_failures = count >= nobs
+
+    # The upper bound uses the symmetry of the beta distribution, which keeps it accurate for small alpha. Edge cases
+    # get placeholder shape parameters so that the special function is only evaluated where it is defined.
+    low = betaincinv(np.where(no_successes, 1.0, count), nobs - count + 1, alpha_2)
+    high = 1 - betaincinv(np.where(no_failures, 1.0, nobs - count), count + 1, alpha_2)
+    low = np.where(no_successes, 0.0, low)
+    high = np.where(no_failures, 1.0, high)
+    return low[()], high[()]
+
+
+def _clopper_pearson_ci(sample_size, accuracy, confidence_level):
+    low, high = _clopper_pearson_bounds(
+        accuracy * sample_size, sample_size, confidence_level
+    )
+    return _min_max((low, high))
 
 
-@cap(low=0.0, high=1.0)
 def clopper_pearson_ci(
     sample_size: int, accuracy: float, confidence_level: float
-) -> list:
+) -> Interval:
     """
     Returns a confidence interval according to the Clopper-Pearson approximation, based on the number of holdout
     test samples, obtained accuracy, and desired confidence level.
@@ -139,16 +530,58 @@ def clopper_pearson_ci(
         Desired confidence level. Should be between 0 and 1.
     """
     _check_n_acc_conf(sample_size, accuracy, confidence_level)
+    return _clopper_pearson_ci(sample_size, accuracy, confidence_level)
 
-    low, high = proportion_confint(
-        accuracy * sample_size, sample_size, alpha=1 - confidence_level, method="beta"
-    )
-    int_conf = [low, high]
-    return int_conf
 
+def clopper_pearson_ci_batch(sample_size, accuracy, confidence_level) -> tuple:
+    """
+    Vectorized version of clopper_pearson_ci. The sample_size, accuracy and confidence_level parameters are broadcast against
+    each other and a tuple of two arrays (lower and upper interval bounds) is returned. Each element is equal to the
+    result of calling clopper_pearson_ci with the corresponding scalars.
 
-@cap(low=0.0, high=1.0)
-def langford_ci(sample_size: int, accuracy: float, confidence_level: float) -> list:
+    Parameters
+    ----------
+    sample_size : int or array-like
+        Numbers of samples used in test sets.
+    accuracy : float or array-like
+        Accuracies obtained on the test sets. Should be between 0 and 1.
+    confidence_level : float or array-like
+        Desired confidence levels. Should be between 0 and 1.
+    """
+    n, acc, conf, _ = _broadcast_n_acc_conf(sample_size, accuracy, confidence_level)
+
+    low, high = _clopper_pearson_bounds(acc * n, n, conf)
+    return _clip_batch(low, high)
+
+
+def clopper_pearson_ci_from_counts(successes, trials, confidence_level) -> tuple:
+    """
+    Returns exact Clopper-Pearson confidence intervals computed directly from the numbers of correct predictions and
+    test samples, using the inverse of the regularized incomplete beta function. All parameters can be array-like and
+    are broadcast against each other. Returns a tuple of two arrays (lower and upper interval bounds). The lower bound
+    is exactly 0 when there are no successes and the upper bound is exactly 1 when all trials are successes.
+
+    Parameters
+    ----------
+    successes : int or array-like
+        Numbers of correctly classified test samples. Should be between 0 and trials.
+    trials : int or array-like
+        Numbers of samples used in test sets. Must be greater than 0.
+    confidence_level : float or array-like
+        Desired confidence levels. Should be between 0 and 1.
+    """
+    k, n, conf = _broadcast_counts_conf(successes, trials, confidence_level)
+
+    low, high = _clopper_pearson_bounds(k, n, conf)
+    return _clip_batch(low, high)
+
+
+def _langford_ci(sample_size, accuracy, confidence_level):
+    pr = math.sqrt(math.log(2 / (1 - confidence_level)) / (sample_size * 2))
+    return _symmetric_interval(accuracy, pr)
+
+
+def langford_ci(sample_size: int, accuracy: float, confidence_level: float) -> Interval:
     """
     Returns a confidence interval according to Langford's approximation, based on the number of holdout
     test samples, obtained accuracy, and desired confidence level.
@@ -163,17 +596,36 @@ def langford_ci(sample_size: int, accuracy: float, confidence_level: float) -> l
         Desired confidence level. Should be between 0 and 1.
     """
     _check_n_acc_conf(sample_size, accuracy, confidence_level)
+    return _langford_ci(sample_size, accuracy, confidence_level)
 
-    pr = math.sqrt(math.log(2 / (1 - confidence_level)) / (sample_size * 2))
-    upper_bound = accuracy + pr
-    lower_bound = accuracy - pr
-    int_conf = [lower_bound, upper_bound]
 
-    return int_conf
+def langford_ci_batch(sample_size, accuracy, confidence_level) -> tuple:
+    """
+    Vectorized version of langford_ci. The sample_size, accuracy and confidence_level parameters are broadcast against
+    each other and a tuple of two arrays (lower and upper interval bounds) is returned. Each element is equal to the
+    result of calling langford_ci with the corresponding scalars.
 
+    Parameters
+    ----------
+    sample_size : int or array-like
+        Numbers of samples used in test sets.
+    accuracy : float or array-like
+        Accuracies obtained on the test sets. Should be between 0 and 1.
+    confidence_level : float or array-like
+        Desired confidence levels. Should be between 0 and 1.
+    """
+    n, acc, conf, _ = _broadcast_n_acc_conf(sample_size, accuracy, confidence_level)
 
-@cap(low=0.0, high=1.0)
-def z_test_ci(sample_size: int, accuracy: float, confidence_level: float) -> list:
+    pr = np.sqrt(np.log(2 / (1 - conf)) / (n * 2))
+    return _clip_batch(acc - pr, acc + pr)
+
+
+def _z_test_ci(sample_size, accuracy, confidence_level):
+    pr = critical_value(confidence_level) * math.sqrt(0.25 / sample_size)
+    return _symmetric_interval(accuracy, pr)
+
+
+def z_test_ci(sample_size: int, accuracy: float, confidence_level: float) -> Interval:
     """
     Returns a confidence interval the Z-test (normal distribution) approximation, based on the number of holdout
     test samples, obtained accuracy, and desired confidence level.
@@ -188,18 +640,38 @@ def z_test_ci(sample_size: int, accuracy: float, confidence_level: float) -> lis
         Desired confidence level. Should be between 0 and 1.
     """
     _check_n_acc_conf(sample_size, accuracy, confidence_level)
+    return _z_test_ci(sample_size, accuracy, confidence_level)
 
-    z = st.norm.ppf(1 - (1 - confidence_level) / 2)
-    pr = z * math.sqrt(0.25 / sample_size)
-    upper_bound = accuracy + pr
-    lower_bound = accuracy - pr
-    int_conf = [lower_bound, upper_bound]
 
-    return int_conf
+def z_test_ci_batch(sample_size, accuracy, confidence_level) -> tuple:
+    """
+    Vectorized version of z_test_ci. The sample_size, accuracy and confidence_level parameters are broadcast against
+    each other and a tuple of two arrays (lower and upper interval bounds) is returned. Each element is equal to the
+    result of calling z_test_ci with the corresponding scalars.
 
+    Parameters
+    ----------
+    sample_size : int or array-like
+        Numbers of samples used in test sets.
+    accuracy : float or array-like
+        Accuracies obtained on the test sets. Should be between 0 and 1.
+    confidence_level : float or array-like
+        Desired confidence levels. Should be between 0 and 1.
+    """
+    n, acc, conf, _ = _broadcast_n_acc_conf(sample_size, accuracy, confidence_level)
 
-@cap(low=0.0, high=1.0)
-def t_test_ci(sample_size: int, accuracy: float, confidence_level: float) -> list:
+    z = _critical_value_batch(conf)
+    pr = z * np.sqrt(0.25 / n)
+    return _clip_batch(acc - pr, acc + pr)
+
+
+def _t_test_ci(sample_size, accuracy, confidence_level):
+    t = critical_value(confidence_level, sample_size - 1)
+    pr = t * math.sqrt(0.25 / sample_size)
+    return _symmetric_interval(accuracy, pr)
+
+
+def t_test_ci(sample_size: int, accuracy: float, confidence_level: float) -> Interval:
     """
     Returns a confidence interval the t-test approximation, based on the number of holdout
     test samples, obtained accuracy, and desired confidence level.
@@ -214,20 +686,39 @@ def t_test_ci(sample_size: int, accuracy: float, confidence_level: float) -> lis
         Desired confidence level. Should be between 0 and 1.
     """
     _check_n_acc_conf(sample_size, accuracy, confidence_level)
+    return _t_test_ci(sample_size, accuracy, confidence_level)
 
-    t = st.t.ppf(1 - (1 - confidence_level) / 2, sample_size - 1)
-    pr = t * math.sqrt(0.25 / sample_size)
-    upper_bound = accuracy + pr
-    lower_bound = accuracy - pr
-    int_conf = [lower_bound, upper_bound]
 
-    return int_conf
+def t_test_ci_batch(sample_size, accuracy, confidence_level) -> tuple:
+    """
+    Vectorized version of t_test_ci. The sample_size, accuracy and confidence_level parameters are broadcast against
+    each other and a tuple of two arrays (lower and upper interval bounds) is returned. Each element is equal to the
+    result of calling t_test_ci with the corresponding scalars.
+
+    Parameters
+    ----------
+    sample_size : int or array-like
+        Numbers of samples used in test sets.
+    accuracy : float or array-like
+        Accuracies obtained on the test sets. Should be between 0 and 1.
+    confidence_level : float or array-like
+        Desired confidence levels. Should be between 0 and 1.
+    """
+    n, acc, conf, _ = _broadcast_n_acc_conf(sample_size, accuracy, confidence_level)
+
+    t = _critical_value_batch(conf, n - 1)
+    pr = t * np.sqrt(0.25 / n)
+    return _clip_batch(acc - pr, acc + pr)
+
+
+def _cross_validation_ci(sample_size, n_splits, accuracy, confidence_level):
+    t = math.sqrt(-math.log((1 - confidence_level) / 2) * n_splits / 2 / sample_size)
+    return _symmetric_interval(accuracy, t)
 
 
-@cap(low=0.0, high=1.0)
 def cross_validation_ci(
     sample_size: int, n_splits: int, accuracy: float, confidence_level: float
-) -> list:
+) -> Interval:
     """
     Returns confidence interval for the given confidence level for mean CV results, based on
     the number of samples in the CV, number of splits, obtained accuracy, and desired confidence level.
@@ -245,18 +736,50 @@ def cross_validation_ci(
         Desire confidence level. Should be between 0 and 1.
     """
     _check_n_acc_conf(sample_size, accuracy, confidence_level, n_splits=n_splits)
+    return _cross_validation_ci(sample_size, n_splits, accuracy, confidence_level)
 
-    x = math.log((1 - confidence_level) / 2) * n_splits / 2 / sample_size
-    t = math.sqrt(-x)
-    lower_bound = accuracy - t
-    upper_bound = accuracy + t
-    int_conf = [lower_bound, upper_bound]
 
-    return int_conf
+# Unchecked kernels of the scalar interval functions, returned by unchecked().
+_UNCHECKED_KERNELS = {
+    "wilson_ci": _wilson_ci,
+    "clopper_pearson_ci": _clopper_pearson_ci,
+    "langford_ci": _langford_ci,
+    "z_test_ci": _z_test_ci,
+    "t_test_ci": _t_test_ci,
+    "cross_validation_ci": _cross_validation_ci,
+}
+
+
+def cross_validation_ci_batch(
+    sample_size, n_splits, accuracy, confidence_level
+) -> tuple:
+    """
+    Vectorized version of cross_validation_ci. The sample_size, n_splits, accuracy and confidence_level parameters are broadcast against
+    each other and a tuple of two arrays (lower and upper interval bounds) is returned. Each element is equal to the
+    result of calling cross_validation_ci with the corresponding scalars.
+
+    Parameters
+    ----------
+    sample_size : int or array-like
+        Numbers of all samples used from the datasets, greater than 0.
+    n_splits : int or array-like
+        Numbers of folds used in cross validation, greater than 0.
+    accuracy : float or array-like
+        Obtained accuracies - means of all accuracies from each fold. Should be between 0 and 1.
+    confidence_level : float or array-like
+        Desired confidence levels. Should be between 0 and 1.
+    """
+    n, acc, conf, k = _broadcast_n_acc_conf(
+        sample_size, accuracy, confidence_level, n_splits=n_splits
+    )
+
+    x = np.log((1 - conf) / 2) * k / 2 / n
+    t = np.sqrt(-x)
+    return _clip_batch(acc - t, acc + t)
 
 
 @cap(low=0.0, high=1.0)
-def percentiles_ci(accuracies: list, confidence_level: float) -> list:
+def percentiles_ci(accuracies: list, confidence_level: float) -> Interval:
     """
     Returns confidence interval for the given confidence level for a set of bootstrap results, according to percentile
     measurement.
@@ -276,7 +799,7 @@ def percentiles_ci(accuracies: list, confidence_level: float) -> list:
     upper_bound = np.percentile(
         accuracies, 100 * (confidence_level + (1 - confidence_level) / 2)
     )
-    int_conf = [lower_bound, upper_bound]
+    int_conf = (lower_bound, upper_bound)
     return int_conf
 
 
@@ -312,7 +835,7 @@ def z_test_sample_size(interval_radius: float, confidence_level: float) -> int:
     """
     _check_radius_conf(confidence_level, interval_radius)
 
-    z = st.norm.ppf(1 - (1 - confidence_level) / 2)
+    z = critical_value(confidence_level)
     n = (z * math.sqrt(0.25) / interval_radius) ** 2
     return math.ceil(n)
 
@@ -340,6 +863,307 @@ def cross_validation_sample_size(
     return math.ceil(n)
 
 
+def _check_radius_conf_acc_batch(radius, conf, acc):
+    if _TRUSTED.get():
+        return
+    _check_batch(
+        np.logical_not((radius > 0) & (radius <= 0.5)),
+        "Each interval radius should be between (0, 0.5>.",
+    )
+
+    _check_batch(
+        np.logical_not((conf > 0.0) & (conf < 1.0)),
+        "Each confidence level should be between (0, 1).",
+    )
+
+    _check_batch(
+        np.logical_not((acc >= 0.0) & (acc <= 1.0)),
+        "Each accuracy should by between <0, 1>.",
+    )
+
+
+def _wilson_half_width(n, z, acc):
+    low, high = _wilson_bounds(acc * n, n, z)
+    return (high - low) / 2
+
+
+def _clopper_pearson_half_width(n, conf, acc):
+    low, high = _clopper_pearson_bounds(acc * n, n, conf)
+    return (high - low) / 2
+
+
+# Maximum number of galloping and bisection steps of the sample size search. Each galloping step doubles the step size,
+# so any sample size representable as an int64 is bracketed well before the limit.
+_MAX_SEARCH_STEPS = 128
+
+
+def _min_sample_size(half_width, radius, param, acc, start):
+    # Finds the smallest n with half_width(n) <= radius, assuming half_width is non-increasing in n. A galloping
+    # search from the starting estimate brackets the solution with exponentially growing steps, then the bracket is
+    # bisected. All elements are searched simultaneously; each step is one vectorized kernel evaluation.
+    def fits(n, mask):
+        result = np.zeros(n.shape, dtype=bool)
+        mask = mask & (n > 0)
+        result[mask] = half_width(n[mask], param[mask], acc[mask]) <= radius[mask]
+        return result
+
+    # Elements without a finite starting point (e.g. a zero radius in trusted mode) cannot be searched.
+    _check_batch(
+        ~np.isfinite(start), "Each sample size search needs a finite starting point."
+    )
+    start = np.maximum(np.ceil(start), 1.0)
+    start_fits = fits(start, np.ones(start.shape, dtype=bool))
+    low = np.where(start_fits, np.nan, start)
+    high = np.where(start_fits, start, np.nan)
+
+    step = 1.0
+    for _ in range(_MAX_SEARCH_STEPS):
+        search_up, search_down = np.isnan(high), np.isnan(low)
+        if not (search_up.any() or search_down.any()):
+            break
+        probe = np.where(search_up, low + step, np.maximum(high - step, 0.0))
+        probe_fits = fits(probe, search_up | search_down)
+        high = np.where((search_up | search_down) & probe_fits, probe, high)
+        low = np.where((search_up | search_down) & ~probe_fits, probe, low)
+        step *= 2
+
+    else:
+        _check_batch(
+            np.isnan(high),
+            "Each sample size search should end at a finite sample size.",
+        )
+
+    for _ in range(_MAX_SEARCH_STEPS):
+        active = high - low > 1
+        if not active.any():
+            break
+        mid = np.floor((low + high) / 2)
+        mid_fits = fits(mid, active)
+        high = np.where(active & mid_fits, mid, high)
+        low = np.where(active & ~mid_fits, mid, low)
+
+    return high.astype(np.int64)
+
+
+def _wilson_sample_size_estimate(radius, z, acc):
+    # Closed-form solution of wilson half-width = radius for a continuous n, used as the search starting point.
+    pq = acc * (1 - acc)
+    r2 = radius**2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return z**2 * ((pq - 2 * r2) + np.sqrt(pq**2 - 4 * r2 * pq + r2)) / (2 * r2)
+
+
+def wilson_sample_size_batch(interval_radius, confidence_level, accuracy=0.5):
+    """
+    Vectorized version of wilson_sample_size. The interval_radius, confidence_level and accuracy parameters are
+    broadcast against each other and an integer array of minimum sample sizes is returned.
+
+    Parameters
+    ----------
+    interval_radius : float or array-like
+        Half widths of the expected confidence intervals. Should be between 0 (exclusive) and 0.5.
+    confidence_level : float or array-like
+        Confidence levels. Should be between 0 and 1.
+    accuracy : float or array-like
+        Assumed accuracies. Should be between 0 and 1. Default: 0.5, which gives the widest intervals.
+    """
+    radius, conf, acc = np.broadcast_arrays(
+        np.asarray(interval_radius, dtype=float),
+        np.asarray(confidence_level, dtype=float),
+        np.asarray(accuracy, dtype=float),
+    )
+    _check_radius_conf_acc_batch(radius, conf, acc)
+
+    z = _critical_value_batch(conf)
+    start = _wilson_sample_size_estimate(radius, z, acc)
+    return _min_sample_size(_wilson_half_width, radius, z, acc, start)
+
+
+def wilson_sample_size(
+    interval_radius: float, confidence_level: float, accuracy: float = 0.5
+) -> int:
+    """
+    Estimates the smallest number of holdout examples for which the Wilson confidence interval, at a given confidence
+    level and assumed accuracy, has a radius (half width) of at most interval_radius.
+
+    Parameters
+    ----------
+    interval_radius : float
+        Half of the expected confidence interval width. Should be between 0 (exclusive) and 0.5.
+    confidence_level : float
+        Confidence level. Should be between 0 and 1.
+    accuracy : float
+        Assumed accuracy. Should be between 0 and 1. Default: 0.5, which gives the widest intervals.
+    """
+    return int(wilson_sample_size_batch(interval_radius, confidence_level, accuracy))
+
+
+def clopper_pearson_sample_size_batch(interval_radius, confidence_level, accuracy=0.5):
+    """
+    Vectorized version of clopper_pearson_sample_size. The interval_radius, confidence_level and accuracy parameters
+    are broadcast against each other and an integer array of minimum sample sizes is returned.
+
+    Parameters
+    ----------
+    interval_radius : float or array-like
+        Half widths of the expected confidence intervals. Should be between 0 (exclusive) and 0.5.
+    confidence_level : float or array-like
+        Confidence levels. Should be between 0 and 1.
+    accuracy : float or array-like
+        Assumed accuracies. Should be between 0 and 1. Default: 0.5, which gives the widest intervals.
+    """
+    radius, conf, acc = np.broadcast_arrays(
+        np.asarray(interval_radius, dtype=float),
+        np.asarray(confidence_level, dtype=float),
+        np.asarray(accuracy, dtype=float),
+    )
+    _check_radius_conf_acc_batch(radius, conf, acc)
+
+    # Clopper-Pearson intervals are slightly wider than Wilson intervals, so the Wilson solution is a close start.
+    start = _wilson_sample_size_estimate(radius, _critical_value_batch(conf), acc)
+    return _min_sample_size(_clopper_pearson_half_width, radius, conf, acc, start)
+
+
+def clopper_pearson_sample_size(
+    interval_radius: float, confidence_level: float, accuracy: float = 0.5
+) -> int:
+    """
+    Estimates the smallest number of holdout examples for which the Clopper-Pearson confidence interval, at a given
+    confidence level and assumed accuracy, has a radius (half width) of at most interval_radius.
+
+    Parameters
+    ----------
+    interval_radius : float
+        Half of the expected confidence interval width. Should be between 0 (exclusive) and 0.5.
+    confidence_level : float
+        Confidence level. Should be between 0 and 1.
+    accuracy : float
+        Assumed accuracy. Should be between 0 and 1. Default: 0.5, which gives the widest intervals.
+    """
+    return int(
+        clopper_pearson_sample_size_batch(interval_radius, confidence_level, accuracy)
+    )
+
+
+def _t_test_half_width(n, conf, acc):
+    from scipy.special import stdtrit
+
+    with np.errstate(invalid="ignore"):
+        return stdtrit(n - 1, 1 - (1 - conf) / 2) * np.sqrt(0.25 / n)
+
+
+def t_test_sample_size_batch(interval_radius, confidence_level):
+    """
+    Vectorized version of t_test_sample_size. The interval_radius and confidence_level parameters are broadcast
+    against each other and an integer array of minimum sample sizes is returned.
+
+    Parameters
+    ----------
+    interval_radius : float or array-like
+        Half widths of the expected confidence intervals. Should be between 0 (exclusive) and 0.5.
+    confidence_level : float or array-like
+        Confidence levels. Should be between 0 and 1.
+    """
+    radius, conf, _ = _broadcast_radius_conf(interval_radius, confidence_level)
+
+    # t quantiles are larger than normal quantiles, so the z-test sample size is a lower starting point.
+    start = (_critical_value_batch(conf) * 0.5 / radius) ** 2
+    return _min_sample_size(
+        _t_test_half_width, radius, conf, np.full(radius.shape, 0.5), start
+    )
+
+
+def t_test_sample_size(interval_radius: float, confidence_level: float) -> int:
+    """
+    Estimates the smallest number of holdout examples for which the t-test confidence interval at a given confidence
+    level has a radius (half width) of at most interval_radius. Since the degrees of freedom depend on the sample
+    size, the sample size is found numerically.
+
+    Parameters
+    ----------
+    interval_radius : float
+        Half of the expected confidence interval width. Should be between 0 (exclusive) and 0.5.
+    confidence_level : float
+        Confidence level. Should be between 0 and 1.
+    """
+    return int(t_test_sample_size_batch(interval_radius, confidence_level))
+
+
+def _broadcast_radius_conf(interval_radius, confidence_level, n_splits=1):
+    radius, conf, n_splits = np.broadcast_arrays(
+        np.asarray(interval_radius, dtype=float),
+        np.asarray(confidence_level, dtype=float),
+        np.asarray(n_splits, dtype=float),
+    )
+    _check_radius_conf_acc_batch(radius, conf, 0.5)
+    if not _TRUSTED.get():
+        _check_batch(
+            np.logical_not(n_splits > 0),
+            "Each number of folds must be an integer greater than 0.",
+        )
+
+    return radius, conf, n_splits
+
+
+def langford_sample_size_batch(interval_radius, confidence_level):
+    """
+    Vectorized version of langford_sample_size. The interval_radius and confidence_level parameters are broadcast
+    against each other and an integer array of sample sizes is returned.
+
+    Parameters
+    ----------
+    interval_radius : float or array-like
+        Half widths of the expected confidence intervals. Should be between 0 (exclusive) and 0.5.
+    confidence_level : float or array-like
+        Confidence levels. Should be between 0 and 1.
+    """
+    radius, conf, _ = _broadcast_radius_conf(interval_radius, confidence_level)
+
+    n = np.log(2 / (1 - conf)) / (2 * radius**2)
+    return np.ceil(n).astype(np.int64)
+
+
+def z_test_sample_size_batch(interval_radius, confidence_level):
+    """
+    Vectorized version of z_test_sample_size. The interval_radius and confidence_level parameters are broadcast
+    against each other and an integer array of sample sizes is returned.
+
+    Parameters
+    ----------
+    interval_radius : float or array-like
+        Half widths of the expected confidence intervals. Should be between 0 (exclusive) and 0.5.
+    confidence_level : float or array-like
+        Confidence levels. Should be between 0 and 1.
+    """
+    radius, conf, _ = _broadcast_radius_conf(interval_radius, confidence_level)
+
+    z = _critical_value_batch(conf)
+    n = (z * math.sqrt(0.25) / radius) ** 2
+    return np.ceil(n).astype(np.int64)
+
+
+def cross_validation_sample_size_batch(interval_radius, confidence_level, n_splits):
+    """
+    Vectorized version of cross_validation_sample_size. The interval_radius, confidence_level and n_splits parameters
+    are broadcast against each other and an integer array of sample sizes is returned.
+
+    Parameters
+    ----------
+    interval_radius : float or array-like
+        Half widths of the expected confidence intervals. Should be between 0 (exclusive) and 0.5.
+    confidence_level : float or array-like
+        Confidence levels. Should be between 0 and 1.
+    n_splits : int or array-like
+        Numbers of cross-validation splits. Must be greater than 0.
+    """
+    radius, conf, k = _broadcast_radius_conf(
+        interval_radius, confidence_level, n_splits
+    )
+
+    n = -np.log((1 - conf) / 2) * k / 2 / (radius**2)
+    return np.ceil(n).astype(np.int64)
+
+
 @cap(low=0.0, high=1.0)
 def langford_confidence_level(sample_size: int, interval_radius: float) -> float:
     """
@@ -356,8 +1180,7 @@ def langford_confidence_level(sample_size: int, interval_radius: float) -> float
     _check_n_radius(sample_size, interval_radius)
 
     pr2 = interval_radius**2
-    exponent = math.exp(2 * sample_size * pr2)
-    conf = 1 - 2 / exponent
+    conf = 1 - 2 * math.exp(-2 * sample_size * pr2)
 
     return conf
 
@@ -374,10 +1197,12 @@ def t_test_confidence_level(sample_size: int, interval_radius: float) -> float:
     interval_radius : float
         Half of the expected confidence interval width. Should be between 0 and 0.5.
     """
+    from scipy.special import stdtr
+
     _check_n_radius(sample_size, interval_radius)
 
     t = interval_radius / math.sqrt(0.25 / sample_size)
-    conf = 2 * st.t.cdf(t, sample_size - 1) - 1
+    conf = 2 * stdtr(sample_size - 1, t) - 1
     return conf
 
 
@@ -394,10 +1219,12 @@ def z_test_confidence_level(sample_size: int, interval_radius: float) -> float:
     interval_radius : float
         Half of the expected confidence interval width. Should be between 0 and 0.5.
     """
+    from scipy.special import ndtr
+
     _check_n_radius(sample_size, interval_radius)
 
     z = (math.sqrt(sample_size) * interval_radius) / 0.5
-    conf = 2 * st.norm.cdf(z) - 1
+    conf = 2 * ndtr(z) - 1
     return conf
 
 
@@ -421,6 +1248,127 @@ def cross_validation_confidence_level(
     return conf
 
 
+def langford_confidence_level_batch(sample_size, interval_radius):
+    """
+    Vectorized version of langford_confidence_level. The sample_size and interval_radius parameters are broadcast
+    against each other and an array of confidence levels is returned.
+
+    Parameters
+    ----------
+    sample_size : int or array-like
+        Numbers of samples used in test sets. Must be greater than 0.
+    interval_radius : float or array-like
+        Half widths of the confidence intervals. Should be between 0 and 0.5.
+    """
+    n, radius, _ = _broadcast_n_radius_acc(sample_size, interval_radius, 0.5)
+
+    conf = 1 - 2 * np.exp(-2 * n * radius**2)
+    return _clip(conf)
+
+
+def t_test_confidence_level_batch(sample_size, interval_radius):
+    """
+    Vectorized version of t_test_confidence_level. The sample_size and interval_radius parameters are broadcast
+    against each other and an array of confidence levels is returned.
+
+    Parameters
+    ----------
+    sample_size : int or array-like
+        Numbers of samples used in test sets. Must be greater than 0.
+    interval_radius : float or array-like
+        Half widths of the confidence intervals. Should be between 0 and 0.5.
+    """
+    from scipy.special import stdtr
+
+    n, radius, _ = _broadcast_n_radius_acc(sample_size, interval_radius, 0.5)
+
+    t = radius / np.sqrt(0.25 / n)
+    with np.errstate(invalid="ignore"):
+        conf = 2 * stdtr(n - 1, t) - 1
+    return _clip(conf)
+
+
+def z_test_confidence_level_batch(sample_size, interval_radius):
+    """
+    Vectorized version of z_test_confidence_level. The sample_size and interval_radius parameters are broadcast
+    against each other and an array of confidence levels is returned.
+
+    Parameters
+    ----------
+    sample_size : int or array-like
+        Numbers of samples used in test sets. Must be greater than 0.
+    interval_radius : float or array-like
+        Half widths of the confidence intervals. Should be between 0 and 0.5.
+    """
+    from scipy.special import ndtr
+
+    n, radius, _ = _broadcast_n_radius_acc(sample_size, interval_radius, 0.5)
+
+    z = (np.sqrt(n) * radius) / 0.5
+    return _clip(2 * ndtr(z) - 1)
+
+
+def cross_validation_confidence_level_batch(sample_size, interval_radius, n_splits):
+    """
+    Vectorized version of cross_validation_confidence_level. The sample_size, interval_radius and n_splits
+    parameters are broadcast against each other and an array of confidence levels is returned.
+
+    Parameters
+    ----------
+    sample_size : int or array-like
+        Numbers of samples used in test sets. Must be greater than 0.
+    interval_radius : float or array-like
+        Half widths of the confidence intervals. Should be between 0 and 0.5.
+    n_splits : int or array-like
+        Numbers of cross-validation splits. Must be greater than 1.
+    """
+    n, radius, k = np.broadcast_arrays(
+        np.asarray(sample_size, dtype=float),
+        np.asarray(interval_radius, dtype=float),
+        np.asarray(n_splits, dtype=float),
+    )
+    _check_n_radius_acc_batch(n, radius, 0.5)
+    if not _TRUSTED.get():
+        _check_batch(
+            np.logical_not(k > 0),
+            "Each number of folds must be an integer greater than 0.",
+        )
+
+    conf = -2 * np.exp(-n * 2 * (radius**2) / k) + 1
+    return _clip(conf)
+
+
+_PERCENTILE_METHODS = ("rank", "weak", "strict", "mean")
+
+
+def _sorted_median(sorted_accuracies):
+    mid = sorted_accuracies.shape[-1] // 2
+    if sorted_accuracies.shape[-1] % 2:
+        return sorted_accuracies[..., mid]
+    else:
+        return (sorted_accuracies[..., mid - 1] + sorted_accuracies[..., mid]) / 2
+
+
+def _percentile_of_score_sorted(sorted_accuracies, score, method: str):
+    # Same definitions as scipy.stats.percentileofscore, with the counts obtained by binary search on sorted data.
+    n = sorted_accuracies.size
+    left = np.searchsorted(sorted_accuracies, score, side="left")
+    right = np.searchsorted(sorted_accuracies, score, side="right")
+
+    if method == "rank":
+        return (left + right + (left < right)) * (50.0 / n)
+    elif method == "strict":
+        return left * (100.0 / n)
+    elif method == "weak":
+        return right * (100.0 / n)
+    elif method == "mean":
+        return (left + right) * (50.0 / n)
+    else:
+        raise Exception(
+            f"Unknown percentile calculation method \"{method}\". Should be one of: 'rank', 'weak', 'strict', 'mean'."
+        )
+
+
 @cap(low=0.0, high=1.0)
 def percentiles_confidence_level(
     accuracies: list, interval_radius: float, method="rank"
@@ -439,14 +1387,14 @@ def percentiles_confidence_level(
         Percentile calculation method. One of 'rank', 'weak', 'strict', 'mean'. Default: 'rank'. See
         scipy.stats.percentileofscore for more details.
     """
-    accuracies = np.array(sorted(list(accuracies)))
+    accuracies = np.sort(np.asarray(accuracies, dtype=float).ravel())
     _check_accuracies_conf_radius(accuracies, 0.5, interval_radius)
 
-    accuracies_median = np.median(accuracies)
-    conf_lower = st.percentileofscore(
+    accuracies_median = _sorted_median(accuracies)
+    conf_lower = _percentile_of_score_sorted(
         accuracies, accuracies_median - interval_radius, method
     )
-    conf_upper = st.percentileofscore(
+    conf_upper = _percentile_of_score_sorted(
         accuracies, accuracies_median + interval_radius, method
     )
 
@@ -455,6 +1403,343 @@ def percentiles_confidence_level(
     return confidence_level
 
 
+def percentiles_confidence_level_batch(accuracies, interval_radius, method="rank"):
+    """
+    Vectorized version of percentiles_confidence_level for many models and interval radii at once. Each row of
+    accuracies is sorted once and all percentile queries are answered by binary search. Returns a matrix of confidence
+    levels with one row per model and one column per interval radius.
+
+    Parameters
+    ----------
+    accuracies : array-like
+        2-D array of bootstrap accuracies with one row per model and one column per bootstrap replicate. A 1-D array
+        is treated as a single model. Accuracies should be between 0 and 1.
+    interval_radius : float or array-like
+        Half widths of the expected confidence intervals. Should be between 0 and 0.5.
+    method : str
+        Percentile calculation method. One of 'rank', 'weak', 'strict', 'mean'. Default: 'rank'. See
+        scipy.stats.percentileofscore for more details.
+    """
+    accuracies = np.atleast_2d(np.asarray(accuracies, dtype=float))
+    radii = np.atleast_1d(np.asarray(interval_radius, dtype=float)).ravel()
+    if not _TRUSTED.get():
+        _check_batch(
+            np.logical_not((accuracies >= 0) & (accuracies <= 1)),
+            "Each accuracy should by between <0, 1>.",
+        )
+        _check_batch(
+            np.logical_not((radii >= 0) & (radii <= 0.5)),
+            "Each interval radius should be between 0 and 0.5.",
+        )
+    accuracies = np.sort(accuracies, axis=1)
+
+    medians = _sorted_median(accuracies)
+    confidence_levels = np.empty((accuracies.shape[0], radii.size))
+    for i, row in enumerate(accuracies):
+        conf_lower = _percentile_of_score_sorted(row, medians[i] - radii, method)
+        conf_upper = _percentile_of_score_sorted(row, medians[i] + radii, method)
+        confidence_levels[i] = (conf_upper - conf_lower) / 100
+
+    return _clip(confidence_levels)
+
+
+def _check_n_radius_acc_batch(n, radius, acc):
+    if _TRUSTED.get():
+        return
+    _check_batch(
+        np.logical_not(n > 0), "Each sample size must be an integer greater than 0."
+    )
+
+    _check_batch(
+        np.logical_not((radius >= 0) & (radius <= 0.5)),
+        "Each interval radius should be between 0 and 0.5.",
+    )
+
+    _check_batch(
+        np.logical_not((acc >= 0.0) & (acc <= 1.0)),
+        "Each accuracy should by between <0, 1>.",
+    )
+
+
+def _broadcast_n_radius_acc(sample_size, interval_radius, accuracy):
+    n, radius, acc = np.broadcast_arrays(
+        np.asarray(sample_size, dtype=float),
+        np.asarray(interval_radius, dtype=float),
+        np.asarray(accuracy, dtype=float),
+    )
+    _check_n_radius_acc_batch(n, radius, acc)
+
+    return n, radius, acc
+
+
+def wilson_confidence_level_batch(sample_size, interval_radius, accuracy=0.5):
+    """
+    Vectorized version of wilson_confidence_level. The sample_size, interval_radius and accuracy parameters are
+    broadcast against each other and an array of confidence levels is returned.
+
+    Parameters
+    ----------
+    sample_size : int or array-like
+        Numbers of samples used in test sets. Must be greater than 0.
+    interval_radius : float or array-like
+        Half widths of the confidence intervals. Should be between 0 and 0.5.
+    accuracy : float or array-like
+        Assumed accuracies. Should be between 0 and 1. Default: 0.5, which gives the lowest confidence levels.
+    """
+    from scipy.special import ndtr
+
+    n, radius, acc = _broadcast_n_radius_acc(sample_size, interval_radius, accuracy)
+
+    # The Wilson half width is a quadratic equation in z^2, which is solved for the critical value directly.
+    pq = acc * (1 - acc)
+    r2 = radius**2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z2 = n * ((2 * r2 - pq) + np.sqrt(pq**2 - 4 * r2 * pq + r2)) / (2 * (0.25 - r2))
+        conf = 1 - 2 * ndtr(-np.sqrt(z2))
+    conf = np.where(radius >= 0.5, 1.0, conf)
+    return _clip(conf)
+
+
+def wilson_confidence_level(
+    sample_size: int, interval_radius: float, accuracy: float = 0.5
+) -> float:
+    """
+    Estimates the confidence level at which the Wilson confidence interval for a given sample size and assumed
+    accuracy has a radius (half width) equal to interval_radius.
+
+    Parameters
+    ----------
+    sample_size : int
+        Number of samples used in a test set. Must be greater than 0.
+    interval_radius : float
+        Half of the expected confidence interval width. Should be between 0 and 0.5.
+    accuracy : float
+        Assumed accuracy. Should be between 0 and 1. Default: 0.5, which gives the lowest confidence level.
+    """
+    return float(wilson_confidence_level_batch(sample_size, interval_radius, accuracy))
+
+
+# Bisection steps used to invert the Clopper-Pearson half width, on a log10 scale of alpha between 1e-17 and 1.
+_CLOPPER_PEARSON_LOG_ALPHA_MIN = -17.0
+_CLOPPER_PEARSON_BISECTION_STEPS = 48
+
+
+def clopper_pearson_confidence_level_batch(sample_size, interval_radius, accuracy=0.5):
+    """
+    Vectorized version of clopper_pearson_confidence_level. The sample_size, interval_radius and accuracy parameters
+    are broadcast against each other and an array of confidence levels is returned.
+
+    Parameters
+    ----------
+    sample_size : int or array-like
+        Numbers of samples used in test sets. Must be greater than 0.
+    interval_radius : float or array-like
+        Half widths of the confidence intervals. Should be between 0 and 0.5.
+    accuracy : float or array-like
+        Assumed accuracies. Should be between 0 and 1. Default: 0.5, which gives the lowest confidence levels.
+    """
+    n, radius, acc = _broadcast_n_radius_acc(sample_size, interval_radius, accuracy)
+
+    # The half width grows monotonically with the confidence level, so log10(alpha) is found by a vectorized
+    # bisection. Radii narrower than the interval at alpha = 1 give a confidence level of 0, radii wider than the
+    # interval at the smallest alpha give 1.
+    def half_width(log_alpha):
+        return _clopper_pearson_half_width(n, 1 - 10**log_alpha, acc)
+
+    low = np.full(n.shape, _CLOPPER_PEARSON_LOG_ALPHA_MIN)
+    high = np.zeros(n.shape)
+    for _ in range(_CLOPPER_PEARSON_BISECTION_STEPS):
+        mid = (low + high) / 2
+        too_wide = half_width(mid) > radius
+        low = np.where(too_wide, mid, low)
+        high = np.where(too_wide, high, mid)
+
+    conf = 1 - 10 ** ((low + high) / 2)
+    conf = np.where(half_width(np.zeros(n.shape)) >= radius, 0.0, conf)
+    conf = np.where(
+        half_width(np.full(n.shape, _CLOPPER_PEARSON_LOG_ALPHA_MIN)) <= radius,
+        1.0,
+        conf,
+    )
+    return _clip(conf)
+
+
+def clopper_pearson_confidence_level(
+    sample_size: int, interval_radius: float, accuracy: float = 0.5
+) -> float:
+    """
+    Estimates the confidence level at which the Clopper-Pearson confidence interval for a given sample size and
+    assumed accuracy has a radius (half width) equal to interval_radius.
+
+    Parameters
+    ----------
+    sample_size : int
+        Number of samples used in a test set. Must be greater than 0.
+    interval_radius : float
+        Half of the expected confidence interval width. Should be between 0 and 0.5.
+    accuracy : float
+        Assumed accuracy. Should be between 0 and 1. Default: 0.5, which gives the lowest confidence level.
+    """
+    return float(
+        clopper_pearson_confidence_level_batch(sample_size, interval_radius, accuracy)
+    )
+
+
+# Built-in evaluation methods. Kernels are adapted to the calling conventions described in EstimationMethod.
+register_method(
+    EstimationMethod(
+        "holdout",
+        interval=lambda n, acc, conf, k: wilson_ci(n, acc, conf),
+        sample_size=lambda r, conf, k, acc: z_test_sample_size(r, conf),
+        confidence_level=lambda n, r, k, acc: z_test_confidence_level(n, r),
+        interval_batch=lambda n, acc, conf, k: wilson_ci_batch(n, acc, conf),
+        sample_size_batch=lambda r, conf, k, acc: z_test_sample_size_batch(r, conf),
+        confidence_level_batch=lambda n, r, k, acc: z_test_confidence_level_batch(n, r),
+        description="Holdout test set. Wilson intervals, z-test sample sizes and confidence levels.",
+    )
+)
+register_method(
+    EstimationMethod(
+        "holdout_wilson",
+        interval=lambda n, acc, conf, k: wilson_ci(n, acc, conf),
+        sample_size=lambda r, conf, k, acc: wilson_sample_size(r, conf, acc),
+        confidence_level=lambda n, r, k, acc: wilson_confidence_level(n, r, acc),
+        interval_batch=lambda n, acc, conf, k: wilson_ci_batch(n, acc, conf),
+        sample_size_batch=lambda r, conf, k, acc: wilson_sample_size_batch(
+            r, conf, acc
+        ),
+        confidence_level_batch=lambda n, r, k, acc: wilson_confidence_level_batch(
+            n, r, acc
+        ),
+        description="Holdout test set with the Wilson score interval.",
+    )
+)
+register_method(
+    EstimationMethod(
+        "holdout_langford",
+        interval=lambda n, acc, conf, k: langford_ci(n, acc, conf),
+        sample_size=lambda r, conf, k, acc: langford_sample_size(r, conf),
+        confidence_level=lambda n, r, k, acc: langford_confidence_level(n, r),
+        interval_batch=lambda n, acc, conf, k: langford_ci_batch(n, acc, conf),
+        sample_size_batch=lambda r, conf, k, acc: langford_sample_size_batch(r, conf),
+        confidence_level_batch=lambda n, r, k, acc: langford_confidence_level_batch(
+            n, r
+        ),
+        description="Holdout test set with Langford's approximation.",
+    )
+)
+register_method(
+    EstimationMethod(
+        "holdout_clopper_pearson",
+        interval=lambda n, acc, conf, k: clopper_pearson_ci(n, acc, conf),
+        sample_size=lambda r, conf, k, acc: clopper_pearson_sample_size(r, conf, acc),
+        confidence_level=lambda n, r, k, acc: clopper_pearson_confidence_level(
+            n, r, acc
+        ),
+        interval_batch=lambda n, acc, conf, k: clopper_pearson_ci_batch(n, acc, conf),
+        sample_size_batch=lambda r, conf, k, acc: clopper_pearson_sample_size_batch(
+            r, conf, acc
+        ),
+        confidence_level_batch=lambda n, r, k, acc: clopper_pearson_confidence_level_batch(
+            n, r, acc
+        ),
+        description="Holdout test set with the exact Clopper-Pearson interval.",
+    )
+)
+register_method(
+    EstimationMethod(
+        "holdout_z_test",
+        interval=lambda n, acc, conf, k: z_test_ci(n, acc, conf),
+        sample_size=lambda r, conf, k, acc: z_test_sample_size(r, conf),
+        confidence_level=lambda n, r, k, acc: z_test_confidence_level(n, r),
+        interval_batch=lambda n, acc, conf, k: z_test_ci_batch(n, acc, conf),
+        sample_size_batch=lambda r, conf, k, acc: z_test_sample_size_batch(r, conf),
+        confidence_level_batch=lambda n, r, k, acc: z_test_confidence_level_batch(n, r),
+        description="Holdout test set with the normal approximation.",
+    )
+)
+register_method(
+    EstimationMethod(
+        "holdout_t_test",
+        interval=lambda n, acc, conf, k: t_test_ci(n, acc, conf),
+        sample_size=lambda r, conf, k, acc: t_test_sample_size(r, conf),
+        confidence_level=lambda n, r, k, acc: t_test_confidence_level(n, r),
+        interval_batch=lambda n, acc, conf, k: t_test_ci_batch(n, acc, conf),
+        sample_size_batch=lambda r, conf, k, acc: t_test_sample_size_batch(r, conf),
+        confidence_level_batch=lambda n, r, k, acc: t_test_confidence_level_batch(n, r),
+        description="Holdout test set with the t-distribution approximation.",
+    )
+)
+register_method(
+    EstimationMethod(
+        "bootstrap",
+        interval=lambda n, accuracies, conf, k: percentiles_ci(accuracies, conf),
+        sample_size=lambda r, conf, k, acc: z_test_sample_size(r, conf),
+        confidence_level=lambda n, r, k, accuracies: percentiles_confidence_level(
+            accuracies, r
+        ),
+        sample_size_batch=lambda r, conf, k, acc: z_test_sample_size_batch(r, conf),
+        uses_replicates=True,
+        description="Bootstrap percentile intervals. Sample sizes are planned with the normal approximation, which "
+        "percentile intervals converge to, because no bootstrap results exist before the data is collected.",
+    )
+)
+register_method(
+    EstimationMethod(
+        "cv",
+        interval=lambda n, acc, conf, k: cross_validation_ci(n, k, acc, conf),
+        sample_size=lambda r, conf, k, acc: cross_validation_sample_size(r, conf, k),
+        confidence_level=lambda n, r, k, acc: cross_validation_confidence_level(
+            n, r, k
+        ),
+        interval_batch=lambda n, acc, conf, k: cross_validation_ci_batch(
+            n, k, acc, conf
+        ),
+        sample_size_batch=lambda r, conf, k, acc: cross_validation_sample_size_batch(
+            r, conf, k
+        ),
+        confidence_level_batch=lambda n, r, k, acc: cross_validation_confidence_level_batch(
+            n, r, k
+        ),
+        requires_n_splits=True,
+        description="Cross-validation with n_splits folds.",
+    )
+)
+register_method(
+    EstimationMethod(
+        "progressive",
+        interval=lambda n, acc, conf, k: langford_ci(n, acc, conf),
+        sample_size=lambda r, conf, k, acc: langford_sample_size(r, conf),
+        confidence_level=lambda n, r, k, acc: langford_confidence_level(n, r),
+        interval_batch=lambda n, acc, conf, k: langford_ci_batch(n, acc, conf),
+        sample_size_batch=lambda r, conf, k, acc: langford_sample_size_batch(r, conf),
+        confidence_level_batch=lambda n, r, k, acc: langford_confidence_level_batch(
+            n, r
+        ),
+        description="Progressive validation, with Langford's approximation.",
+    )
+)
+
+
+def _cv_corrected_t_ci(n, accuracies, conf, k):
+    # The kernel lives in crossval, which imports this module, so it is loaded on first use.
+    from .crossval import corrected_resampled_t_ci
+
+    return corrected_resampled_t_ci(np.reshape(accuracies, (-1, k)), conf)
+
+
+register_method(
+    EstimationMethod(
+        "cv_corrected_t",
+        interval=_cv_corrected_t_ci,
+        requires_n_splits=True,
+        uses_replicates=True,
+        description="Cross-validation with the corrected resampled t-test, computed from the accuracies of all "
+        "folds (of all repeats).",
+    )
+)
+
+
 def estimate_confidence_interval(
     sample_size: int,
     accuracy: float or list,
@@ -476,7 +1761,8 @@ def estimate_confidence_interval(
     accuracy : float or list
         Estimated accuracy. For the holdout procedure this is the accuracy obtained on the holdout test set, for
          cross-validation and progressive validation it is the mean accuracy from all folds/progressive test sets, for
-          bootstrapping this should be a list of accuracies obtained for each bootstrap sample.
+          bootstrapping this should be a list of accuracies obtained for each bootstrap sample, and for 'cv_corrected_t'
+          a list (or a repeats x folds array) of the accuracies of all folds.
     confidence_level : float
         Desired confidence level. Should be between 0 and 1.
     n_splits : int
@@ -484,30 +1770,12 @@ def estimate_confidence_interval(
     method : str
         Evaluation method. Parameter used to determine the confidence interval approximation method. Should be one of:
         'holdout', 'holdout_wilson', 'holdout_langford', 'holdout_clopper_pearson', 'holdout_z_test', 'holdout_t_test',
-        'bootstrap', 'cv', 'progressive'. When 'holdout' uses the 'holdout_wilson' approximation.  Default: 'holdout'.
-    """
-    if method == "holdout_wilson" or method == "holdout":
-        return wilson_ci(sample_size, accuracy, confidence_level)
-    elif method == "holdout_langford" or method == "progressive":
-        return langford_ci(sample_size, accuracy, confidence_level)
-    elif method == "holdout_clopper_pearson":
-        return clopper_pearson_ci(sample_size, accuracy, confidence_level)
-    elif method == "holdout_z_test":
-        return z_test_ci(sample_size, accuracy, confidence_level)
-    elif method == "holdout_t_test":
-        return t_test_ci(sample_size, accuracy, confidence_level)
-    elif method == "bootstrap":
-        return percentiles_ci(accuracy, confidence_level)
-    elif method == "cv":
-        if n_splits <= 1:
-            raise Exception("Provide the n_splits parameter with a value > 1.")
-        return cross_validation_ci(sample_size, n_splits, accuracy, confidence_level)
-    else:
-        raise Exception(
-            "Unknown CI estimation method. Should be one of: 'holdout', 'holdout_wilson', 'holdout_langford', "
-            "'holdout_clopper_pearson', 'holdout_z_test', 'holdout_t_test', 'bootstrap', "
-            "'cv', 'progressive'"
-        )
+        'bootstrap', 'cv', 'cv_corrected_t', 'progressive', or the name of a method added with register_method. When
+        'holdout' uses the 'holdout_wilson' approximation.  Default: 'holdout'.
+    """
+    spec = get_method(method, "interval")
+    spec.check_n_splits(n_splits)
+    return spec.kernel("interval")(sample_size, accuracy, confidence_level, n_splits)
 
 
 def estimate_sample_size(
@@ -515,6 +1783,7 @@ def estimate_sample_size(
     confidence_level: float,
     n_splits: int = None,
     method: str = "holdout",
+    accuracy: float = 0.5,
 ):
     """
     Wrapper function for estimating the sample size needed to obtain a specified confidence interval, for different
@@ -530,22 +1799,18 @@ def estimate_sample_size(
         Optional. Number of folds used in cross validation. Ignored when method is different than 'cv'.
     method : str
         Evaluation method. Parameter used to determine the confidence interval approximation method. Should be one of:
-        'holdout', 'holdout_z_test', 'holdout_langford', 'cv', 'bootstrap', 'progressive'. When 'holdout' uses the
-        'holdout_z_test' approximation. Default: 'holdout'.
+        'holdout', 'holdout_wilson', 'holdout_langford', 'holdout_clopper_pearson', 'holdout_z_test', 'holdout_t_test',
+        'bootstrap', 'cv', 'progressive', or the name of a method added with register_method. When 'holdout' or
+        'bootstrap' uses the 'holdout_z_test' approximation. Default: 'holdout'.
+    accuracy : float
+        Optional. Assumed accuracy used by the 'holdout_wilson' and 'holdout_clopper_pearson' methods. Default: 0.5,
+        which gives the largest sample sizes.
     """
-    if method == "holdout_z_test" or method == "holdout" or method == "bootstrap":
-        return z_test_sample_size(interval_radius, confidence_level)
-    elif method == "holdout_langford" or method == "progressive":
-        return langford_sample_size(interval_radius, confidence_level)
-    elif method == "cv":
-        if n_splits <= 1:
-            raise Exception("Provide the n_splits parameter with a value > 1.")
-        return cross_validation_sample_size(interval_radius, confidence_level, n_splits)
-    else:
-        raise Exception(
-            "Unknown sample size estimation method. Should be one of: 'holdout', 'holdout_z_test', 'holdout_langford', "
-            "'cv', 'bootstrap', 'progressive'."
-        )
+    spec = get_method(method, "sample_size")
+    spec.check_n_splits(n_splits)
+    return spec.kernel("sample_size")(
+        interval_radius, confidence_level, n_splits, accuracy
+    )
 
 
 def estimate_confidence_level(
@@ -554,6 +1819,7 @@ def estimate_confidence_level(
     n_splits: int = None,
     method: str = "holdout",
     accuracies: list = None,
+    accuracy: float = 0.5,
 ):
     """
     Wrapper function for estimating the confidence level of interval radius for a given sample size and a given
@@ -572,133 +1838,23 @@ def estimate_confidence_level(
         Optional. Number of folds used in cross validation. Ignored when method is different than 'cv'.
     method : str
         Evaluation method. Parameter used to determine the confidence interval approximation method. Should be one of:
-        'holdout', 'holdout_z_test', 'holdout_t_test', 'holdout_langford', 'cv', 'progressive', 'bootstrap'.
-        When 'holdout' uses the 'holdout_z_test' approximation. Default: 'holdout'.
+        'holdout', 'holdout_wilson', 'holdout_langford', 'holdout_clopper_pearson', 'holdout_z_test', 'holdout_t_test',
+        'bootstrap', 'cv', 'progressive', or the name of a method added with register_method. When 'holdout' uses the
+        'holdout_z_test' approximation. Default: 'holdout'.
     accuracies: list
         Used only when method='bootstrap'. This should be a list of accuracies obtained for each bootstrap sample.
+    accuracy : float
+        Optional. Assumed accuracy used by the 'holdout_wilson' and 'holdout_clopper_pearson' methods. Default: 0.5,
+        which gives the lowest confidence levels.
     """
-    if method == "holdout_z_test" or method == "holdout":
-        return z_test_confidence_level(sample_size, interval_radius)
-    if method == "holdout_t_test":
-        return t_test_confidence_level(sample_size, interval_radius)
-    elif method == "holdout_langford" or method == "progressive":
-        return langford_confidence_level(sample_size, interval_radius)
-    elif method == "cv":
-        if n_splits <= 1:
-            raise Exception("Provide the n_splits parameter with a value > 1.")
-        return cross_validation_confidence_level(sample_size, interval_radius, n_splits)
-    elif method == "bootstrap":
+    spec = get_method(method, "confidence_level")
+    spec.check_n_splits(n_splits)
+    if spec.uses_replicates:
         if accuracies is None:
             raise Exception(
                 "Provide the accuracies parameter with a list of bootstrapping results."
             )
-        return percentiles_confidence_level(accuracies, interval_radius)
-    else:
-        raise Exception(
-            "Unknown confidence level estimation method. Should be one of: 'holdout', 'holdout_z_test', "
-            "'holdout_t_test', 'holdout_langford', 'cv', 'progressive', 'bootstrap'"
-        )
-
-
-def plot_classifier_intervals(
-    names,
-    sizes,
-    accuracies,
-    method,
-    confidence_levels=[0.9, 0.95, 0.98],
-    n_splits=None,
-    xlab="Accuracy",
-    width=12,
-    height=4,
-):
-    """
-    Wrapper function for estimating the confidence level of interval radius for a given sample size and a given
-    evaluation procedure.
-
-    Parameters
-    ----------
-    names : list
-        Names of classifiers the error bars will be plotted.
-    sizes : list
-        Sample sizes for estimating confidence intervals.
-    accuracies : list
-        Accuracies for each classifier.
-    method : str
-        Evaluation method. Parameter used to determine the confidence interval approximation method. Should be one of:
-        'holdout', 'holdout_wilson', 'holdout_langford', 'holdout_clopper_pearson', 'holdout_z_test', 'holdout_t_test',
-        'bootstrap', 'cv', 'progressive'. When 'holdout' uses the 'holdout_wilson' approximation.
-    confidence_levels : list
-        Desired confidence levels, for which graded error bars will be plotted.
-    n_splits : int
-        Optional. Number of folds used in cross validation. Ignored when method is different than 'cv'.
-    xlab: str
-        X-axis label.
-    width: int
-        Plot width in inches.
-    height: int
-        Plot height in inches.
-    """
-    colors = [
-        "#03045E",
-        "#023E8A",
-        "#0077B6",
-        "#0096C7",
-        "#00B4D8",
-        "#48CAE4",
-        "#90E0EF",
-        "#ADE8F4",
-    ]
-    i = 0
-    clf_num = len(names)
-    f = plt.figure(figsize=(width, height))
-
-    for name_size_acc in zip(names, sizes, accuracies):
-        patches = []
-        j = len(confidence_levels) - 1
-        for conf in sorted(confidence_levels, reverse=True):
-            interval = estimate_confidence_interval(
-                name_size_acc[1],
-                name_size_acc[2],
-                conf,
-                method=method,
-                n_splits=n_splits,
-            )
-
-            if method == "bootstrap":
-                mean_acc = np.mean(name_size_acc[2])
-            else:
-                mean_acc = name_size_acc[2]
-
-            plt.errorbar(
-                mean_acc,
-                i,
-                xerr=np.array([[mean_acc - interval[0], interval[1] - mean_acc]]).T,
-                fmt="o",
-                color="#ee6c4d",
-                ecolor=colors[j],
-                elinewidth=(1 - conf) * 100,
-                capsize=3 * len(confidence_levels) - j,
-                mew=4,
-                markersize=5,
-            )
-            patches.append(
-                mpatches.Patch(
-                    color=colors[j], label=f"{sorted(confidence_levels)[j] * 100:.0f}%"
-                )
-            )
-            j -= 1
-        i += 0.5
-    plt.xticks(fontsize=14)
-    plt.yticks(ticks=np.arange(0, clf_num / 2, 0.5), labels=list(names), fontsize=14)
-    plt.xlabel(xlab, fontsize=16, labelpad=10)
-    plt.grid()
-    plt.legend(
-        handles=patches,
-        loc="center left",
-        bbox_to_anchor=(1, 0.5),
-        fontsize=14,
-        title_fontsize=14,
-        title="Confidence level:",
-    )
-    plt.grid(b=None)
-    return f
+        accuracy = accuracies
+    return spec.kernel("confidence_level")(
+        sample_size, interval_radius, n_splits, accuracy
+    )
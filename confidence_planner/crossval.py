@@ -0,0 +1,271 @@
+import numpy as np
+
+from .confidence_planner import (
+    _check_batch,
+    _clip_batch,
+    _critical_value_batch,
+    is_trusted,
+)
+from .results import Interval
+
+__all__ = [
+    "CrossValidationTracker",
+    "corrected_resampled_t_ci",
+    "corrected_resampled_t_ci_batch",
+]
+
+
+def _fold_accuracies(fold_results, fold_sizes=None):
+    results = np.asarray(fold_results, dtype=float)
+    if results.ndim < 2:
+        raise Exception(
+            f"Fold results should be an array of (repeats x folds) results, not an array with {results.ndim} dimension(s)"
+        )
+    if fold_sizes is None:
+        if not is_trusted():
+            _check_batch(
+                (results < 0.0) | (results > 1.0),
+                "Each fold accuracy should by between <0, 1>.",
+            )
+        return results
+
+    fold_sizes = np.asarray(fold_sizes, dtype=float)
+    if not is_trusted():
+        results, fold_sizes = np.broadcast_arrays(results, fold_sizes)
+        _check_batch(
+            np.logical_not(fold_sizes > 0),
+            "Each fold size must be an integer greater than 0.",
+        )
+        _check_batch(
+            (results < 0) | (results > fold_sizes),
+            "Each number of correct predictions should be between 0 and the fold size.",
+        )
+    return results / fold_sizes
+
+
+def corrected_resampled_t_ci_batch(
+    fold_results, confidence_level, test_train_ratio: float = None, fold_sizes=None
+) -> tuple:
+    """
+    Returns corrected resampled t-test confidence intervals (Nadeau and Bengio, 2003; Bouckaert and Frank, 2004) for
+    the mean accuracy of (repeated) cross-validation runs, computed from the results of individual folds. Unlike
+    cross_validation_ci, which only uses the mean accuracy, the interval width follows the observed fold-to-fold
+    variance. The variance is inflated by the test / train size ratio, because the training sets of different folds
+    overlap and their results are correlated.
+
+    The last two axes of fold_results are (repeats, folds); any leading axes (e.g., models or experiments) are batch
+    axes, broadcast against confidence_level. NaN values mark folds that have not finished yet and are ignored, so
+    intervals of running experiments can be computed. Intervals of runs with fewer than two finished folds are <0, 1>.
+    A tuple of two arrays (lower and upper interval bounds) is returned.
+
+    Parameters
+    ----------
+    fold_results : array-like
+        Accuracies of each fold, or numbers of correct predictions when fold_sizes is given. Shape
+        (..., repeats, folds).
+    confidence_level : float or array-like
+        Desired confidence levels. Should be between 0 and 1.
+    test_train_ratio : float
+        Optional. Ratio of the test fold size to the training set size. Default: 1 / (folds - 1), as in k-fold
+        cross-validation.
+    fold_sizes : int or array-like
+        Optional. Number of examples in each fold, broadcast against fold_results.
+    """
+    accuracies = _fold_accuracies(fold_results, fold_sizes)
+    n_splits = accuracies.shape[-1]
+    if test_train_ratio is None:
+        if n_splits < 2:
+            raise Exception(
+                "Provide the test_train_ratio parameter when there is a single fold per repeat."
+            )
+        test_train_ratio = 1 / (n_splits - 1)
+    conf = np.asarray(confidence_level, dtype=float)
+    if not is_trusted():
+        _check_batch(
+            np.logical_not((conf > 0.0) & (conf < 1.0)),
+            "Each confidence level should be between (0, 1).",
+        )
+        if test_train_ratio <= 0:
+            raise Exception(
+                f'Test / train size ratio should be greater than 0, not "{test_train_ratio}"'
+            )
+
+    finished = np.isfinite(accuracies)
+    n_finished = finished.sum(axis=(-2, -1))
+    values = np.where(finished, accuracies, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = values.sum(axis=(-2, -1)) / n_finished
+        deviations = np.where(finished, accuracies - mean[..., None, None], 0.0)
+        variance = (deviations**2).sum(axis=(-2, -1)) / (n_finished - 1)
+
+    t = _critical_value_batch(conf, np.maximum(n_finished - 1, 1))
+    radius = t * np.sqrt((1 / np.maximum(n_finished, 1) + test_train_ratio) * variance)
+    low, high = _clip_batch(mean - radius, mean + radius)
+    # Runs with fewer than two finished folds have no variance estimate.
+    undefined = np.broadcast_to(n_finished < 2, low.shape)
+    return np.where(undefined, 0.0, low), np.where(undefined, 1.0, high)
+
+
+def corrected_resampled_t_ci(
+    fold_accuracies, confidence_level: float, test_train_ratio: float = None
+) -> Interval:
+    """
+    Returns the corrected resampled t-test confidence interval for the mean accuracy of a (repeated) cross-validation
+    run. See corrected_resampled_t_ci_batch for details.
+
+    Parameters
+    ----------
+    fold_accuracies : array-like
+        Accuracies of each fold. Either a list of folds of a single cross-validation, or a (repeats x folds) array.
+        Accuracies should be between 0 and 1.
+    confidence_level : float
+        Desired confidence level. Should be between 0 and 1.
+    test_train_ratio : float
+        Optional. Ratio of the test fold size to the training set size. Default: 1 / (folds - 1).
+    """
+    fold_accuracies = np.asarray(fold_accuracies, dtype=float)
+    if fold_accuracies.ndim == 1:
+        fold_accuracies = fold_accuracies[None, :]
+    low, high = corrected_resampled_t_ci_batch(
+        fold_accuracies, confidence_level, test_train_ratio
+    )
+    return Interval(float(low), float(high))
+
+
+class CrossValidationTracker:
+    """
+    Collects fold results of (repeated) cross-validation runs as the folds finish, and reports corrected resampled
+    t-test intervals of the folds finished so far. Results of many models or experiments can be tracked together, in
+    which case every update and every interval is computed for all of them with single vectorized operations.
+
+    Parameters
+    ----------
+    n_splits : int
+        Number of folds in each repeat. Should be greater than 1.
+    n_repeats : int
+        Number of cross-validation repeats. Default: 1.
+    confidence_level : float
+        Confidence level of the reported intervals. Should be between 0 and 1. Default: 0.95.
+    shape : tuple
+        Shape of the batch of tracked models or experiments. Default: (), a single run.
+    test_train_ratio : float
+        Optional. Ratio of the test fold size to the training set size. Default: 1 / (n_splits - 1).
+    """
+
+    def __init__(
+        self,
+        n_splits: int,
+        n_repeats: int = 1,
+        confidence_level: float = 0.95,
+        shape: tuple = (),
+        test_train_ratio: float = None,
+    ):
+        if n_splits <= 1:
+            raise Exception("Provide the n_splits parameter with a value > 1.")
+        if n_repeats <= 0:
+            raise Exception(
+                f'Number of repeats must be an integer greater than 0, not "{n_repeats}"'
+            )
+        if confidence_level <= 0 or confidence_level >= 1:
+            raise Exception(
+                f'Confidence level should be between 0 and 1, not "{confidence_level}".'
+            )
+
+        self.n_splits = n_splits
+        self.n_repeats = n_repeats
+        self.confidence_level = confidence_level
+        self.shape = (shape,) if isinstance(shape, int) else tuple(shape)
+        self.test_train_ratio = test_train_ratio
+        self.fold_accuracies = np.full(self.shape + (n_repeats, n_splits), np.nan)
+
+    def __repr__(self):
+        return (
+            f"CrossValidationTracker(n_splits={self.n_splits}, n_repeats={self.n_repeats}, "
+            f"finished={self.n_finished}, shape={self.shape!r})"
+        )
+
+    @property
+    def n_finished(self) -> int:
+        """
+        Number of finished folds, counted over all repeats of the first tracked run.
+        """
+        finished = np.isfinite(self.fold_accuracies)
+        return int(finished.reshape(-1, self.n_repeats * self.n_splits)[0].sum())
+
+    @property
+    def accuracy(self):
+        """
+        Mean accuracy of the finished folds. An array when more than one run is tracked.
+        """
+        if self.n_finished == 0:
+            raise Exception("No fold results were added to the tracker yet.")
+        finished = np.isfinite(self.fold_accuracies)
+        values = np.where(finished, self.fold_accuracies, 0.0).sum(axis=(-2, -1))
+        mean = values / finished.sum(axis=(-2, -1))
+        return float(mean) if not self.shape else mean
+
+    def add(
+        self, fold: int, accuracy=None, repeat: int = 0, n_correct=None, fold_size=None
+    ):
+        """
+        Records the result of a finished fold.
+
+        Parameters
+        ----------
+        fold : int
+            Index of the fold, between 0 and n_splits - 1.
+        accuracy : float or array-like
+            Optional. Accuracy of the fold, or an array of accuracies with the tracker's shape. Used when n_correct is
+            not given.
+        repeat : int
+            Index of the repeat, between 0 and n_repeats - 1. Default: 0.
+        n_correct : int or array-like
+            Optional. Number(s) of correct predictions in the fold. Used together with fold_size.
+        fold_size : int or array-like
+            Optional. Number(s) of examples in the fold.
+        """
+        if not 0 <= fold < self.n_splits:
+            raise Exception(
+                f'Fold index should be between 0 and {self.n_splits - 1}, not "{fold}"'
+            )
+        if not 0 <= repeat < self.n_repeats:
+            raise Exception(
+                f'Repeat index should be between 0 and {self.n_repeats - 1}, not "{repeat}"'
+            )
+
+        if n_correct is not None:
+            if fold_size is None:
+                raise Exception(
+                    "Provide the fold_size parameter together with n_correct."
+                )
+            accuracy = _fold_accuracies(
+                np.asarray(n_correct, dtype=float)[..., None, None],
+                np.asarray(fold_size, dtype=float)[..., None, None],
+            )[..., 0, 0]
+        elif accuracy is None:
+            raise Exception("Provide either the accuracy or the n_correct parameter.")
+        else:
+            accuracy = _fold_accuracies(
+                np.asarray(accuracy, dtype=float)[..., None, None]
+            )[..., 0, 0]
+        self.fold_accuracies[..., repeat, fold] = accuracy
+        return self
+
+    def interval(self, confidence_level: float = None):
+        """
+        Returns the corrected resampled t-test interval of the folds finished so far: an Interval for a single run,
+        or a tuple of lower and upper bound arrays when several runs are tracked.
+
+        Parameters
+        ----------
+        confidence_level : float
+            Optional. Overrides the confidence level given in the constructor.
+        """
+        if confidence_level is None:
+            confidence_level = self.confidence_level
+        low, high = corrected_resampled_t_ci_batch(
+            self.fold_accuracies, confidence_level, self.test_train_ratio
+        )
+        if not self.shape:
+            return Interval(float(low), float(high))
+        return low, high
@@ -0,0 +1,289 @@
+import numpy as np
+
+from .parallel import BATCH_CHUNK_SIZE, _evaluate_chunk
+
+__all__ = ["add_confidence_intervals", "iter_confidence_intervals"]
+
+
+def _library(table) -> str:
+    # pandas and pyarrow are optional, so tables are recognized by the module of their type instead of isinstance.
+    return type(table).__module__.split(".")[0]
+
+
+def _pandas_column(table, name):
+    column = table[name]
+    values = column.to_numpy(copy=False)
+    if values.dtype == object and column.dtype.kind in "iufb":
+        # Nullable numeric extension dtypes, with missing values as NaN
+        values = column.to_numpy(dtype=float, na_value=np.nan)
+    return values
+
+
+def _arrow_column(batch, name):
+    # Zero-copy for primitive columns without nulls; other columns are converted, with nulls as NaN or None.
+    return batch.column(name).to_numpy(zero_copy_only=False)
+
+
+def _check_columns(names, parameters):
+    for parameter in parameters:
+        if parameter is not None and parameter not in names:
+            raise Exception(f'The table does not contain the "{parameter}" column.')
+
+
+def _chunk_intervals(
+    column,
+    n_rows,
+    offset,
+    sample_size,
+    accuracy,
+    confidence_level,
+    method,
+    method_column,
+    n_splits,
+    errors,
+):
+    # Computes the intervals of one chunk of rows. column(name) returns the values of a column for the chunk.
+    columns = [column(sample_size), column(accuracy)]
+    for value in (confidence_level, n_splits):
+        if isinstance(value, str):
+            columns.append(column(value))
+        else:
+            # n_splits values of 0 stand for a missing parameter
+            columns.append(np.broadcast_to(float(value or 0), (n_rows,)))
+
+    if method_column is None:
+        groups = [(method, slice(None))]
+    else:
+        methods = np.asarray(column(method_column), dtype=str)
+        groups = [(m, np.flatnonzero(methods == m)) for m in np.unique(methods)]
+
+    low, high = np.empty(n_rows), np.empty(n_rows)
+    for group_method, rows in groups:
+        (group_low, group_high), row_errors = _evaluate_chunk(
+            "interval", str(group_method), [values[rows] for values in columns]
+        )
+        if row_errors and errors == "raise":
+            i, message = row_errors[0]
+            row = i if isinstance(rows, slice) else rows[i]
+            raise Exception(f"Row {offset + row}: {message}")
+        low[rows] = group_low
+        high[rows] = group_high
+    return low, high
+
+
+def _append_intervals(
+    table,
+    row_offset,
+    sample_size,
+    accuracy,
+    confidence_level,
+    method,
+    method_column,
+    n_splits,
+    chunk_size,
+    low,
+    high,
+    errors,
+):
+    if chunk_size <= 0:
+        raise Exception(
+            f'Chunk size must be an integer greater than 0, not "{chunk_size}"'
+        )
+    if errors not in ("raise", "coerce"):
+        raise Exception(
+            f"Unknown errors value \"{errors}\". Should be one of: 'raise', 'coerce'."
+        )
+    parameters = dict(
+        sample_size=sample_size,
+        accuracy=accuracy,
+        confidence_level=confidence_level,
+        method=method,
+        method_column=method_column,
+        n_splits=n_splits,
+        errors=errors,
+    )
+    required = [sample_size, accuracy, method_column] + [
+        value for value in (confidence_level, n_splits) if isinstance(value, str)
+    ]
+    library = _library(table)
+
+    if library == "pyarrow":
+        import pyarrow as pa
+
+        _check_columns(table.schema.names, required)
+        batches = (
+            table.to_batches(max_chunksize=chunk_size)
+            if isinstance(table, pa.Table)
+            else [
+                table.slice(start, chunk_size)
+                for start in range(0, table.num_rows, chunk_size)
+            ]
+        )
+        lows, highs, offset = [], [], 0
+        for batch in batches:
+            chunk_low, chunk_high = _chunk_intervals(
+                lambda name, b=batch: _arrow_column(b, name),
+                batch.num_rows,
+                row_offset + offset,
+                **parameters,
+            )
+            lows.append(pa.array(chunk_low))
+            highs.append(pa.array(chunk_high))
+            offset += batch.num_rows
+
+        if isinstance(table, pa.Table):
+            low_column = pa.chunked_array(lows, type=pa.float64())
+            high_column = pa.chunked_array(highs, type=pa.float64())
+            return table.append_column(low, low_column).append_column(high, high_column)
+        return pa.RecordBatch.from_arrays(
+            table.columns
+            + [
+                pa.concat_arrays(lows) if lows else pa.array([], pa.float64()),
+                pa.concat_arrays(highs) if highs else pa.array([], pa.float64()),
+            ],
+            names=table.schema.names + [low, high],
+        )
+
+    if library == "pandas":
+        _check_columns(table.columns, required)
+        column = lambda name: _pandas_column(table, name)
+    else:
+        _check_columns(table, required)
+        column = lambda name: np.asarray(table[name])
+    n_rows = len(table[sample_size])
+    columns = {}
+
+    def chunk_column(name, start, stop):
+        # Full columns are converted once and sliced into views for each chunk.
+        if name not in columns:
+            columns[name] = column(name)
+        return columns[name][start:stop]
+
+    result_low, result_high = np.empty(n_rows), np.empty(n_rows)
+    for start in range(0, n_rows, chunk_size):
+        stop = min(start + chunk_size, n_rows)
+        result_low[start:stop], result_high[start:stop] = _chunk_intervals(
+            lambda name: chunk_column(name, start, stop),
+            stop - start,
+            row_offset + start,
+            **parameters,
+        )
+
+    if library == "pandas":
+        result = table.copy(deep=False)
+    else:
+        result = dict(table)
+    result[low] = result_low
+    result[high] = result_high
+    return result
+
+
+def add_confidence_intervals(
+    table,
+    sample_size: str = "n",
+    accuracy: str = "accuracy",
+    confidence_level=0.95,
+    method: str = "holdout",
+    method_column: str = None,
+    n_splits=None,
+    chunk_size: int = BATCH_CHUNK_SIZE,
+    low: str = "ci_low",
+    high: str = "ci_high",
+    errors: str = "raise",
+):
+    """
+    Computes accuracy confidence intervals for every row of an evaluation table and returns the table with two
+    additional columns with the lower and upper interval bounds. Numeric columns are read as NumPy views where the
+    table layout allows it (NumPy-backed pandas columns, Arrow columns without nulls), and rows are processed in chunks
+    of chunk_size with the vectorized kernel of each method, so temporary memory is bounded by the chunk size. The
+    existing columns of the returned table are not copied.
+
+    pandas and pyarrow are not required by the package; tables of these libraries are supported when the library is
+    installed.
+
+    Parameters
+    ----------
+    table : DataFrame, pyarrow.Table, pyarrow.RecordBatch, or dict
+        Evaluation table. A dict maps column names to array-likes.
+    sample_size : str
+        Name of the column with sample sizes. Default: 'n'.
+    accuracy : str
+        Name of the column with accuracies. Default: 'accuracy'.
+    confidence_level : float or str
+        Confidence level of all rows, or the name of a column with a confidence level per row. Default: 0.95.
+    method : str
+        Evaluation method of all rows, as accepted by estimate_confidence_interval. Ignored when method_column is
+        given. Default: 'holdout'.
+    method_column : str
+        Optional. Name of a column with the evaluation method of each row.
+    n_splits : int or str
+        Optional. Number of cross-validation folds of all rows, or the name of a column with the number of folds of
+        each row. Required by the 'cv' method.
+    chunk_size : int
+        Maximum number of rows evaluated at once. Default: 100000.
+    low, high : str
+        Names of the added columns. Default: 'ci_low' and 'ci_high'.
+    errors : str
+        'raise' to raise an exception for the first row that cannot be evaluated, or 'coerce' to set its bounds to
+        NaN. Default: 'raise'.
+    """
+    return _append_intervals(
+        table,
+        0,
+        sample_size,
+        accuracy,
+        confidence_level,
+        method,
+        method_column,
+        n_splits,
+        chunk_size,
+        low,
+        high,
+        errors,
+    )
+
+
+def iter_confidence_intervals(
+    batches,
+    sample_size: str = "n",
+    accuracy: str = "accuracy",
+    confidence_level=0.95,
+    method: str = "holdout",
+    method_column: str = None,
+    n_splits=None,
+    chunk_size: int = BATCH_CHUNK_SIZE,
+    low: str = "ci_low",
+    high: str = "ci_high",
+    errors: str = "raise",
+):
+    """
+    Streaming version of add_confidence_intervals for tables that do not fit in memory. Consumes an iterable of
+    tables, such as a pyarrow.RecordBatchReader, pandas.read_csv(..., chunksize=...), or a generator of dicts, and
+    yields each table with the interval columns appended. Only one table is held in memory at a time, and rows in
+    error messages are numbered from the start of the stream.
+
+    Parameters
+    ----------
+    batches : iterable
+        Tables accepted by add_confidence_intervals.
+    sample_size, accuracy, confidence_level, method, method_column, n_splits, chunk_size, low, high, errors
+        See add_confidence_intervals.
+    """
+    offset = 0
+    for batch in batches:
+        result = _append_intervals(
+            batch,
+            offset,
+            sample_size,
+            accuracy,
+            confidence_level,
+            method,
+            method_column,
+            n_splits,
+            chunk_size,
+            low,
+            high,
+            errors,
+        )
+        offset += len(result[low])
+        yield result
@@ -0,0 +1,161 @@
+import numpy as np
+
+from .bootstrap import _correct_predictions
+from .registry import get_method
+
+__all__ = ["grouped_confidence_intervals"]
+
+# Combined group codes are counted with a dense bincount when there are at most this many possible codes per row;
+# sparser codes are first compacted with np.unique.
+_DENSE_CODES_PER_ROW = 4
+
+
+def _group_codes(key, n_rows):
+    # Returns integer codes in range(len(values)) and the key value of each code. Rows with a code of -1 are missing.
+    if hasattr(key, "cat"):
+        # pandas Series with a categorical dtype
+        key = key.cat
+    if hasattr(key, "codes") and hasattr(key, "categories"):
+        codes = np.asarray(key.codes, dtype=np.intp).ravel()
+        values = np.asarray(key.categories)
+    else:
+        key = np.asarray(key).ravel()
+        if (
+            key.dtype.kind in "iub"
+            and key.size
+            and key.min() >= 0
+            and key.max() < _DENSE_CODES_PER_ROW * key.size + 1
+        ):
+            # Small non-negative integers are their own codes, so only the values that occur need to be found.
+            present = np.bincount(key) > 0
+            values = np.flatnonzero(present).astype(key.dtype)
+            codes = (np.cumsum(present) - 1)[key]
+        else:
+            values, codes = np.unique(key, return_inverse=True)
+            codes = codes.ravel()
+
+    if codes.size != n_rows:
+        raise Exception(
+            f"Each group key should have one value per prediction, not {codes.size} for {n_rows} predictions"
+        )
+    return codes, values
+
+
+def grouped_confidence_intervals(
+    groups,
+    y_true=None,
+    y_pred=None,
+    correct=None,
+    confidence_level: float = 0.95,
+    method: str = "holdout",
+    n_splits: int = None,
+) -> dict:
+    """
+    Computes accuracy confidence intervals of every group (segment) of an evaluation table at once. Predictions are
+    counted per group in a single pass with np.bincount, and the intervals of all groups are then computed with one
+    vectorized call of the selected method, so the cost is nearly independent of the number of groups.
+
+    Parameters
+    ----------
+    groups : array-like, tuple, or dict
+        Group key(s) of each prediction. Either a single key array, a tuple of key arrays, or a dict mapping column
+        names to key arrays. Keys can be integers, strings, or pandas categoricals; missing categorical values are
+        skipped.
+    y_true : array-like
+        Optional. True labels. Used together with y_pred when correct is not given.
+    y_pred : array-like
+        Optional. Predicted labels.
+    correct : array-like
+        Optional. Whether each prediction was correct (True/False or 0/1).
+    confidence_level : float
+        Confidence level. Should be between 0 and 1. Default: 0.95.
+    method : str
+        Name of a registered method that computes intervals from a single accuracy, e.g., 'holdout',
+        'holdout_wilson', 'holdout_clopper_pearson', 'cv'. Default: 'holdout'.
+    n_splits : int
+        Optional. Number of folds used in cross validation. Required when method is 'cv'.
+
+    Returns a dict of arrays with one element per non-empty group, sorted by the group keys: the key columns (named
+    'group' for a single key, 'group_0', 'group_1', ... for a tuple of keys, or after the dict keys), 'n', 'accuracy',
+    'low', and 'high'.
+    """
+    spec = get_method(method, "interval")
+    if spec.uses_replicates:
+        raise Exception(
+            f'Method "{method}" needs bootstrap accuracies and cannot be used for grouped intervals.'
+        )
+    spec.check_n_splits(n_splits)
+
+    if correct is None:
+        _correct_predictions(y_true, y_pred, None, allow_empty=True)
+        correct = np.asarray(y_true).ravel() == np.asarray(y_pred).ravel()
+    else:
+        _correct_predictions(None, None, correct, allow_empty=True)
+        correct = np.asarray(correct).ravel()
+
+    if isinstance(groups, dict):
+        names, keys = list(groups), list(groups.values())
+    elif isinstance(groups, tuple):
+        names, keys = [f"group_{i}" for i in range(len(groups))], list(groups)
+    else:
+        names, keys = ["group"], [groups]
+    if not keys:
+        raise Exception("Provide at least one group key.")
+
+    codes, values = zip(*(_group_codes(key, correct.size) for key in keys))
+    dims = tuple(max(len(v), 1) for v in values)
+    missing = np.zeros(correct.size, dtype=bool)
+    for c in codes:
+        missing |= c < 0
+    if missing.any():
+        codes = tuple(c[~missing] for c in codes)
+        correct = correct[~missing]
+
+    # Keys are combined progressively into row-major codes, which keep the groups sorted lexicographically by their
+    # keys. Whenever the next key would make the range of codes too sparse, the partial codes are first compacted
+    # with np.unique, so that the codes never overflow however many distinct values the keys have.
+    limit = _DENSE_CODES_PER_ROW * correct.size + 1
+    combined, n_codes = codes[0], dims[0]
+    for key_codes, dim in zip(codes[1:], dims[1:]):
+        if n_codes * dim > limit:
+            unique_codes, combined = np.unique(combined, return_inverse=True)
+            combined, n_codes = combined.ravel(), unique_codes.size
+        combined = combined * dim + key_codes
+        n_codes *= dim
+
+    if n_codes <= limit:
+        counts = np.bincount(combined, minlength=n_codes)
+        present = np.flatnonzero(counts)
+        counts = counts[present]
+        n_correct = np.bincount(combined, weights=correct, minlength=n_codes)[present]
+        # Index of one row of each group, from which the key values of the group are taken.
+        first = np.zeros(n_codes, dtype=np.intp)
+        first[combined[::-1]] = np.arange(combined.size - 1, -1, -1)
+        first = first[present]
+    else:
+        present, first, combined = np.unique(
+            combined, return_index=True, return_inverse=True
+        )
+        combined = combined.ravel()
+        counts = np.bincount(combined, minlength=present.size)
+        n_correct = np.bincount(combined, weights=correct, minlength=present.size)
+
+    table = {}
+    for name, key_values, key_codes in zip(names, values, codes):
+        table[name] = key_values[key_codes[first]]
+    accuracy = n_correct / np.maximum(counts, 1)
+    table["n"] = counts
+    table["accuracy"] = accuracy
+
+    if spec.supports("interval", batch=True):
+        low, high = spec.kernel("interval", batch=True)(
+            counts, accuracy, confidence_level, n_splits
+        )
+    else:
+        kernel = spec.kernel("interval")
+        low, high = np.empty(counts.size), np.empty(counts.size)
+        for i, (n, acc) in enumerate(zip(counts.tolist(), accuracy.tolist())):
+            low[i], high[i] = kernel(n, acc, confidence_level, n_splits)
+    table["low"] = np.broadcast_to(low, counts.shape).astype(float)
+    table["high"] = np.broadcast_to(high, counts.shape).astype(float)
+    return table
@@ -0,0 +1,442 @@
+import contextlib
+import contextvars
+import functools
+import inspect
+import json
+import math
+import re
+import sys
+import threading
+import time
+
+import numpy as np
+
+from .confidence_planner import BatchValidationError
+
+__all__ = [
+    "Instrumentation",
+    "disable_instrumentation",
+    "enable_instrumentation",
+    "instrument",
+    "is_instrumented",
+]
+
+# Public functions whose names match this pattern, or are listed in _INSTRUMENTED_NAMES, are instrumented.
+_INSTRUMENTED_PATTERN = re.compile(
+    r"^estimate_|_(ci|sample_size|confidence_level)(_batch|_from_counts)?$"
+)
+_INSTRUMENTED_NAMES = (
+    "bootstrap_accuracies",
+    "build_planning_table",
+    "grouped_confidence_intervals",
+    "sequential_evaluation",
+)
+
+# Latency histogram buckets are spaced logarithmically, with _BUCKETS_PER_DECADE buckets per power of ten, from
+# 10 ** _MIN_EXPONENT seconds up to 10 ** _MAX_EXPONENT seconds.
+_BUCKETS_PER_DECADE = 8
+_MIN_EXPONENT = -7
+_MAX_EXPONENT = 3
+_N_BUCKETS = (_MAX_EXPONENT - _MIN_EXPONENT) * _BUCKETS_PER_DECADE + 1
+_PERCENTILES = (50, 90, 99)
+
+# Recorders enabled with enable_instrumentation record calls from the whole process, while recorders of instrument
+# blocks only record calls made in the context that entered the block. The functions stay patched while there is at
+# least one recorder of either kind.
+_ACTIVE = []
+_SCOPED = contextvars.ContextVar("confidence_planner_instrumentation", default=())
+_N_SCOPED = 0
+_ORIGINALS = {}
+_LOCK = threading.Lock()
+
+
+class _Statistics:
+    __slots__ = (
+        "calls",
+        "errors",
+        "invalid_elements",
+        "total_seconds",
+        "min_seconds",
+        "max_seconds",
+        "items",
+        "max_batch_size",
+        "histogram",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.invalid_elements = 0
+        self.total_seconds = 0.0
+        self.min_seconds = math.inf
+        self.max_seconds = 0.0
+        self.items = 0
+        self.max_batch_size = 0
+        self.histogram = [0] * _N_BUCKETS
+
+    def add(self, seconds, batch_size, error):
+        self.calls += 1
+        self.total_seconds += seconds
+        self.min_seconds = seconds if seconds < self.min_seconds else self.min_seconds
+        self.max_seconds = seconds if seconds > self.max_seconds else self.max_seconds
+        self.items += batch_size
+        if batch_size > self.max_batch_size:
+            self.max_batch_size = batch_size
+        if error is not None:
+            self.errors += 1
+            if isinstance(error, BatchValidationError):
+                self.invalid_elements += int(error.indices.size)
+        bucket = (
+            math.ceil((math.log10(seconds) - _MIN_EXPONENT) * _BUCKETS_PER_DECADE)
+            if seconds > 0
+            else 0
+        )
+        self.histogram[min(max(bucket, 0), _N_BUCKETS - 1)] += 1
+
+    def merge(self, other):
+        self.calls += other.calls
+        self.errors += other.errors
+        self.invalid_elements += other.invalid_elements
+        self.total_seconds += other.total_seconds
+        self.min_seconds = min(self.min_seconds, other.min_seconds)
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+        self.items += other.items
+        self.max_batch_size = max(self.max_batch_size, other.max_batch_size)
+        self.histogram = [a + b for a, b in zip(self.histogram, other.histogram)]
+
+    def percentile(self, q):
+        # Upper bound of the histogram bucket containing the q-th percentile, capped by the largest observed latency.
+        rank = q / 100 * self.calls
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if count and seen >= rank:
+                upper = 10 ** (_MIN_EXPONENT + bucket / _BUCKETS_PER_DECADE)
+                return min(upper, self.max_seconds)
+        return self.max_seconds
+
+    def to_dict(self):
+        values = {
+            "calls": self.calls,
+            "errors": self.errors,
+            "invalid_elements": self.invalid_elements,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.calls if self.calls else None,
+            "min_seconds": self.min_seconds if self.calls else None,
+            "max_seconds": self.max_seconds if self.calls else None,
+        }
+        for q in _PERCENTILES:
+            values[f"p{q}_seconds"] = self.percentile(q) if self.calls else None
+        values["items"] = self.items
+        values["max_batch_size"] = self.max_batch_size
+        return values
+
+
+class Instrumentation:
+    """
+    Collects call counts, latency statistics, input batch sizes, and validation failures of the estimation functions
+    of the package. Statistics are kept per function and, for functions with a method parameter (such as the
+    estimate_* wrappers), per function and method. Calls of nested functions are recorded separately, e.g.,
+    estimate_confidence_interval with the 'holdout' method also records a wilson_ci call.
+
+    Latency percentiles are estimated from a logarithmic histogram with 8 buckets per power of ten, so they are
+    accurate to about 33%.
+
+    Parameters
+    ----------
+    callback : callable
+        Optional. Called after every recorded call with a dict with the 'function', 'method', 'seconds',
+        'batch_size', and 'error' (None or the exception message) of the call, e.g., to forward events to a metrics
+        collector. It is called in the thread that made the call and should be fast.
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self._functions = {}
+        self._methods = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        calls = sum(stats.calls for stats in self._functions.values())
+        return f"Instrumentation(functions={len(self._functions)}, calls={calls})"
+
+    def record(
+        self,
+        function: str,
+        seconds: float,
+        method: str = None,
+        batch_size: int = 1,
+        error: Exception = None,
+    ):
+        """
+        Records a single call.
+
+        Parameters
+        ----------
+        function : str
+            Name of the called function.
+        seconds : float
+            Duration of the call.
+        method : str
+            Optional. Evaluation method the function was called with.
+        batch_size : int
+            Number of input elements. Default: 1.
+        error : Exception
+            Optional. Exception raised by the call.
+        """
+        with self._lock:
+            stats = self._functions.get(function)
+            if stats is None:
+                stats = self._functions[function] = _Statistics()
+            stats.add(seconds, batch_size, error)
+            if method is not None:
+                key = (function, method)
+                stats = self._methods.get(key)
+                if stats is None:
+                    stats = self._methods[key] = _Statistics()
+                stats.add(seconds, batch_size, error)
+
+        if self.callback is not None:
+            self.callback(
+                {
+                    "function": function,
+                    "method": method,
+                    "seconds": seconds,
+                    "batch_size": batch_size,
+                    "error": None if error is None else str(error),
+                }
+            )
+
+    def reset(self):
+        """
+        Removes all recorded statistics.
+        """
+        with self._lock:
+            self._functions.clear()
+            self._methods.clear()
+        return self
+
+    def to_dict(self) -> dict:
+        """
+        Returns the recorded statistics as a dict with 'functions', which maps function names to their statistics,
+        and 'methods', which maps 'function[method]' keys to the statistics of calls with that method. The
+        statistics are 'calls', 'errors' (calls that raised an exception), 'invalid_elements' (invalid array
+        elements reported by vectorized validation), 'total_seconds', 'mean_seconds', 'min_seconds', 'max_seconds',
+        'p50_seconds', 'p90_seconds', 'p99_seconds', 'items' (total input elements), and 'max_batch_size'.
+        """
+        with self._lock:
+            return {
+                "functions": {
+                    name: stats.to_dict()
+                    for name, stats in sorted(self._functions.items())
+                },
+                "methods": {
+                    f"{function}[{method}]": stats.to_dict()
+                    for (function, method), stats in sorted(self._methods.items())
+                },
+            }
+
+    def to_json(self, **kwargs) -> str:
+        """
+        Returns the statistics of to_dict as a JSON string. Keyword arguments are passed to json.dumps.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def merge(self, other: "Instrumentation"):
+        """
+        Adds the statistics recorded by another instrumentation object, e.g., from another process.
+
+        Parameters
+        ----------
+        other : Instrumentation
+            Instrumentation object to merge.
+        """
+        with self._lock:
+            for target, source in (
+                (self._functions, other._functions),
+                (self._methods, other._methods),
+            ):
+                for key, stats in source.items():
+                    target.setdefault(key, _Statistics()).merge(stats)
+        return self
+
+
+def _batch_size(args, kwargs):
+    size = 1
+    for value in args + tuple(kwargs.values()):
+        if isinstance(value, np.ndarray):
+            size = max(size, value.size)
+        elif isinstance(value, (list, tuple)):
+            size = max(size, len(value))
+        elif isinstance(value, dict) and value:
+            # Tables of requests, as taken by estimate_batch
+            size = max(size, max(np.size(column) for column in value.values()))
+    return size
+
+
+def _instrumented(function):
+    name = function.__name__
+    parameters = list(inspect.signature(function).parameters.values())
+    names = [parameter.name for parameter in parameters]
+    if "method" in names:
+        method_index = names.index("method")
+        method_default = parameters[method_index].default
+    else:
+        method_index = None
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        error = None
+        try:
+            return function(*args, **kwargs)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            method = None
+            if method_index is not None:
+                if "method" in kwargs:
+                    method = kwargs["method"]
+                elif len(args) > method_index:
+                    method = args[method_index]
+                else:
+                    method = method_default
+                method = method if isinstance(method, str) else None
+            batch_size = _batch_size(args, kwargs)
+            recorders = list(_ACTIVE)
+            recorders += [r for r in _SCOPED.get() if r not in recorders]
+            for recorder in recorders:
+                recorder.record(name, seconds, method, batch_size, error)
+
+    wrapper.__wrapped_original__ = function
+    return wrapper
+
+
+def _package_modules():
+    package = __name__.rsplit(".", 1)[0]
+    return [
+        module
+        for module_name, module in list(sys.modules.items())
+        if module is not None
+        and (module_name == package or module_name.startswith(package + "."))
+    ]
+
+
+def _patch():
+    # Replaces every reference to an instrumented function in the modules of the package with a timed wrapper, so that
+    # calls through the package namespace, between modules, and from the registered method kernels are recorded. The
+    # lazily imported submodules are loaded first, so that their functions are patched as well.
+    sys.modules[__name__.rsplit(".", 1)[0]]._load_lazy_modules()
+    modules = _package_modules()
+    wrappers = {}
+    for module in modules:
+        for attribute, value in list(vars(module).items()):
+            if (
+                inspect.isfunction(value)
+                and not attribute.startswith("_")
+                and value.__module__.startswith(__name__.rsplit(".", 1)[0])
+                and (
+                    attribute in _INSTRUMENTED_NAMES
+                    or _INSTRUMENTED_PATTERN.search(attribute)
+                )
+            ):
+                if value not in wrappers:
+                    wrappers[value] = _instrumented(value)
+                _ORIGINALS[(module.__name__, attribute)] = (value, wrappers[value])
+                setattr(module, attribute, wrappers[value])
+
+
+def _unpatch():
+    # Attributes replaced by someone else in the meantime (e.g., with unittest.mock) are left alone.
+    for (module_name, attribute), (original, wrapper) in _ORIGINALS.items():
+        module = sys.modules.get(module_name)
+        if module is not None and getattr(module, attribute, None) is wrapper:
+            setattr(module, attribute, original)
+    _ORIGINALS.clear()
+
+
+def enable_instrumentation(recorder: Instrumentation = None) -> Instrumentation:
+    """
+    Starts recording calls of the estimation functions made anywhere in the process, from any thread, into recorder
+    (a new Instrumentation object by default) and returns it. Several recorders can be active at the same time. Use
+    instrument to record only the calls of the current thread or task.
+
+    Instrumentation works by replacing the functions in the modules of the package with timed wrappers while at least
+    one recorder is active, so disabled instrumentation adds no overhead at all. Only calls made through the package
+    (e.g., confidence_planner.wilson_ci or estimate_confidence_interval) are recorded; references imported with
+    "from confidence_planner import wilson_ci" before instrumentation was enabled call the original function. Calls in
+    worker processes of estimate_batch are not recorded. Enabling instrumentation imports every submodule of the
+    package except plotting.
+
+    Parameters
+    ----------
+    recorder : Instrumentation
+        Optional. Object that collects the statistics.
+    """
+    recorder = Instrumentation() if recorder is None else recorder
+    with _LOCK:
+        if not _ACTIVE and not _N_SCOPED:
+            _patch()
+        if recorder not in _ACTIVE:
+            _ACTIVE.append(recorder)
+    return recorder
+
+
+def disable_instrumentation(recorder: Instrumentation = None):
+    """
+    Stops recording into recorder, or into all recorders started with enable_instrumentation when recorder is None.
+    When no recorder remains active, the original functions are restored.
+
+    Parameters
+    ----------
+    recorder : Instrumentation
+        Optional. Recorder to deactivate.
+    """
+    with _LOCK:
+        if recorder is None:
+            _ACTIVE.clear()
+        elif recorder in _ACTIVE:
+            _ACTIVE.remove(recorder)
+        if not _ACTIVE and not _N_SCOPED:
+            _unpatch()
+
+
+def is_instrumented() -> bool:
+    """
+    Returns True when at least one instrumentation recorder is active.
+    """
+    return bool(_ACTIVE) or _N_SCOPED > 0
+
+
+@contextlib.contextmanager
+def instrument(callback=None, recorder: Instrumentation = None):
+    """
+    Context manager that records calls of the estimation functions made inside the block, in the thread or asyncio
+    task that entered it (and in tasks started from it, which inherit its context). The functions are patched for the
+    whole process while the block is open, but calls made concurrently by other threads are not recorded. See
+    enable_instrumentation for details.
+
+    Parameters
+    ----------
+    callback : callable
+        Optional. Called with a dict describing every recorded call, see Instrumentation.
+    recorder : Instrumentation
+        Optional. Object that collects the statistics. By default a new one is created.
+    """
+    global _N_SCOPED
+    recorder = Instrumentation(callback) if recorder is None else recorder
+    with _LOCK:
+        if not _ACTIVE and not _N_SCOPED:
+            _patch()
+        _N_SCOPED += 1
+    token = _SCOPED.set(_SCOPED.get() + (recorder,))
+    try:
+        yield recorder
+    finally:
+        _SCOPED.reset(token)
+        with _LOCK:
+            _N_SCOPED -= 1
+            if not _ACTIVE and not _N_SCOPED:
+                _unpatch()
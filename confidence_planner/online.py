@@ -0,0 +1,166 @@
+import struct
+
+from .bootstrap import _correct_predictions
+from .registry import get_method
+from .results import Interval
+
+__all__ = ["OnlineEvaluator"]
+
+_EVALUATOR_MAGIC = b"CPOE"
+_EVALUATOR_VERSION = 1
+# Fixed 64-byte record: magic, version, counts, confidence level, and the method name padded with zero bytes.
+_EVALUATOR_HEADER = struct.Struct("<4sBQQd32s3x")
+_METHOD_NAME_SIZE = 32
+
+
+class OnlineEvaluator:
+    """
+    Streaming accuracy tracker for progressive validation (test-then-train) and other online evaluation settings.
+
+    Predictions are added one at a time or in mini-batches. Only the number of predictions and the number of correct
+    predictions are stored, so memory is constant and the current interval is computed in O(1) from these sufficient
+    statistics, without re-scanning the history. Evaluators that observed disjoint parts of a stream (e.g., in
+    separate processes) can be combined with merge, and their state can be saved and restored with to_bytes /
+    from_bytes.
+
+    Parameters
+    ----------
+    confidence_level : float
+        Confidence level of the reported intervals. Should be between 0 and 1. Default: 0.95.
+    method : str
+        Interval method. Any registered method that takes a single accuracy and no cross-validation folds can be used,
+        e.g., 'progressive', 'holdout_wilson', 'holdout_clopper_pearson'. Default: 'progressive', which uses
+        Langford's approximation.
+    """
+
+    def __init__(self, confidence_level: float = 0.95, method: str = "progressive"):
+        if confidence_level <= 0 or confidence_level >= 1:
+            raise Exception(
+                f'Confidence level should be between 0 and 1, not "{confidence_level}".'
+            )
+        spec = get_method(method, "interval")
+        if spec.requires_n_splits or spec.uses_replicates:
+            raise Exception(
+                f'Method "{method}" cannot be used for online evaluation. Use a holdout or the progressive method.'
+            )
+
+        self.confidence_level = confidence_level
+        self.method = method
+        self.n = 0
+        self.n_correct = 0
+        self._kernel = spec.kernel("interval")
+
+    def __repr__(self):
+        return (
+            f"OnlineEvaluator(n={self.n}, n_correct={self.n_correct}, confidence_level={self.confidence_level!r}, "
+            f"method={self.method!r})"
+        )
+
+    @property
+    def accuracy(self) -> float:
+        """
+        Accuracy of all predictions added so far.
+        """
+        if self.n == 0:
+            raise Exception("No predictions were added to the evaluator yet.")
+        return self.n_correct / self.n
+
+    def update(self, y_true=None, y_pred=None, correct=None):
+        """
+        Adds a single prediction or a mini-batch of predictions.
+
+        Parameters
+        ----------
+        y_true : label or array-like
+            Optional. True label(s). Used together with y_pred when correct is not given.
+        y_pred : label or array-like
+            Optional. Predicted label(s).
+        correct : bool or array-like
+            Optional. Whether each prediction was correct.
+        """
+        if correct.__class__ is bool and y_true is None:
+            # Fast path for a single prediction, which is the typical case at event rate.
+            self.n += 1
+            self.n_correct += correct
+            return self
+
+        n_correct, n = _correct_predictions(y_true, y_pred, correct, allow_empty=True)
+        self.n += n
+        self.n_correct += n_correct
+        return self
+
+    def interval(self, confidence_level: float = None) -> Interval:
+        """
+        Returns the confidence interval of the accuracy of all predictions added so far.
+
+        Parameters
+        ----------
+        confidence_level : float
+            Optional. Overrides the confidence level given in the constructor.
+        """
+        if self.n == 0:
+            raise Exception("No predictions were added to the evaluator yet.")
+        if confidence_level is None:
+            confidence_level = self.confidence_level
+        return self._kernel(self.n, self.n_correct / self.n, confidence_level, None)
+
+    def merge(self, other: "OnlineEvaluator"):
+        """
+        Adds the predictions tracked by another evaluator to this one.
+
+        Parameters
+        ----------
+        other : OnlineEvaluator
+            Evaluator that observed a disjoint set of predictions.
+        """
+        self.n += other.n
+        self.n_correct += other.n_correct
+        return self
+
+    def reset(self):
+        """
+        Removes all tracked predictions.
+        """
+        self.n = 0
+        self.n_correct = 0
+        return self
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the evaluator state into a compact binary representation, e.g., for checkpointing.
+        """
+        method = self.method.encode("utf8")
+        if len(method) > _METHOD_NAME_SIZE:
+            raise Exception(
+                f'Method name "{self.method}" is too long to be serialized, it should have at most '
+                f"{_METHOD_NAME_SIZE} bytes in UTF-8."
+            )
+        return _EVALUATOR_HEADER.pack(
+            _EVALUATOR_MAGIC,
+            _EVALUATOR_VERSION,
+            self.n,
+            self.n_correct,
+            self.confidence_level,
+            method,
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "OnlineEvaluator":
+        """
+        Restores an evaluator serialized with to_bytes.
+
+        Parameters
+        ----------
+        data : bytes
+            Serialized evaluator.
+        """
+        magic, version, n, n_correct, confidence_level, method = (
+            _EVALUATOR_HEADER.unpack_from(data)
+        )
+        if magic != _EVALUATOR_MAGIC or version != _EVALUATOR_VERSION:
+            raise Exception("Data does not contain a serialized online evaluator.")
+
+        evaluator = cls(confidence_level, method.rstrip(b"\0").decode("utf8"))
+        evaluator.n = n
+        evaluator.n_correct = n_correct
+        return evaluator
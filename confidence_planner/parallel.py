@@ -0,0 +1,236 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from .confidence_planner import BatchValidationError
+from .registry import N_SPLITS_MESSAGE, get_method
+
+__all__ = ["estimate_batch"]
+
+# Default number of rows evaluated by a single task.
+BATCH_CHUNK_SIZE = 100000
+
+# Input columns of each kind of request, with their default values. The column order follows the calling convention
+# of the registered kernels.
+_COLUMNS = {
+    "interval": (
+        ("sample_size", None),
+        ("accuracy", None),
+        ("confidence_level", None),
+        ("n_splits", 0),
+    ),
+    "sample_size": (
+        ("interval_radius", None),
+        ("confidence_level", None),
+        ("n_splits", 0),
+        ("accuracy", 0.5),
+    ),
+    "confidence_level": (
+        ("sample_size", None),
+        ("interval_radius", None),
+        ("n_splits", 0),
+        ("accuracy", 0.5),
+    ),
+}
+_OUTPUTS = {
+    "interval": ("low", "high"),
+    "sample_size": ("sample_size",),
+    "confidence_level": ("confidence_level",),
+}
+_N_SPLITS_COLUMN = {
+    kind: [name for name, _ in columns].index("n_splits")
+    for kind, columns in _COLUMNS.items()
+}
+
+
+def _scalar_value(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _evaluate_rows(kind, spec, columns):
+    # Evaluates rows one at a time, so that errors can be attributed to individual rows.
+    n_rows = len(columns[0])
+    values = [np.full(n_rows, np.nan) for _ in _OUTPUTS[kind]]
+    errors = []
+    kernel = spec.kernel(kind)
+    for i in range(n_rows):
+        # n_splits values of 0 stand for a missing parameter
+        row = [_scalar_value(column[i]) for column in columns]
+        row = [
+            None if name == "n_splits" and not value else value
+            for (name, _), value in zip(_COLUMNS[kind], row)
+        ]
+        try:
+            spec.check_n_splits(row[_N_SPLITS_COLUMN[kind]])
+            result = kernel(*row)
+        except Exception as e:
+            errors.append((i, str(e)))
+            continue
+        result = result if isinstance(result, (list, tuple)) else [result]
+        for value, output in zip(values, result):
+            value[i] = output
+
+    return values, errors
+
+
+def _evaluate_batch(kind, spec, columns):
+    numeric = [np.asarray(column, dtype=float) for column in columns]
+    n_rows = numeric[0].size
+    kernel = spec.kernel(kind, batch=True)
+    valid = np.ones(n_rows, dtype=bool)
+    errors = []
+    if spec.requires_n_splits:
+        # Rows without a valid number of folds are reported individually, so that the other rows of the chunk are
+        # still evaluated with the vectorized kernel.
+        valid = numeric[_N_SPLITS_COLUMN[kind]] > 1
+        errors.extend((int(i), N_SPLITS_MESSAGE) for i in np.flatnonzero(~valid))
+    while True:
+        rows = np.flatnonzero(valid)
+        if rows.size == 0:
+            values = [np.empty(0) for _ in _OUTPUTS[kind]]
+            break
+        try:
+            values = kernel(*[column[rows] for column in numeric])
+            if kind != "interval":
+                values = (values,)
+            break
+        except BatchValidationError as e:
+            # Rows rejected by a vectorized check are reported and removed, and the remaining rows are evaluated again.
+            if e.shape != rows.shape:
+                raise
+            errors.extend((int(i), e.reason) for i in rows[e.indices])
+            valid[rows[e.indices]] = False
+
+    outputs = [np.full(n_rows, np.nan) for _ in _OUTPUTS[kind]]
+    for output, value in zip(outputs, values):
+        output[rows] = value
+    return outputs, sorted(errors)
+
+
+def _evaluate_chunk(kind, method, columns):
+    try:
+        spec = get_method(method, kind)
+    except Exception as e:
+        return [np.full(len(columns[0]), np.nan) for _ in _OUTPUTS[kind]], [
+            (i, str(e)) for i in range(len(columns[0]))
+        ]
+
+    if spec.supports(kind, batch=True):
+        try:
+            return _evaluate_batch(kind, spec, columns)
+        except Exception:
+            # Rows are re-evaluated individually to attribute the error to the rows that caused it.
+            pass
+    return _evaluate_rows(kind, spec, columns)
+
+
+def _column(requests, name, default, n_rows):
+    if name in requests:
+        column = requests[name]
+        return column if isinstance(column, list) else np.asarray(column)
+    if default is None:
+        raise Exception(f'The requests do not contain the required "{name}" column.')
+    return np.full(n_rows, default)
+
+
+def estimate_batch(
+    requests,
+    kind: str = "interval",
+    backend: str = "thread",
+    n_jobs: int = None,
+    chunk_size: int = BATCH_CHUNK_SIZE,
+) -> dict:
+    """
+    Evaluates a table of estimation requests in parallel. Rows are grouped by method and split into chunks, so that
+    each chunk is evaluated with a single vectorized kernel where one is available. The chunks are run on a thread or
+    process pool. Results are returned in input order, and rows that cannot be evaluated get an error message instead
+    of stopping the whole batch.
+
+    Parameters
+    ----------
+    requests : dict or DataFrame
+        Table of requests with one column per parameter. For kind='interval' the columns are sample_size, accuracy,
+        confidence_level, and optionally n_splits and method. For kind='sample_size' they are interval_radius,
+        confidence_level, and optionally n_splits, method, and accuracy. For kind='confidence_level' they are
+        sample_size, interval_radius, and optionally n_splits, method, and accuracy. The method column defaults to
+        'holdout' and accepts the names of all registered methods. Rows of methods with vectorized kernels are
+        evaluated in bulk, the others row by row. For the 'bootstrap' method the accuracy column should contain lists
+        of bootstrap accuracies.
+    kind : str
+        Type of the estimate. One of 'interval', 'sample_size', 'confidence_level'. Default: 'interval'.
+    backend : str
+        Executor used to run the chunks. One of 'thread', 'process', 'serial'. Default: 'thread'.
+    n_jobs : int
+        Optional. Number of workers. Default: the number of CPUs.
+    chunk_size : int
+        Maximum number of rows evaluated by a single task. Default: 100000.
+
+    Returns a dict with one array per output ('low' and 'high' for intervals, 'sample_size', or 'confidence_level')
+    and an 'error' array containing None for successful rows and an error message otherwise.
+    """
+    if kind not in _COLUMNS:
+        raise Exception(
+            f"Unknown estimate kind \"{kind}\". Should be one of: 'interval', 'sample_size', 'confidence_level'."
+        )
+    if backend not in ("thread", "process", "serial"):
+        raise Exception(
+            f"Unknown backend \"{backend}\". Should be one of: 'thread', 'process', 'serial'."
+        )
+    if chunk_size <= 0:
+        raise Exception(
+            f'Chunk size must be an integer greater than 0, not "{chunk_size}"'
+        )
+
+    first = _COLUMNS[kind][0][0]
+    if first not in requests:
+        raise Exception(f'The requests do not contain the required "{first}" column.')
+    n_rows = len(requests[first])
+    columns = [
+        _column(requests, name, default, n_rows) for name, default in _COLUMNS[kind]
+    ]
+    methods = np.asarray(_column(requests, "method", "holdout", n_rows), dtype=str)
+
+    tasks = []
+    for method in np.unique(methods):
+        indices = np.flatnonzero(methods == method)
+        for start in range(0, indices.size, chunk_size):
+            chunk = indices[start : start + chunk_size]
+            chunk_columns = [
+                (
+                    [column[i] for i in chunk]
+                    if isinstance(column, list)
+                    else column[chunk]
+                )
+                for column in columns
+            ]
+            tasks.append((chunk, str(method), chunk_columns))
+
+    if backend == "serial" or n_jobs == 1 or len(tasks) <= 1:
+        results = [_evaluate_chunk(kind, method, cols) for _, method, cols in tasks]
+    else:
+        executor_class = (
+            ThreadPoolExecutor if backend == "thread" else ProcessPoolExecutor
+        )
+        with executor_class(max_workers=n_jobs or os.cpu_count()) as executor:
+            futures = [
+                executor.submit(_evaluate_chunk, kind, method, cols)
+                for _, method, cols in tasks
+            ]
+            results = [future.result() for future in futures]
+
+    dtype = np.int64 if kind == "sample_size" else float
+    outputs = {name: np.zeros(n_rows, dtype=dtype) for name in _OUTPUTS[kind]}
+    errors = np.full(n_rows, None, dtype=object)
+    for (chunk, _, _), (values, chunk_errors) in zip(tasks, results):
+        for name, value in zip(_OUTPUTS[kind], values):
+            outputs[name][chunk] = np.nan_to_num(value) if dtype is np.int64 else value
+        for i, message in chunk_errors:
+            errors[chunk[i]] = message
+            for name in _OUTPUTS[kind]:
+                outputs[name][chunk[i]] = 0 if dtype is np.int64 else np.nan
+
+    outputs["error"] = errors
+    return outputs
@@ -0,0 +1,218 @@
+import io
+
+import numpy as np
+import matplotlib.patches as mpatches
+from matplotlib.figure import Figure
+
+from .registry import get_method
+
+__all__ = ["plot_classifier_intervals", "render_classifier_intervals"]
+
+COLORS = [
+    "#03045E",
+    "#023E8A",
+    "#0077B6",
+    "#0096C7",
+    "#00B4D8",
+    "#48CAE4",
+    "#90E0EF",
+    "#ADE8F4",
+]
+
+
+def _classifier_intervals(sizes, accuracies, method, confidence_level, n_splits):
+    # Returns the point accuracies and the lower and upper bounds of all classifiers for one confidence level.
+    spec = get_method(method, "interval")
+    spec.check_n_splits(n_splits)
+    if spec.uses_replicates:
+        kernel = spec.kernel("interval")
+        bounds = np.array(
+            [
+                kernel(size, acc, confidence_level, n_splits)
+                for size, acc in zip(sizes, accuracies)
+            ],
+            dtype=float,
+        ).reshape(-1, 2)
+        means = np.array([np.mean(acc) for acc in accuracies], dtype=float)
+        return means, bounds[:, 0], bounds[:, 1]
+
+    sizes = np.asarray(sizes, dtype=float)
+    means = np.asarray(accuracies, dtype=float)
+    if spec.supports("interval", batch=True):
+        low, high = spec.kernel("interval", batch=True)(
+            sizes, means, confidence_level, n_splits
+        )
+    else:
+        kernel = spec.kernel("interval")
+        bounds = np.array(
+            [
+                kernel(size, acc, confidence_level, n_splits)
+                for size, acc in zip(sizes.tolist(), means.tolist())
+            ],
+            dtype=float,
+        ).reshape(-1, 2)
+        low, high = bounds[:, 0], bounds[:, 1]
+    return means, np.broadcast_to(low, means.shape), np.broadcast_to(high, means.shape)
+
+
+def _draw_classifier_intervals(
+    ax, names, sizes, accuracies, method, confidence_levels, n_splits, xlab
+):
+    levels = sorted(confidence_levels)
+    positions = np.arange(len(names)) * 0.5
+
+    means = None
+    # Wider intervals are drawn first, so that the thicker bars of lower confidence levels stay visible on top. Each
+    # level is a single errorbar artist for all classifiers.
+    for j in range(len(levels) - 1, -1, -1):
+        conf = levels[j]
+        means, low, high = _classifier_intervals(
+            sizes, accuracies, method, conf, n_splits
+        )
+        ax.errorbar(
+            means,
+            positions,
+            xerr=np.maximum([means - low, high - means], 0.0),
+            fmt="none",
+            ecolor=COLORS[j],
+            elinewidth=(1 - conf) * 100,
+            capsize=3 * len(levels) - j,
+            capthick=1.5,
+        )
+    if means is not None:
+        ax.plot(
+            means,
+            positions,
+            "o",
+            color="#ee6c4d",
+            mew=4,
+            markersize=5,
+            zorder=3,
+        )
+
+    ax.tick_params(axis="x", labelsize=14)
+    ax.set_yticks(positions, labels=list(names), fontsize=14)
+    ax.set_xlabel(xlab, fontsize=16, labelpad=10)
+    ax.legend(
+        handles=[
+            mpatches.Patch(color=COLORS[j], label=f"{conf * 100:.0f}%")
+            for j, conf in enumerate(levels)
+        ][::-1],
+        loc="center left",
+        bbox_to_anchor=(1, 0.5),
+        fontsize=14,
+        title_fontsize=14,
+        title="Confidence level:",
+    )
+
+
+def plot_classifier_intervals(
+    names,
+    sizes,
+    accuracies,
+    method,
+    confidence_levels=[0.9, 0.95, 0.98],
+    n_splits=None,
+    xlab="Accuracy",
+    width=12,
+    height=4,
+):
+    """
+    Plots graded confidence intervals of the accuracies of several classifiers, one row per classifier. The intervals
+    of all classifiers are computed with one vectorized call per confidence level, and each level is drawn as a single
+    artist, so leaderboards of hundreds of models render quickly. The figure is created with pyplot, so it can be
+    shown interactively; use render_classifier_intervals to export plots without pyplot.
+
+    Parameters
+    ----------
+    names : list
+        Names of classifiers the error bars will be plotted.
+    sizes : list
+        Sample sizes for estimating confidence intervals.
+    accuracies : list
+        Accuracies for each classifier.
+    method : str
+        Evaluation method. Parameter used to determine the confidence interval approximation method. Should be one of:
+        'holdout', 'holdout_wilson', 'holdout_langford', 'holdout_clopper_pearson', 'holdout_z_test', 'holdout_t_test',
+        'bootstrap', 'cv', 'progressive'. When 'holdout' uses the 'holdout_wilson' approximation.
+    confidence_levels : list
+        Desired confidence levels, for which graded error bars will be plotted.
+    n_splits : int
+        Optional. Number of folds used in cross validation. Ignored when method is different than 'cv'.
+    xlab: str
+        X-axis label.
+    width: int
+        Plot width in inches.
+    height: int
+        Plot height in inches.
+    """
+    import matplotlib.pyplot as plt
+
+    f = plt.figure(figsize=(width, height))
+    _draw_classifier_intervals(
+        f.add_subplot(),
+        names,
+        sizes,
+        accuracies,
+        method,
+        confidence_levels,
+        n_splits,
+        xlab,
+    )
+    return f
+
+
+def render_classifier_intervals(
+    names,
+    sizes,
+    accuracies,
+    method,
+    output=None,
+    format: str = None,
+    confidence_levels=[0.9, 0.95, 0.98],
+    n_splits=None,
+    xlab="Accuracy",
+    width=12,
+    height=4,
+    dpi: int = 100,
+):
+    """
+    Renders the plot of plot_classifier_intervals directly to a PNG or SVG file or buffer. The figure is created
+    without pyplot and is not registered with any GUI backend, so rendering needs no display, leaves no global state
+    behind, and can run in worker processes or threads.
+
+    Parameters
+    ----------
+    names, sizes, accuracies, method, confidence_levels, n_splits, xlab, width, height
+        See plot_classifier_intervals.
+    output : str, path-like, or file-like
+        Optional. File name or binary buffer the image is written to. When None, the image is returned as bytes.
+    format : str
+        Optional. Image format, e.g., 'png' or 'svg'. Default: inferred from the file name extension, or 'png'.
+    dpi : int
+        Resolution of raster images in dots per inch. Default: 100.
+    """
+    figure = Figure(figsize=(width, height), dpi=dpi)
+    _draw_classifier_intervals(
+        figure.add_subplot(),
+        names,
+        sizes,
+        accuracies,
+        method,
+        confidence_levels,
+        n_splits,
+        xlab,
+    )
+    if (
+        format is None
+        and not isinstance(output, (str, bytes))
+        and not hasattr(output, "__fspath__")
+    ):
+        format = "png"
+
+    if output is None:
+        buffer = io.BytesIO()
+        figure.savefig(buffer, format=format, bbox_inches="tight")
+        return buffer.getvalue()
+    figure.savefig(output, format=format, bbox_inches="tight")
+    return output
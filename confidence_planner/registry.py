@@ -0,0 +1,233 @@
+import numpy as np
+
+__all__ = [
+    "EstimationMethod",
+    "available_methods",
+    "get_method",
+    "register_method",
+    "unregister_method",
+]
+
+# Error reported for methods that require cross-validation folds when n_splits is missing or too small.
+N_SPLITS_MESSAGE = "Provide the n_splits parameter with a value > 1."
+
+# Kinds of estimates a method can provide, with the names used in error messages.
+KINDS = {
+    "interval": "CI estimation",
+    "sample_size": "sample size estimation",
+    "confidence_level": "confidence level estimation",
+}
+
+_REGISTRY = {}
+
+
+class EstimationMethod:
+    """
+    Description of an evaluation method: the kernels that compute its confidence intervals, sample sizes and
+    confidence levels, and what the kernels require. Any kernel can be omitted when the method does not support the
+    corresponding kind of estimate.
+
+    All kernels of a kind share one calling convention, so that callers never need to know which method they dispatch
+    to:
+
+    - interval(sample_size, accuracy, confidence_level, n_splits) returns a (lower_bound, upper_bound) pair,
+    - sample_size(interval_radius, confidence_level, n_splits, accuracy) returns an int,
+    - confidence_level(sample_size, interval_radius, n_splits, accuracy) returns a float.
+
+    Batch kernels take the same parameters as arrays, broadcast them against each other, and return arrays (a tuple of
+    lower and upper bound arrays for intervals). They can be vectorized NumPy functions or compiled ufuncs.
+
+    Parameters
+    ----------
+    name : str
+        Name used as the method parameter of the estimate_* functions.
+    interval, sample_size, confidence_level : callable
+        Optional. Scalar kernels.
+    interval_batch, sample_size_batch, confidence_level_batch : callable
+        Optional. Vectorized kernels.
+    requires_n_splits : bool
+        Whether the kernels need the number of cross-validation folds. When True, n_splits must be greater than 1.
+    uses_replicates : bool
+        Whether the accuracy parameter is a list of accuracies (of bootstrap replicates or cross-validation folds)
+        rather than a single accuracy.
+    description : str
+        Optional. Short human readable description.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        interval=None,
+        sample_size=None,
+        confidence_level=None,
+        interval_batch=None,
+        sample_size_batch=None,
+        confidence_level_batch=None,
+        requires_n_splits: bool = False,
+        uses_replicates: bool = False,
+        description: str = "",
+    ):
+        self.name = name
+        self.requires_n_splits = requires_n_splits
+        self.uses_replicates = uses_replicates
+        self.description = description
+        self._kernels = {
+            "interval": interval,
+            "sample_size": sample_size,
+            "confidence_level": confidence_level,
+        }
+        self._batch_kernels = {
+            "interval": interval_batch,
+            "sample_size": sample_size_batch,
+            "confidence_level": confidence_level_batch,
+        }
+
+    def __repr__(self):
+        return f"EstimationMethod({self.name!r}, supports={self.capabilities()!r})"
+
+    def capabilities(self) -> list:
+        """
+        Returns the kinds of estimates ('interval', 'sample_size', 'confidence_level') the method supports.
+        """
+        return [kind for kind in KINDS if self.supports(kind)]
+
+    def supports(self, kind: str, batch: bool = False) -> bool:
+        """
+        Returns True when the method has a kernel for the given kind of estimate.
+
+        Parameters
+        ----------
+        kind : str
+            One of 'interval', 'sample_size', 'confidence_level'.
+        batch : bool
+            When True, only vectorized kernels are considered.
+        """
+        kernels = self._batch_kernels if batch else self._kernels
+        return kernels.get(kind) is not None
+
+    def kernel(self, kind: str, batch: bool = False):
+        """
+        Returns the scalar or vectorized kernel for the given kind of estimate.
+
+        Parameters
+        ----------
+        kind : str
+            One of 'interval', 'sample_size', 'confidence_level'.
+        batch : bool
+            When True, the vectorized kernel is returned.
+        """
+        _check_kind(kind)
+        if not self.supports(kind, batch):
+            raise Exception(
+                f'Method "{self.name}" does not support {"batch " if batch else ""}{KINDS[kind]}. Should be one '
+                f"of: {_method_list(kind, batch)}"
+            )
+        return (self._batch_kernels if batch else self._kernels)[kind]
+
+    def check_n_splits(self, n_splits):
+        """
+        Raises an exception when the method requires cross-validation folds and n_splits is missing or not greater
+        than 1.
+
+        Parameters
+        ----------
+        n_splits : int or array-like
+            Number(s) of cross-validation folds.
+        """
+        if self.requires_n_splits and (
+            n_splits is None or np.any(np.asarray(n_splits) <= 1)
+        ):
+            raise Exception(N_SPLITS_MESSAGE)
+
+
+def _check_kind(kind: str):
+    if kind not in KINDS:
+        raise Exception(
+            f"Unknown estimate kind \"{kind}\". Should be one of: 'interval', 'sample_size', 'confidence_level'."
+        )
+
+
+def _method_list(kind: str, batch: bool = False) -> str:
+    return ", ".join(f"'{name}'" for name in available_methods(kind, batch))
+
+
+def register_method(method: EstimationMethod, replace: bool = False):
+    """
+    Adds an evaluation method to the registry, which makes it available to estimate_confidence_interval,
+    estimate_sample_size, estimate_confidence_level, estimate_batch, and build_planning_table.
+
+    Parameters
+    ----------
+    method : EstimationMethod
+        Method description with its kernels.
+    replace : bool
+        Whether an already registered method with the same name can be replaced. Default: False.
+    """
+    if not isinstance(method, EstimationMethod):
+        raise Exception(
+            f"Only EstimationMethod instances can be registered, not {type(method).__name__}"
+        )
+    if method.name in _REGISTRY and not replace:
+        raise Exception(
+            f'Method "{method.name}" is already registered. Use replace=True to override it.'
+        )
+    _REGISTRY[method.name] = method
+    return method
+
+
+def unregister_method(name: str) -> EstimationMethod:
+    """
+    Removes an evaluation method from the registry and returns it.
+
+    Parameters
+    ----------
+    name : str
+        Name of the registered method.
+    """
+    if name not in _REGISTRY:
+        raise Exception(f'Method "{name}" is not registered.')
+    return _REGISTRY.pop(name)
+
+
+def get_method(name: str, kind: str = None) -> EstimationMethod:
+    """
+    Returns the registered method with the given name.
+
+    Parameters
+    ----------
+    name : str
+        Name of the registered method.
+    kind : str
+        Optional. One of 'interval', 'sample_size', 'confidence_level'. When given, an exception is raised if the
+        method does not support this kind of estimate.
+    """
+    method = _REGISTRY.get(name)
+    if kind is not None:
+        _check_kind(kind)
+        if method is None or not method.supports(kind):
+            raise Exception(
+                f"Unknown {KINDS[kind]} method. Should be one of: {_method_list(kind)}"
+            )
+    elif method is None:
+        raise Exception(
+            f"Unknown method. Should be one of: {', '.join(map(repr, _REGISTRY))}"
+        )
+    return method
+
+
+def available_methods(kind: str = None, batch: bool = False) -> list:
+    """
+    Returns the names of registered methods, in registration order.
+
+    Parameters
+    ----------
+    kind : str
+        Optional. One of 'interval', 'sample_size', 'confidence_level'. When given, only methods supporting this kind
+        of estimate are returned.
+    batch : bool
+        When True, only methods with a vectorized kernel for the given kind are returned.
+    """
+    if kind is None:
+        return list(_REGISTRY)
+    _check_kind(kind)
+    return [name for name, method in _REGISTRY.items() if method.supports(kind, batch)]
@@ -0,0 +1,101 @@
+import numpy as np
+
+__all__ = ["Interval", "interval_array", "interval_dtype"]
+
+
+class Interval(tuple):
+    """
+    Immutable confidence interval returned by the scalar interval functions. It is a two-element tuple without a
+    per-instance dictionary, so it unpacks and indexes like the lists returned by earlier versions
+    (low, high = interval; interval[0]) and compares equal to [low, high]. Code that needs a mutable list can call
+    tolist().
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, low: float, high: float):
+        return tuple.__new__(cls, (low, high))
+
+    @property
+    def low(self) -> float:
+        """
+        Lower bound of the interval.
+        """
+        return self[0]
+
+    @property
+    def high(self) -> float:
+        """
+        Upper bound of the interval.
+        """
+        return self[1]
+
+    @property
+    def width(self) -> float:
+        """
+        Distance between the bounds.
+        """
+        return self[1] - self[0]
+
+    @property
+    def radius(self) -> float:
+        """
+        Half of the interval width.
+        """
+        return (self[1] - self[0]) / 2
+
+    def tolist(self) -> list:
+        """
+        Returns the bounds as a [low, high] list.
+        """
+        return [self[0], self[1]]
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            other = tuple(other)
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        if isinstance(other, list):
+            other = tuple(other)
+        return tuple.__ne__(self, other)
+
+    __hash__ = tuple.__hash__
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+    def __repr__(self):
+        return f"Interval(low={self[0]!r}, high={self[1]!r})"
+
+
+def interval_dtype(dtype=np.float64) -> np.dtype:
+    """
+    Returns the structured dtype with 'low' and 'high' fields used by interval_array.
+
+    Parameters
+    ----------
+    dtype : numpy dtype
+        Type of each bound. Default: float64.
+    """
+    return np.dtype([("low", dtype), ("high", dtype)])
+
+
+def interval_array(bounds, dtype=np.float64) -> np.ndarray:
+    """
+    Packs the (low, high) pair of arrays returned by the *_batch interval functions into a single structured array
+    with 'low' and 'high' fields, in which the bounds of each interval are stored next to each other. With
+    dtype=np.float32 the array takes half of the memory, at a precision of about 1e-7.
+
+    Parameters
+    ----------
+    bounds : tuple
+        Pair of arrays with the lower and upper interval bounds, broadcastable against each other.
+    dtype : numpy dtype
+        Type of each bound. Default: float64.
+    """
+    low, high = np.broadcast_arrays(*bounds)
+    intervals = np.empty(low.shape, dtype=interval_dtype(dtype))
+    intervals["low"] = low
+    intervals["high"] = high
+    return intervals
@@ -0,0 +1,250 @@
+import math
+import numpy as np
+
+from .bootstrap import _correct_predictions
+from .results import Interval
+
+__all__ = ["ConfidenceSequence", "sequential_evaluation"]
+
+_SEQUENCE_METHODS = ("betting", "normal_mixture")
+# Bound on the bets relative to the largest possible loss, which keeps the capital positive.
+_BETTING_TRUNCATION = 0.5
+# Number of observations processed at once by the betting update, which bounds the size of temporary arrays.
+_BETTING_BLOCK_SIZE = 256
+
+
+class ConfidenceSequence:
+    """
+    Anytime-valid confidence sequence for accuracy. Unlike the holdout intervals, which are only valid for a sample
+    size fixed in advance, the intervals of a confidence sequence hold simultaneously for all sample sizes: with
+    probability at least confidence_level the true accuracy lies in every reported interval. The interval can
+    therefore be monitored continuously, and evaluation can stop as soon as it is narrow enough.
+
+    Two estimators are available:
+
+    - 'betting' uses the capital process of Waudby-Smith and Ramdas (2023) with approximate growth rate adaptive
+      (aGRAPA) bets, evaluated on a grid of candidate accuracies. It adapts to the variance of the data, so for
+      accuracies far from 0.5 it needs considerably fewer examples than intervals planned for the worst case. Each
+      update costs O(grid_size) per example and memory is O(grid_size).
+    - 'normal_mixture' uses the two-sided normal mixture boundary of Howard et al. (2021) for variables bounded in
+      <0, 1>. It is computed in closed form in O(1), but does not adapt to the variance.
+
+    Reported intervals are running intersections, so they never widen.
+
+    Parameters
+    ----------
+    confidence_level : float
+        Confidence level. Should be between 0 and 1. Default: 0.95.
+    method : str
+        One of 'betting', 'normal_mixture'. Default: 'betting'.
+    target_sample_size : int
+        Sample size at which the 'normal_mixture' boundary is tightest. Ignored by 'betting'. Default: 1000.
+    grid_size : int
+        Number of grid intervals of candidate accuracies used by 'betting'. The bounds are rounded outwards to this
+        grid. Default: 1000.
+    """
+
+    def __init__(
+        self,
+        confidence_level: float = 0.95,
+        method: str = "betting",
+        target_sample_size: int = 1000,
+        grid_size: int = 1000,
+    ):
+        if confidence_level <= 0 or confidence_level >= 1:
+            raise Exception(
+                f'Confidence level should be between 0 and 1, not "{confidence_level}".'
+            )
+        if method not in _SEQUENCE_METHODS:
+            raise Exception(
+                f"Unknown confidence sequence method. Should be one of: 'betting', 'normal_mixture'."
+            )
+        if target_sample_size <= 0:
+            raise Exception(
+                f'Target sample size must be an integer greater than 0, not "{target_sample_size}"'
+            )
+        if grid_size < 2:
+            raise Exception(f'Grid size must be at least 2, not "{grid_size}"')
+
+        self.confidence_level = confidence_level
+        self.method = method
+        self.n = 0
+        self.n_correct = 0
+        self._alpha = 1 - confidence_level
+        self._low, self._high = 0.0, 1.0
+
+        # Mixture variance tuned to minimize the boundary at the target sample size (Howard et al., 2021).
+        log_alpha = -2 * math.log(self._alpha)
+        self._rho = (target_sample_size / 4) / (log_alpha + math.log(1 + log_alpha))
+
+        self._grid = np.linspace(0.0, 1.0, grid_size + 1)
+        self._log_capital = np.zeros(self._grid.size)
+        self._alive = np.ones(self._grid.size, dtype=bool)
+        self._squared_deviations = 0.0
+
+    def __repr__(self):
+        return (
+            f"ConfidenceSequence(n={self.n}, n_correct={self.n_correct}, confidence_level={self.confidence_level!r}, "
+            f"method={self.method!r})"
+        )
+
+    @property
+    def accuracy(self) -> float:
+        """
+        Accuracy of all predictions added so far.
+        """
+        if self.n == 0:
+            raise Exception("No predictions were added to the confidence sequence yet.")
+        return self.n_correct / self.n
+
+    @property
+    def radius(self) -> float:
+        """
+        Half of the width of the current interval.
+        """
+        return (self._high - self._low) / 2
+
+    def interval(self) -> Interval:
+        """
+        Returns the current interval. Before any prediction is added it is <0, 1>.
+        """
+        return Interval(self._low, self._high)
+
+    def update(self, y_true=None, y_pred=None, correct=None):
+        """
+        Adds a single prediction or a chunk of predictions, in the order in which they were observed.
+
+        Parameters
+        ----------
+        y_true : label or array-like
+            Optional. True label(s). Used together with y_pred when correct is not given.
+        y_pred : label or array-like
+            Optional. Predicted label(s).
+        correct : bool or array-like
+            Optional. Whether each prediction was correct.
+        """
+        if correct is None:
+            y_true, y_pred = np.asarray(y_true).ravel(), np.asarray(y_pred).ravel()
+            _correct_predictions(y_true, y_pred, None, allow_empty=True)
+            outcomes = (y_true == y_pred).astype(float)
+        else:
+            _correct_predictions(None, None, correct, allow_empty=True)
+            outcomes = np.asarray(correct, dtype=float).ravel()
+        if outcomes.size == 0:
+            return self
+
+        if self.method == "betting":
+            for start in range(0, outcomes.size, _BETTING_BLOCK_SIZE):
+                self._update_betting(outcomes[start : start + _BETTING_BLOCK_SIZE])
+        else:
+            self.n += outcomes.size
+            self.n_correct += int(outcomes.sum())
+            self._update_normal_mixture()
+        return self
+
+    def _update_normal_mixture(self):
+        intrinsic_time = self.n / 4 + self._rho
+        boundary = math.sqrt(
+            intrinsic_time * math.log(intrinsic_time / (self._rho * self._alpha**2))
+        )
+        accuracy = self.n_correct / self.n
+        self._low = max(self._low, accuracy - boundary / self.n)
+        self._high = min(self._high, accuracy + boundary / self.n)
+
+    def _update_betting(self, outcomes):
+        t = self.n + np.arange(1, outcomes.size + 1)
+        sums = self.n_correct + np.cumsum(outcomes)
+        means = (0.5 + sums) / (t + 1)
+        squared_deviations = self._squared_deviations + np.cumsum(
+            (outcomes - means) ** 2
+        )
+
+        # Bets on the t-th outcome only use the mean and variance estimates after t - 1 outcomes.
+        previous_means = (0.5 + sums - outcomes) / t
+        previous_variances = (0.25 + squared_deviations - (outcomes - means) ** 2) / t
+
+        grid = self._grid[None, :]
+        distances = previous_means[:, None] - grid
+        bets = distances / (previous_variances[:, None] + distances**2)
+        with np.errstate(divide="ignore"):
+            bets = np.clip(
+                bets, -_BETTING_TRUNCATION / (1 - grid), _BETTING_TRUNCATION / grid
+            )
+
+        # For the true accuracy the capital is a nonnegative martingale with initial value 1, so by Ville's
+        # inequality it ever exceeds 1 / alpha with probability at most alpha. Candidates are rejected at the first
+        # time their capital crosses this threshold.
+        log_capital = self._log_capital + np.cumsum(
+            np.log1p(bets * (outcomes[:, None] - grid)), axis=0
+        )
+        rejected = (log_capital >= -math.log(self._alpha)).any(axis=0)
+        alive = self._alive & ~rejected
+        if alive.any():
+            self._alive = alive
+            indices = np.flatnonzero(alive)
+            self._low = float(self._grid[max(indices[0] - 1, 0)])
+            self._high = float(self._grid[min(indices[-1] + 1, self._grid.size - 1)])
+
+        self.n = int(t[-1])
+        self.n_correct = int(sums[-1])
+        self._squared_deviations = float(squared_deviations[-1])
+        self._log_capital = log_capital[-1]
+
+
+def sequential_evaluation(
+    chunks,
+    interval_radius: float,
+    confidence_level: float = 0.95,
+    method: str = "betting",
+    max_sample_size: int = None,
+    **kwargs,
+) -> dict:
+    """
+    Consumes a stream of predictions chunk by chunk and stops as soon as the anytime-valid confidence interval of the
+    accuracy has a radius of at most interval_radius. Because the interval is a confidence sequence, stopping early
+    does not invalidate the confidence level, and labeling or inference of the remaining chunks can be skipped.
+    Stopping is checked after every chunk, so smaller chunks stop closer to the minimal sample size.
+
+    Parameters
+    ----------
+    chunks : iterable
+        Stream of chunks. Each chunk is either an array-like of correct (True/False or 0/1) indicators or a
+        (y_true, y_pred) pair of label arrays. A generator lets the caller produce (e.g., label) chunks lazily.
+    interval_radius : float
+        Requested half width of the confidence interval. Should be between 0 (exclusive) and 0.5.
+    confidence_level : float
+        Confidence level. Should be between 0 and 1. Default: 0.95.
+    method : str
+        Confidence sequence method, see ConfidenceSequence. Default: 'betting'.
+    max_sample_size : int
+        Optional. Evaluation also stops once this many predictions were consumed.
+    kwargs
+        Additional parameters of ConfidenceSequence.
+
+    Returns a dict with the final 'interval', the number of consumed predictions ('sample_size'), their 'accuracy',
+    and 'stopped', which is True when the requested radius was reached.
+    """
+    if interval_radius <= 0 or interval_radius > 0.5:
+        raise Exception(
+            f'Interval radius should be between 0 (exclusive) and 0.5, not "{interval_radius}"'
+        )
+
+    sequence = ConfidenceSequence(confidence_level, method, **kwargs)
+    stopped = False
+    for chunk in chunks:
+        if isinstance(chunk, tuple) and len(chunk) == 2:
+            sequence.update(*chunk)
+        else:
+            sequence.update(correct=chunk)
+        if sequence.radius <= interval_radius:
+            stopped = True
+            break
+        if max_sample_size is not None and sequence.n >= max_sample_size:
+            break
+
+    return {
+        "interval": sequence.interval(),
+        "sample_size": sequence.n,
+        "accuracy": sequence.accuracy if sequence.n else None,
+        "stopped": stopped,
+    }
@@ -0,0 +1,405 @@
+import argparse
+import asyncio
+import json
+import math
+
+import numpy as np
+
+from .parallel import _COLUMNS, _OUTPUTS, estimate_batch
+from .registry import get_method
+
+__all__ = ["EstimationServer", "serve"]
+
+# Endpoints and the kind of estimate each of them computes.
+_ENDPOINTS = {
+    "/confidence_interval": "interval",
+    "/sample_size": "sample_size",
+    "/confidence_level": "confidence_level",
+}
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+}
+
+
+def _parse_value(value, name):
+    if isinstance(value, list) and name == "accuracy":
+        # Bootstrap accuracies
+        return [_parse_value(item, name) for item in value]
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise Exception(f'Invalid value "{value}" of the "{name}" parameter.')
+    if math.isnan(value):
+        raise Exception(f'Invalid value "{value}" of the "{name}" parameter.')
+    return float(value)
+
+
+def _parse_request(kind, body):
+    # Returns the parameters of one request as a row of estimate_batch columns.
+    if not isinstance(body, dict):
+        raise Exception("Each request should be a JSON object.")
+    if kind == "confidence_level" and body.get("accuracies") is not None:
+        body = dict(body, accuracy=body["accuracies"])
+
+    row = {}
+    for name, default in _COLUMNS[kind]:
+        value = body.get(name)
+        if value is None:
+            if default is None:
+                raise Exception(f'Missing "{name}" parameter.')
+            value = default
+        row[name] = _parse_value(value, name)
+    method = body.get("method", "holdout")
+    if not isinstance(method, str):
+        raise Exception(f'Invalid value "{method}" of the "method" parameter.')
+    row["method"] = method
+    return row
+
+
+def _is_vectorized(kind, method):
+    try:
+        return get_method(method, kind).supports(kind, batch=True)
+    except Exception:
+        # Unknown methods are reported by estimate_batch.
+        return True
+
+
+def _evaluate(kind, rows):
+    # Evaluates a group of requests with one call to the vectorized kernel of each method.
+    requests = {}
+    for name in list(rows[0]):
+        column = [row[name] for row in rows]
+        if name != "method" and not any(isinstance(value, list) for value in column):
+            column = np.asarray(column, dtype=float)
+        requests[name] = column
+    outputs = estimate_batch(
+        requests, kind=kind, backend="serial", chunk_size=len(rows)
+    )
+
+    results = []
+    for i, error in enumerate(outputs["error"]):
+        if error is not None:
+            results.append({"error": error})
+        else:
+            results.append({name: outputs[name][i].item() for name in _OUTPUTS[kind]})
+    return results
+
+
+class _Batcher:
+    # Collects the requests of one kind that arrive within the batch window and evaluates them together.
+    def __init__(self, server, kind):
+        self.server = server
+        self.kind = kind
+        self.pending = []
+        self.timer = None
+
+    def submit(self, row):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((row, future))
+        if len(self.pending) >= self.server.max_batch_size:
+            self.flush()
+        elif self.timer is None:
+            self.timer = loop.call_later(self.server.batch_window, self.flush)
+        return future
+
+    def flush(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.pending = self.pending, []
+        if not batch:
+            return
+
+        # Methods without vectorized kernels (e.g. bootstrap percentiles) are evaluated row by row, so they are run
+        # in the executor to keep the event loop responsive.
+        inline, background = [], []
+        for row, future in batch:
+            vectorized = _is_vectorized(self.kind, row["method"])
+            (inline if vectorized else background).append((row, future))
+        if inline:
+            self._run(inline)
+        if background:
+            task = asyncio.ensure_future(self._run_in_executor(background))
+            self.server._tasks.add(task)
+            task.add_done_callback(self.server._tasks.discard)
+
+    def _resolve(self, batch, results):
+        self.server.stats["batches"] += 1
+        self.server.stats["max_batch_size"] = max(
+            self.server.stats["max_batch_size"], len(batch)
+        )
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def _fail(self, batch, error):
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    def _run(self, batch):
+        try:
+            results = _evaluate(self.kind, [row for row, _ in batch])
+        except Exception as e:
+            self._fail(batch, e)
+            return
+        self._resolve(batch, results)
+
+    async def _run_in_executor(self, batch):
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self.server.executor, _evaluate, self.kind, [row for row, _ in batch]
+            )
+        except Exception as e:
+            self._fail(batch, e)
+            return
+        self._resolve(batch, results)
+
+
+class EstimationServer:
+    """
+    Lean HTTP/1.1 JSON service exposing confidence interval, sample size, and confidence level estimation. Requests
+    of the same kind that arrive within batch_window seconds are grouped and evaluated with one vectorized call per
+    method, so the cost per request drops as the request rate grows. Methods without vectorized kernels, such as
+    bootstrap percentiles, are evaluated in an executor so that they do not block the event loop. The server only
+    uses the standard library and listens on localhost by default.
+
+    Endpoints (POST, JSON body):
+
+    - /confidence_interval: sample_size, accuracy, confidence_level, and optionally n_splits and method. Returns
+      {"low": ..., "high": ...}.
+    - /sample_size: interval_radius, confidence_level, and optionally n_splits, method, and accuracy. Returns
+      {"sample_size": ...}.
+    - /confidence_level: sample_size, interval_radius, and optionally n_splits, method, accuracy, and accuracies.
+      Returns {"confidence_level": ...}.
+
+    Parameters have the same names and meaning as in estimate_confidence_interval, estimate_sample_size, and
+    estimate_confidence_level. A body can also be a list of requests, answered with a list of results in which
+    failed requests are {"error": message}. A single failed request is answered with status 400. GET /stats returns
+    the number of requests and batches evaluated so far.
+
+    Parameters
+    ----------
+    host : str
+        Interface to listen on. Default: '127.0.0.1'.
+    port : int
+        Port to listen on, or 0 for any free port. Default: 8000.
+    batch_window : float
+        Time in seconds for which requests are collected before they are evaluated. Default: 0.002.
+    max_batch_size : int
+        Number of pending requests of one kind that triggers an evaluation before the end of the window.
+        Default: 1024.
+    executor : concurrent.futures.Executor
+        Optional. Executor for methods without vectorized kernels. Default: the default executor of the event loop.
+    max_body_size : int
+        Maximum size of a request body in bytes. Default: 1048576.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        batch_window: float = 0.002,
+        max_batch_size: int = 1024,
+        executor=None,
+        max_body_size: int = 1048576,
+    ):
+        if batch_window < 0:
+            raise Exception(
+                f'Batch window must be a number greater or equal to 0, not "{batch_window}"'
+            )
+        if max_batch_size <= 0:
+            raise Exception(
+                f'Maximum batch size must be an integer greater than 0, not "{max_batch_size}"'
+            )
+        self.host = host
+        self.port = port
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.executor = executor
+        self.max_body_size = max_body_size
+        self.stats = {"requests": 0, "batches": 0, "max_batch_size": 0}
+        self._batchers = {kind: _Batcher(self, kind) for kind in _OUTPUTS}
+        self._tasks = set()
+        self._server = None
+
+    async def start(self) -> tuple:
+        """
+        Starts listening and returns the (host, port) address of the server.
+        """
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        return self.address
+
+    @property
+    def address(self) -> tuple:
+        """
+        The (host, port) address the server listens on, or None when it is not started.
+        """
+        if self._server is None:
+            return None
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """
+        Stops accepting connections and evaluates the pending requests.
+        """
+        for batcher in self._batchers.values():
+            batcher.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def estimate(self, kind: str, body):
+        """
+        Evaluates one request body (a dict or a list of dicts) through the batching queue of the given kind of
+        estimate, and returns the HTTP status and the JSON response.
+        """
+        batcher = self._batchers[kind]
+        requests = body if isinstance(body, list) else [body]
+        self.stats["requests"] += len(requests)
+
+        results = [None] * len(requests)
+        futures = []
+        for i, request in enumerate(requests):
+            try:
+                futures.append((i, batcher.submit(_parse_request(kind, request))))
+            except Exception as e:
+                results[i] = {"error": str(e)}
+        for i, future in futures:
+            try:
+                results[i] = await future
+            except Exception as e:
+                results[i] = {"error": str(e)}
+
+        if isinstance(body, list):
+            return 200, results
+        return (400 if "error" in results[0] else 200), results[0]
+
+    async def _route(self, method, path, body):
+        if path == "/stats":
+            if method != "GET":
+                return 405, {"error": f"Method {method} is not allowed for {path}."}
+            return 200, self.stats
+        if path not in _ENDPOINTS:
+            return 404, {"error": f"Unknown endpoint {path}."}
+        if method != "POST":
+            return 405, {"error": f"Method {method} is not allowed for {path}."}
+        try:
+            body = json.loads(body)
+        except ValueError:
+            return 400, {"error": "The request body is not valid JSON."}
+        return await self.estimate(_ENDPOINTS[path], body)
+
+    async def _handle(self, reader, writer):
+        # Minimal HTTP/1.1 connection handler with keep-alive.
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                except ValueError:
+                    length = -1
+                keep_alive = (
+                    headers.get("connection", "").lower() != "close"
+                    and version == "HTTP/1.1"
+                )
+                if length < 0:
+                    # The body cannot be delimited, so the connection is closed after the response.
+                    status = 400
+                    response = {"error": "Invalid Content-Length header."}
+                    keep_alive = False
+                elif length > self.max_body_size:
+                    status = 413
+                    response = {"error": "The request body is too large."}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, response = await self._route(
+                        method, target.split("?")[0], body
+                    )
+
+                payload = json.dumps(response).encode()
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                        "Content-Type: application/json\r\n"
+                        f"Content-Length: {len(payload)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                        "\r\n"
+                    ).encode()
+                    + payload
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    batch_window: float = 0.002,
+    max_batch_size: int = 1024,
+):
+    """
+    Runs an EstimationServer until interrupted.
+
+    Parameters
+    ----------
+    host, port, batch_window, max_batch_size
+        See EstimationServer.
+    """
+    server = EstimationServer(host, port, batch_window, max_batch_size)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Runs the confidence-planner estimation HTTP server."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--batch-window", type=float, default=0.002)
+    parser.add_argument("--max-batch-size", type=int, default=1024)
+    args = parser.parse_args()
+    serve(args.host, args.port, args.batch_window, args.max_batch_size)
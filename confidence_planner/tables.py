@@ -0,0 +1,346 @@
+import struct
+import numpy as np
+
+from .confidence_planner import estimate_confidence_level, estimate_sample_size
+from .registry import get_method
+
+__all__ = ["PlanningTable", "build_planning_table"]
+
+_TABLE_MAGIC = b"CPPT"
+_TABLE_VERSION = 1
+# The header is padded to 128 bytes, so that the data block starts at an aligned offset and can be memory-mapped as
+# float64 values.
+_TABLE_HEADER = struct.Struct("<4sB32sqdIIIBB61x")
+_TABLE_DATA_OFFSET = _TABLE_HEADER.size
+_METHOD_NAME_SIZE = 32
+_HAS_SAMPLE_SIZES = 1
+_HAS_CONFIDENCE_LEVELS = 2
+
+DEFAULT_RADII = np.geomspace(0.005, 0.5, 64)
+DEFAULT_CONFIDENCE_LEVELS = 1 - np.geomspace(1e-4, 0.5, 64)[::-1]
+DEFAULT_SAMPLE_SIZES = np.unique(np.round(np.geomspace(1, 10**7, 256)))
+
+
+def _z_scores(confidence_level):
+    from scipy.special import ndtri
+
+    half = np.clip((1 + np.asarray(confidence_level, dtype=float)) / 2, 0.5, 1 - 1e-16)
+    return np.maximum(ndtri(half), 1e-12)
+
+
+def _grid_position(log_axis, log_values):
+    # Index of the lower grid point and the interpolation weight of the upper one.
+    index = np.clip(
+        np.searchsorted(log_axis, log_values, side="right") - 1, 0, log_axis.size - 2
+    )
+    weight = (log_values - log_axis[index]) / (log_axis[index + 1] - log_axis[index])
+    return index, np.clip(weight, 0.0, 1.0)
+
+
+def _bilinear(grid, row, row_weight, col, col_weight):
+    return (
+        grid[row, col] * (1 - row_weight) * (1 - col_weight)
+        + grid[row + 1, col] * row_weight * (1 - col_weight)
+        + grid[row, col + 1] * (1 - row_weight) * col_weight
+        + grid[row + 1, col + 1] * row_weight * col_weight
+    )
+
+
+def build_planning_table(
+    path,
+    method: str = "holdout",
+    radii=None,
+    confidence_levels=None,
+    sample_sizes=None,
+    n_splits: int = None,
+    accuracy: float = 0.5,
+):
+    """
+    Precomputes sample sizes over a radius x confidence level grid and confidence levels over a sample size x radius
+    grid for a given method, and saves them to a compact binary file that can be opened with PlanningTable. Grids that
+    a method does not support (such as confidence levels for 'bootstrap', which require bootstrap results) are
+    omitted.
+
+    Parameters
+    ----------
+    path : str or path-like
+        Output file.
+    method : str
+        Name of a registered evaluation method, as accepted by estimate_sample_size and estimate_confidence_level.
+        Default: 'holdout'.
+    radii : array-like
+        Optional. Interval radii of the grid. Should be between 0 (exclusive) and 0.5.
+    confidence_levels : array-like
+        Optional. Confidence levels of the grid. Should be between 0 and 1.
+    sample_sizes : array-like
+        Optional. Sample sizes of the grid. Must be greater than 0.
+    n_splits : int
+        Optional. Number of folds used in cross validation. Required when method is 'cv'.
+    accuracy : float
+        Optional. Assumed accuracy used by the 'holdout_wilson' and 'holdout_clopper_pearson' methods. Default: 0.5.
+    """
+    if len(method.encode("utf8")) > _METHOD_NAME_SIZE:
+        raise Exception(
+            f'Method name "{method}" is too long to be stored in a planning table, it should have at most '
+            f"{_METHOD_NAME_SIZE} bytes in UTF-8."
+        )
+    radii = np.unique(np.asarray(DEFAULT_RADII if radii is None else radii, float))
+    confidence_levels = np.unique(
+        np.asarray(
+            (
+                DEFAULT_CONFIDENCE_LEVELS
+                if confidence_levels is None
+                else confidence_levels
+            ),
+            float,
+        )
+    )
+    sample_sizes = np.unique(
+        np.asarray(
+            DEFAULT_SAMPLE_SIZES if sample_sizes is None else sample_sizes, float
+        )
+    )
+    if min(radii.size, confidence_levels.size, sample_sizes.size) < 2:
+        raise Exception("Each grid axis should contain at least two distinct values.")
+    if radii[0] <= 0:
+        raise Exception(
+            f'Grid interval radii should be greater than 0, not "{radii[0]}"'
+        )
+
+    flags = 0
+    size_grid = np.ones((radii.size, confidence_levels.size))
+    conf_grid = np.zeros((sample_sizes.size, radii.size))
+    spec = get_method(method)
+    spec.check_n_splits(n_splits)
+    if spec.supports("sample_size", batch=True):
+        size_grid = spec.kernel("sample_size", batch=True)(
+            radii[:, None], confidence_levels[None, :], n_splits, accuracy
+        ).astype(float)
+        flags |= _HAS_SAMPLE_SIZES
+    elif spec.supports("sample_size"):
+        kernel = spec.kernel("sample_size")
+        for i, radius in enumerate(radii):
+            for j, conf in enumerate(confidence_levels):
+                size_grid[i, j] = kernel(radius, conf, n_splits, accuracy)
+        flags |= _HAS_SAMPLE_SIZES
+    # Confidence levels of methods that need bootstrap results cannot be precomputed.
+    if spec.uses_replicates:
+        pass
+    elif spec.supports("confidence_level", batch=True):
+        conf_grid = spec.kernel("confidence_level", batch=True)(
+            sample_sizes[:, None], radii[None, :], n_splits, accuracy
+        )
+        flags |= _HAS_CONFIDENCE_LEVELS
+    elif spec.supports("confidence_level"):
+        kernel = spec.kernel("confidence_level")
+        for i, n in enumerate(sample_sizes):
+            for j, radius in enumerate(radii):
+                conf_grid[i, j] = kernel(int(n), radius, n_splits, accuracy)
+        flags |= _HAS_CONFIDENCE_LEVELS
+    if not flags:
+        raise Exception(f'Method "{method}" cannot be used to build a planning table.')
+
+    header = _TABLE_HEADER.pack(
+        _TABLE_MAGIC,
+        _TABLE_VERSION,
+        method.encode("utf8"),
+        0 if n_splits is None else int(n_splits),
+        accuracy,
+        radii.size,
+        confidence_levels.size,
+        sample_sizes.size,
+        flags,
+        0,
+    )
+    # Log-transformed axes and grids are stored next to the raw values, so that lookups only touch the grid cells
+    # they interpolate between.
+    data = np.concatenate(
+        [
+            radii,
+            confidence_levels,
+            sample_sizes,
+            np.log(radii),
+            np.log(_z_scores(confidence_levels)),
+            np.log(sample_sizes),
+            size_grid.ravel(),
+            np.log(np.maximum(size_grid, 1.0)).ravel(),
+            conf_grid.ravel(),
+            np.log(_z_scores(conf_grid)).ravel(),
+        ]
+    ).astype("<f8")
+    with open(path, "wb") as f:
+        f.write(header)
+        f.write(data.tobytes())
+
+
+class PlanningTable:
+    """
+    Read-only planning table created with build_planning_table. The file is memory-mapped, so worker processes that
+    open the same table share a single copy of it in the operating system page cache. Lookups inside the grid take
+    constant time: they use bilinear interpolation in log space, of log sample sizes over log radii and log critical
+    values, and of log critical values of confidence levels over log sample sizes and log radii. The closed-form
+    approximations are linear (z-test, t-test, Langford) or nearly linear (Wilson, Clopper-Pearson) in these
+    coordinates, so the interpolation error is small.
+    Values at grid points are returned exactly and queries outside the grid fall back to exact estimation.
+
+    Parameters
+    ----------
+    path : str or path-like
+        File created with build_planning_table.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            header = f.read(_TABLE_HEADER.size)
+        (
+            magic,
+            version,
+            method,
+            n_splits,
+            accuracy,
+            n_radii,
+            n_conf,
+            n_sizes,
+            flags,
+            _,
+        ) = _TABLE_HEADER.unpack(header)
+        if magic != _TABLE_MAGIC or version != _TABLE_VERSION:
+            raise Exception(f"{path} is not a confidence-planner planning table.")
+
+        self.method = method.rstrip(b"\0").decode("utf8")
+        self.n_splits = n_splits if n_splits > 0 else None
+        self.accuracy = accuracy
+        self._flags = flags
+        self._data = np.memmap(path, dtype="<f8", mode="r", offset=_TABLE_DATA_OFFSET)
+
+        shapes = [
+            (n_radii,),
+            (n_conf,),
+            (n_sizes,),
+            (n_radii,),
+            (n_conf,),
+            (n_sizes,),
+            (n_radii, n_conf),
+            (n_radii, n_conf),
+            (n_sizes, n_radii),
+            (n_sizes, n_radii),
+        ]
+        sections, start = [], 0
+        for shape in shapes:
+            size = int(np.prod(shape))
+            sections.append(self._data[start : start + size].reshape(shape))
+            start += size
+        (
+            self.radii,
+            self.confidence_levels,
+            self.sample_sizes,
+            self._log_radii,
+            self._log_z,
+            self._log_sample_sizes,
+            self._size_grid,
+            self._log_size_grid,
+            self._conf_grid,
+            self._log_z_grid,
+        ) = sections
+
+    def sample_size(self, interval_radius, confidence_level):
+        """
+        Returns the sample size(s) needed to obtain the given interval radius at the given confidence level.
+        Parameters can be array-like and are broadcast against each other.
+
+        Parameters
+        ----------
+        interval_radius : float or array-like
+            Half of the expected confidence interval width. Should be between 0 and 0.5.
+        confidence_level : float or array-like
+            Confidence level. Should be between 0 and 1.
+        """
+        if not self._flags & _HAS_SAMPLE_SIZES:
+            raise Exception(f'The "{self.method}" table does not contain sample sizes.')
+        radius, conf = np.broadcast_arrays(
+            np.asarray(interval_radius, dtype=float),
+            np.asarray(confidence_level, dtype=float),
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            row, row_weight = _grid_position(self._log_radii, np.log(radius))
+        col, col_weight = _grid_position(self._log_z, np.log(_z_scores(conf)))
+        log_sizes = _bilinear(self._log_size_grid, row, row_weight, col, col_weight)
+        sizes = np.ceil(np.exp(log_sizes) * (1 - 1e-12))
+        on_grid = (row_weight % 1 == 0) & (col_weight % 1 == 0)
+        sizes = np.where(
+            on_grid,
+            self._size_grid[row + (row_weight == 1), col + (col_weight == 1)],
+            sizes,
+        )
+
+        # Queries outside the grid, including NaN values, are answered (and validated) by exact estimation.
+        outside = np.logical_not(
+            (radius >= self.radii[0])
+            & (radius <= self.radii[-1])
+            & (conf >= self.confidence_levels[0])
+            & (conf <= self.confidence_levels[-1])
+        )
+        with np.errstate(invalid="ignore"):
+            sizes = np.array(sizes, dtype=np.int64)
+        for index in map(tuple, np.argwhere(outside)):
+            sizes[index] = estimate_sample_size(
+                radius[index],
+                conf[index],
+                n_splits=self.n_splits,
+                method=self.method,
+                accuracy=self.accuracy,
+            )
+        return sizes[()]
+
+    def confidence_level(self, sample_size, interval_radius):
+        """
+        Returns the confidence level(s) of intervals with the given radius for the given sample size. Parameters can
+        be array-like and are broadcast against each other.
+
+        Parameters
+        ----------
+        sample_size : int or array-like
+            Number of samples used in a test set. Must be greater than 0.
+        interval_radius : float or array-like
+            Half of the expected confidence interval width. Should be between 0 and 0.5.
+        """
+        from scipy.special import ndtr
+
+        if not self._flags & _HAS_CONFIDENCE_LEVELS:
+            raise Exception(
+                f'The "{self.method}" table does not contain confidence levels.'
+            )
+        n, radius = np.broadcast_arrays(
+            np.asarray(sample_size, dtype=float),
+            np.asarray(interval_radius, dtype=float),
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            row, row_weight = _grid_position(self._log_sample_sizes, np.log(n))
+            col, col_weight = _grid_position(self._log_radii, np.log(radius))
+        log_z = _bilinear(self._log_z_grid, row, row_weight, col, col_weight)
+        levels = 1 - 2 * ndtr(-np.exp(log_z))
+        on_grid = (row_weight % 1 == 0) & (col_weight % 1 == 0)
+        levels = np.where(
+            on_grid,
+            self._conf_grid[row + (row_weight == 1), col + (col_weight == 1)],
+            levels,
+        )
+
+        # Queries outside the grid, including NaN values, are answered (and validated) by exact estimation.
+        outside = np.logical_not(
+            (n >= self.sample_sizes[0])
+            & (n <= self.sample_sizes[-1])
+            & (radius >= self.radii[0])
+            & (radius <= self.radii[-1])
+        )
+        levels = np.array(levels, dtype=float)
+        for index in map(tuple, np.argwhere(outside)):
+            levels[index] = estimate_confidence_level(
+                int(n[index]) if np.isfinite(n[index]) else n[index],
+                radius[index],
+                n_splits=self.n_splits,
+                method=self.method,
+                accuracy=self.accuracy,
+            )
+        return levels[()]
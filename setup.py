@@ -15,6 +15,9 @@ setuptools.setup(
     url="https://github.com/dabrze/confidence-planner",
     packages=setuptools.find_packages(),
     python_requires=">=3.7",
+    entry_points={
+        "console_scripts": ["confidence-planner=confidence_planner.cli:main"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -28,7 +31,9 @@ setuptools.setup(
     install_requires=[
         "numpy>=1.21.0",
         "scipy>=1.7.1",
-        "statsmodels>=0.12.1"
         "matplotlib"
-    ]
+    ],
+    extras_require={
+        "test": ["pandas", "pyarrow"],
+    },
 )
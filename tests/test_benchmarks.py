@@ -0,0 +1,56 @@
+import os
+import sys
+import unittest
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(os.path.join(parent, "benchmarks"))
+import run_benchmarks
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_every_estimator_is_covered(self):
+        names = [name for name, _, _, _ in run_benchmarks.estimator_benchmarks(10)]
+        for name in [
+            "wilson_ci",
+            "wilson_ci_batch",
+            "z_test_sample_size",
+            "cross_validation_confidence_level_batch",
+            "percentiles_confidence_level_batch",
+            "unchecked(langford_ci)",
+        ]:
+            self.assertIn(name, names)
+        names = [name for name, _, _, _ in run_benchmarks.wrapper_benchmarks()]
+        self.assertIn("estimate_confidence_interval[bootstrap]", names)
+        self.assertIn("estimate_sample_size[cv]", names)
+
+    def test_run_and_compare(self):
+        results = run_benchmarks.run("z_test_ci", quick=True)
+        self.assertEqual(
+            set(results["benchmarks"]),
+            {"z_test_ci", "z_test_ci_batch", "unchecked(z_test_ci)"},
+        )
+        entry = results["benchmarks"]["z_test_ci_batch"]
+        self.assertEqual(entry["group"], "batch")
+        self.assertEqual(entry["items"], 1000)
+        self.assertGreater(entry["items_per_second"], 0)
+
+        baseline = {
+            "version": run_benchmarks.RESULTS_VERSION,
+            "benchmarks": {
+                "z_test_ci": dict(results["benchmarks"]["z_test_ci"]),
+                # Results of a different problem size are not compared.
+                "z_test_ci_batch": dict(entry, items=10000),
+            },
+        }
+        baseline["benchmarks"]["z_test_ci"]["seconds"] /= 2
+        comparison = run_benchmarks.compare(results, baseline)
+        self.assertEqual(len(comparison), 1)
+        self.assertAlmostEqual(comparison[0][3], 2.0)
+
+        with self.assertRaises(Exception):
+            run_benchmarks.compare(results, {"version": 0, "benchmarks": {}})
+
+
+if __name__ == "__main__":
+    unittest.main()
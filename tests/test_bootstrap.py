@@ -0,0 +1,194 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+from confidence_planner import *
+
+
+class TestPercentileSketch(unittest.TestCase):
+    def test_exact_mode_matches_percentiles_ci(self):
+        accuracies = np.random.default_rng(0).normal(0.8, 0.02, 5000)
+        sketch = PercentileSketch()
+        for value in accuracies[:10]:
+            sketch.update(value)
+        for chunk in np.array_split(accuracies[10:], 7):
+            sketch.update(chunk)
+
+        self.assertTrue(sketch.is_exact)
+        self.assertEqual(sketch.n, 5000)
+        for conf in [0.8, 0.9, 0.95]:
+            self.assertEqual(
+                sketch.confidence_interval(conf), percentiles_ci(accuracies, conf)
+            )
+
+    def test_sketch_error_bound(self):
+        rng = np.random.default_rng(1)
+        accuracies = rng.random(200000)
+        sketch = PercentileSketch(exact_limit=0, seed=0)
+        for chunk in np.array_split(accuracies, 20):
+            sketch.update(chunk)
+
+        self.assertFalse(sketch.is_exact)
+        self.assertEqual(sketch.n, 200000)
+        self.assertLessEqual(sketch.retained, 3 * sketch.k)
+        # uniform data: the value of a percentile is equal to its rank
+        for q in [2.5, 5, 50, 95, 97.5]:
+            self.assertAlmostEqual(sketch.percentile(q), q / 100, delta=0.015)
+
+    def test_single_value_updates(self):
+        accuracies = np.random.default_rng(3).random(20000)
+        sketch = PercentileSketch(k=100, exact_limit=0, seed=0)
+        sizes = []
+        for value in accuracies:
+            sketch.update(value)
+            sizes.append(sketch.retained)
+
+        self.assertEqual(sketch.n, 20000)
+        self.assertLessEqual(max(sizes), 3 * sketch.k + len(sketch._levels) + 1)
+        for q in [5, 50, 95]:
+            self.assertAlmostEqual(sketch.percentile(q), q / 100, delta=0.03)
+
+    def test_merge_and_serialize(self):
+        rng = np.random.default_rng(2)
+        accuracies = rng.beta(80, 20, 100000)
+        parts = [
+            PercentileSketch(exact_limit=1000, seed=i).update(chunk)
+            for i, chunk in enumerate(np.array_split(accuracies, 4))
+        ]
+        merged = parts[0]
+        for part in parts[1:]:
+            merged.merge(PercentileSketch.from_bytes(part.to_bytes()))
+
+        self.assertEqual(merged.n, 100000)
+        expected = percentiles_ci(accuracies, 0.9)
+        ci = merged.confidence_interval(0.9)
+        self.assertAlmostEqual(ci[0], expected[0], delta=0.01)
+        self.assertAlmostEqual(ci[1], expected[1], delta=0.01)
+
+        restored = PercentileSketch.from_bytes(merged.to_bytes())
+        self.assertEqual(restored.n, merged.n)
+        self.assertEqual(restored.confidence_interval(0.9), ci)
+
+        exact = (
+            PercentileSketch()
+            .update([0.7, 0.8])
+            .merge(PercentileSketch().update([0.9, 0.75]))
+        )
+        self.assertTrue(exact.is_exact)
+        self.assertEqual(
+            exact.confidence_interval(0.9), percentiles_ci([0.7, 0.8, 0.9, 0.75], 0.9)
+        )
+
+        with self.assertRaises(Exception):
+            merged.merge(PercentileSketch(k=100))
+        with self.assertRaises(Exception):
+            PercentileSketch.from_bytes(b"not a sketch" * 4)
+
+        data = merged.to_bytes()
+        for corrupt in [
+            data[:10],
+            data[:40],
+            data[:-8],
+            data + bytes(8),
+            data[:-8] + np.array([2.0]).tobytes(),
+            data[:23] + bytes([255]) + data[24:],
+        ]:
+            with self.assertRaisesRegex(Exception, "sketch"):
+                PercentileSketch.from_bytes(corrupt)
+
+    def test_invalid_input(self):
+        with self.assertRaises(Exception):
+            PercentileSketch(k=2)
+        with self.assertRaises(Exception):
+            PercentileSketch().update([0.5, 1.2])
+        with self.assertRaises(Exception):
+            PercentileSketch().confidence_interval(0.9)
+        with self.assertRaises(Exception):
+            PercentileSketch().update(0.5).confidence_interval(1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+class TestBootstrapEngine(unittest.TestCase):
+    def test_bootstrap_accuracies(self):
+        rng = np.random.default_rng(4)
+        y_true = rng.integers(0, 3, 500)
+        y_pred = np.where(rng.random(500) < 0.8, y_true, (y_true + 1) % 3)
+        accuracy = np.mean(y_true == y_pred)
+
+        accuracies = bootstrap_accuracies(y_true, y_pred, n_bootstraps=20000, seed=7)
+        self.assertEqual(accuracies.shape, (20000,))
+        self.assertAlmostEqual(np.mean(accuracies), accuracy, delta=0.002)
+        expected_std = np.sqrt(accuracy * (1 - accuracy) / 500)
+        self.assertAlmostEqual(np.std(accuracies), expected_std, delta=0.001)
+        # bootstrap accuracies are multiples of 1/n
+        np.testing.assert_allclose(accuracies * 500, np.round(accuracies * 500))
+
+        # the correctness vector gives the same replicates as labels
+        np.testing.assert_array_equal(
+            accuracies,
+            bootstrap_accuracies(correct=y_true == y_pred, n_bootstraps=20000, seed=7),
+        )
+
+        # the output feeds the percentile estimators
+        ci = percentiles_ci(accuracies, 0.9)
+        self.assertLess(ci[0], accuracy)
+        self.assertGreater(ci[1], accuracy)
+        conf = percentiles_confidence_level(accuracies, accuracy - ci[0])
+        self.assertAlmostEqual(conf, 0.9, delta=0.05)
+
+    def test_chunks_and_seeding(self):
+        correct = np.arange(300) % 4 != 0
+        full = bootstrap_accuracies(
+            correct=correct, n_bootstraps=2500, seed=11, chunk_size=1000
+        )
+        chunks = list(
+            bootstrap_accuracy_chunks(
+                correct=correct, n_bootstraps=2500, seed=11, chunk_size=1000
+            )
+        )
+        self.assertEqual([chunk.size for chunk in chunks], [1000, 1000, 500])
+        np.testing.assert_array_equal(np.concatenate(chunks), full)
+        np.testing.assert_array_equal(
+            full,
+            bootstrap_accuracies(
+                correct=correct,
+                n_bootstraps=2500,
+                seed=np.random.SeedSequence(11),
+                chunk_size=1000,
+            ),
+        )
+        self.assertFalse(
+            np.array_equal(
+                full,
+                bootstrap_accuracies(
+                    correct=correct, n_bootstraps=2500, seed=12, chunk_size=1000
+                ),
+            )
+        )
+
+        sketch = PercentileSketch()
+        for chunk in chunks:
+            sketch.update(chunk)
+        self.assertEqual(sketch.confidence_interval(0.95), percentiles_ci(full, 0.95))
+
+    def test_invalid_input(self):
+        with self.assertRaises(Exception):
+            bootstrap_accuracies(y_true=[1, 0, 1])
+        with self.assertRaises(Exception):
+            bootstrap_accuracies([1, 0, 1], [1, 0])
+        with self.assertRaises(Exception):
+            bootstrap_accuracies(correct=[1, 0, 2])
+        with self.assertRaises(Exception):
+            bootstrap_accuracies(correct=[])
+        with self.assertRaises(Exception):
+            bootstrap_accuracies(correct=[1, 0], n_bootstraps=0)
+        with self.assertRaises(Exception):
+            bootstrap_accuracy_chunks(correct=[1, 0], chunk_size=0)
@@ -0,0 +1,166 @@
+import contextlib
+import csv
+import importlib.util
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+from confidence_planner import *
+from confidence_planner.cli import main
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+CSV_INPUT = """sample_size,accuracy,confidence_level,method,n_splits,successes,trials
+100,0.8,0.95,holdout,,,
+200,0.9,0.9,cv,5,,
+,,0.95,,,80,100
+abc,0.8,0.95,,,,
+100,0.8,,holdout,,,
+100,0.8,0.95,unknown,,,
+"""
+
+
+class TestCommandLine(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name, content=None):
+        path = os.path.join(self.directory.name, name)
+        if content is not None:
+            with open(path, "w") as f:
+                f.write(content)
+        return path
+
+    def run_main(self, argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            status = main(argv)
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_csv_intervals(self):
+        status, output, _ = self.run_main([self.path("in.csv", CSV_INPUT)])
+        self.assertEqual(status, 0)
+        rows = list(csv.DictReader(io.StringIO(output)))
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(list(rows[0])[-3:], ["low", "high", "error"])
+
+        ci = estimate_confidence_interval(100, 0.8, 0.95)
+        self.assertAlmostEqual(float(rows[0]["low"]), ci.low)
+        self.assertAlmostEqual(float(rows[0]["high"]), ci.high)
+        ci = estimate_confidence_interval(200, 0.9, 0.9, 5, method="cv")
+        self.assertAlmostEqual(float(rows[1]["low"]), ci.low)
+        # successes and trials are used for rows without an accuracy
+        self.assertEqual(rows[2]["low"], rows[0]["low"])
+
+        self.assertIn('Invalid value "abc"', rows[3]["error"])
+        self.assertIn('Missing value in the "confidence_level"', rows[4]["error"])
+        self.assertIn("Unknown CI estimation method", rows[5]["error"])
+        self.assertEqual(rows[5]["low"], "")
+
+        # A default confidence level fills the missing cell
+        _, output, _ = self.run_main([self.path("in.csv"), "-c", "0.95"])
+        rows = list(csv.DictReader(io.StringIO(output)))
+        self.assertEqual(rows[4]["low"], rows[0]["low"])
+
+    def test_raise_errors(self):
+        status, output, error = self.run_main(
+            [self.path("in.csv", CSV_INPUT), "--errors", "raise", "-c", "0.9"]
+        )
+        self.assertEqual(status, 1)
+        self.assertIn('Row 3: Invalid value "abc"', error)
+
+        status, _, error = self.run_main([self.path("in.txt", "")])
+        self.assertEqual(status, 1)
+        self.assertIn("Cannot infer the format", error)
+
+    def test_jsonl_planning(self):
+        lines = [
+            {"interval_radius": 0.05},
+            {"interval_radius": 0.05, "method": "cv", "n_splits": 10},
+            {"interval_radius": 2},
+        ]
+        source = self.path("in.jsonl", "".join(json.dumps(l) + "\n" for l in lines))
+        output = self.path("out.jsonl")
+        status, _, _ = self.run_main(
+            [source, "-o", output, "--kind", "sample_size", "-c", "0.95"]
+        )
+        self.assertEqual(status, 0)
+        with open(output) as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual(rows[0]["sample_size"], estimate_sample_size(0.05, 0.95))
+        self.assertEqual(
+            rows[1]["sample_size"], estimate_sample_size(0.05, 0.95, 10, method="cv")
+        )
+        self.assertIsNone(rows[2]["sample_size"])
+        self.assertIsNotNone(rows[2]["error"])
+
+        source = self.path("levels.csv", "sample_size,interval_radius\n1000,0.05\n")
+        _, output, _ = self.run_main([source, "--kind", "confidence_level"])
+        rows = list(csv.DictReader(io.StringIO(output)))
+        self.assertAlmostEqual(
+            float(rows[0]["confidence_level"]), estimate_confidence_level(1000, 0.05)
+        )
+
+    def test_chunks_and_processes(self):
+        rng = np.random.default_rng(3)
+        sizes = rng.integers(10, 1000, 500)
+        accuracies = rng.uniform(0.5, 1.0, 500)
+        methods = rng.choice(["holdout", "holdout_langford", "cv"], 500)
+        content = "sample_size,accuracy,method\n" + "".join(
+            f"{n},{acc},{method}\n"
+            for n, acc, method in zip(sizes, accuracies, methods)
+        )
+        source = self.path("big.csv", content)
+        arguments = [source, "-c", "0.9", "--n-splits", "5", "--chunk-size", "64"]
+        _, serial, _ = self.run_main(arguments)
+        _, parallel, _ = self.run_main(arguments + ["--jobs", "2"])
+        self.assertEqual(serial, parallel)
+
+        rows = list(csv.DictReader(io.StringIO(serial)))
+        self.assertEqual(len(rows), 500)
+        for i in (0, 63, 64, 499):
+            ci = estimate_confidence_interval(
+                int(sizes[i]), float(accuracies[i]), 0.9, 5, method=str(methods[i])
+            )
+            self.assertAlmostEqual(float(rows[i]["low"]), ci.low)
+            self.assertAlmostEqual(float(rows[i]["high"]), ci.high)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_parquet(self):
+        import pyarrow.parquet as pq
+
+        output = self.path("out.parquet")
+        status, _, _ = self.run_main([self.path("in.csv", CSV_INPUT), "-o", output])
+        self.assertEqual(status, 0)
+        table = pq.read_table(output)
+        self.assertEqual(table.num_rows, 6)
+        self.assertEqual(table.column_names[-3:], ["low", "high", "error"])
+        ci = estimate_confidence_interval(100, 0.8, 0.95)
+        self.assertAlmostEqual(table.column("low")[0].as_py(), ci.low)
+        self.assertTrue(np.isnan(table.column("low")[5].as_py()))
+        self.assertIn("Unknown CI estimation method", table.column("error")[5].as_py())
+
+        # existing result columns are replaced, not duplicated
+        again = self.path("again.parquet")
+        status, _, _ = self.run_main(
+            [output, "-o", again, "-c", "0.9", "--chunk-size", "4"]
+        )
+        self.assertEqual(status, 0)
+        table = pq.read_table(again)
+        self.assertEqual(table.num_rows, 6)
+        self.assertEqual(table.column_names.count("low"), 1)
+        ci = estimate_confidence_interval(100, 0.8, 0.9)
+        self.assertAlmostEqual(table.column("low")[4].as_py(), ci.low)
+
+
+if __name__ == "__main__":
+    unittest.main()
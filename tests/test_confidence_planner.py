@@ -2,6 +2,8 @@ import os
 import sys
 import unittest
 
+import numpy as np
+
 current = os.path.dirname(os.path.realpath(__file__))
 parent = os.path.dirname(current)
 sys.path.append(parent)
@@ -462,6 +464,20 @@ class TestConfidencePlannerMethods(unittest.TestCase):
             estimate_sample_size(0.05, 0.90, method="progressive"),
             langford_sample_size(0.05, 0.90),
         )
+        self.assertEqual(
+            estimate_sample_size(0.05, 0.90, method="holdout_wilson"),
+            wilson_sample_size(0.05, 0.90),
+        )
+        self.assertEqual(
+            estimate_sample_size(0.05, 0.90, method="holdout_t_test"),
+            t_test_sample_size(0.05, 0.90),
+        )
+        self.assertEqual(
+            estimate_sample_size(
+                0.05, 0.90, method="holdout_clopper_pearson", accuracy=0.8
+            ),
+            clopper_pearson_sample_size(0.05, 0.90, accuracy=0.8),
+        )
 
     def test_confidence_level_estimation(self):
         with self.assertRaises(Exception):
@@ -497,3 +513,399 @@ class TestConfidencePlannerMethods(unittest.TestCase):
             estimate_confidence_level(300, 0.05, method="progressive"),
             langford_confidence_level(300, 0.05),
         )
+        self.assertEqual(
+            estimate_confidence_level(300, 0.05, method="holdout_wilson"),
+            wilson_confidence_level(300, 0.05),
+        )
+        self.assertEqual(
+            estimate_confidence_level(
+                300, 0.05, method="holdout_clopper_pearson", accuracy=0.8
+            ),
+            clopper_pearson_confidence_level(300, 0.05, accuracy=0.8),
+        )
+
+    def test_batch_ci(self):
+        sizes = np.array([[30], [132], [555], [1000]])
+        accuracies = np.array([0.0, 0.02, 0.5, 0.8, 0.98, 1.0])
+        for scalar_f, batch_f in [
+            (wilson_ci, wilson_ci_batch),
+            (clopper_pearson_ci, clopper_pearson_ci_batch),
+            (langford_ci, langford_ci_batch),
+            (z_test_ci, z_test_ci_batch),
+            (t_test_ci, t_test_ci_batch),
+        ]:
+            for conf in [0.8, 0.9, 0.95]:
+                low, high = batch_f(sizes, accuracies, conf)
+                self.assertEqual(low.shape, (4, 6))
+                self.assertEqual(high.shape, (4, 6))
+                for i, n in enumerate(sizes[:, 0]):
+                    for j, acc in enumerate(accuracies):
+                        ci = scalar_f(int(n), acc, conf)
+                        self.assertEqual(low[i, j], ci[0])
+                        self.assertEqual(high[i, j], ci[1])
+
+        low, high = cross_validation_ci_batch([888, 555], [7, 10], 0.8, [0.88, 0.9])
+        for i, (n, splits, conf) in enumerate([(888, 7, 0.88), (555, 10, 0.9)]):
+            ci = cross_validation_ci(n, splits, 0.8, conf)
+            self.assertEqual(low[i], ci[0])
+            self.assertEqual(high[i], ci[1])
+
+        # invalid elements anywhere in the batch
+        with self.assertRaises(Exception):
+            wilson_ci_batch([100, 0], 0.8, 0.9)
+        with self.assertRaises(Exception):
+            z_test_ci_batch(100, [0.8, 1.01], 0.9)
+        with self.assertRaises(Exception):
+            langford_ci_batch(100, 0.8, [0.9, 1.0])
+        with self.assertRaises(Exception):
+            cross_validation_ci_batch(100, [5, 0], 0.8, 0.9)
+
+    def test_critical_value_cache(self):
+        import scipy.stats as st
+
+        clear_critical_value_cache()
+        self.assertEqual(critical_value(0.95), st.norm.ppf(0.975))
+        self.assertEqual(critical_value(0.95, 99), st.t.ppf(0.975, 99))
+        info = critical_value_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 2, 2))
+
+        for _ in range(10):
+            z_test_ci(321, 0.8, 0.95)
+            t_test_ci(100, 0.8, 0.95)
+        info = critical_value_cache_info()
+        self.assertEqual((info.hits, info.misses), (20, 2))
+
+        # t quantiles collapse to the normal quantile for large degrees of freedom
+        self.assertEqual(critical_value(0.9, T_TO_NORMAL_DF), critical_value(0.9))
+        self.assertAlmostEqual(
+            critical_value(0.999, T_TO_NORMAL_DF - 1), critical_value(0.999), delta=1e-5
+        )
+
+        low, high = t_test_ci_batch([[100], [200]], 0.5, [0.9, 0.95, 0.99])
+        self.assertEqual(low.shape, (2, 3))
+        self.assertEqual(high[1, 2], t_test_ci(200, 0.5, 0.99)[1])
+        clear_critical_value_cache()
+        self.assertEqual(critical_value_cache_info().currsize, 0)
+
+    def test_wilson_from_counts(self):
+        try:
+            from statsmodels.stats.proportion import proportion_confint
+        except ImportError:
+            self.skipTest("statsmodels is not installed")
+
+        trials = np.array([1, 7, 30, 132, 555, 10000])
+        for conf in [0.5, 0.8, 0.9, 0.95, 0.99, 0.999]:
+            for n in trials:
+                successes = np.arange(n + 1)
+                low, high = wilson_ci_from_counts(successes, n, conf)
+                sm_low, sm_high = proportion_confint(
+                    successes, n, alpha=1 - conf, method="wilson"
+                )
+                np.testing.assert_allclose(
+                    low, np.clip(sm_low, 0, 1), rtol=1e-12, atol=1e-15
+                )
+                np.testing.assert_allclose(
+                    high, np.clip(sm_high, 0, 1), rtol=1e-12, atol=1e-15
+                )
+
+        low, high = wilson_ci_from_counts(106, 132, 0.8)
+        ci = wilson_ci(132, 106 / 132, 0.8)
+        self.assertAlmostEqual(low, ci[0], places=15)
+        self.assertAlmostEqual(high, ci[1], places=15)
+
+        with self.assertRaises(Exception):
+            wilson_ci_from_counts([10, 11], 10, 0.9)
+        with self.assertRaises(Exception):
+            wilson_ci_from_counts(-1, 10, 0.9)
+        with self.assertRaises(Exception):
+            wilson_ci_from_counts(5, 0, 0.9)
+
+    def test_clopper_pearson_from_counts(self):
+        import scipy.stats as st
+
+        for conf in [0.5, 0.9, 0.95, 0.999]:
+            for n in [1, 7, 30, 555, 10000]:
+                successes = np.arange(n + 1)
+                low, high = clopper_pearson_ci_from_counts(successes, n, conf)
+                alpha_2 = (1 - conf) / 2
+                with np.errstate(invalid="ignore"):
+                    ref_low = st.beta.ppf(alpha_2, successes, n - successes + 1)
+                    ref_high = st.beta.isf(alpha_2, successes + 1, n - successes)
+                np.testing.assert_allclose(low[1:], ref_low[1:], rtol=1e-10)
+                np.testing.assert_allclose(high[:-1], ref_high[:-1], rtol=1e-10)
+                self.assertEqual(low[0], 0.0)
+                self.assertEqual(high[-1], 1.0)
+                self.assertTrue(np.all(low <= successes / n))
+                self.assertTrue(np.all(high >= successes / n))
+
+        low, high = clopper_pearson_ci_from_counts([[444], [111]], 555, [0.9, 0.95])
+        self.assertEqual(low.shape, (2, 2))
+        ci = clopper_pearson_ci(555, 0.8, 0.9)
+        self.assertEqual(low[0, 0], ci[0])
+        self.assertEqual(high[0, 0], ci[1])
+
+        with self.assertRaises(Exception):
+            clopper_pearson_ci_from_counts([10, 11], 10, 0.9)
+        with self.assertRaises(Exception):
+            clopper_pearson_ci_from_counts(5, 10, 1.0)
+
+    def test_percentiles_confidence_level_batch(self):
+        import scipy.stats as st
+
+        rng = np.random.default_rng(3)
+        accuracies = np.round(rng.normal(0.8, 0.03, (5, 201)), 2)
+        accuracies[1] = np.round(rng.normal(0.7, 0.05, 201), 3)
+        radii = np.array([0.0, 0.01, 0.02, 0.05, 0.1, 0.5])
+
+        for method in ["rank", "weak", "strict", "mean"]:
+            levels = percentiles_confidence_level_batch(accuracies, radii, method)
+            self.assertEqual(levels.shape, (5, 6))
+            for i, row in enumerate(accuracies):
+                median = np.median(row)
+                for j, radius in enumerate(radii):
+                    self.assertEqual(
+                        levels[i, j],
+                        percentiles_confidence_level(row, radius, method),
+                    )
+                    expected = (
+                        st.percentileofscore(row, median + radius, method)
+                        - st.percentileofscore(row, median - radius, method)
+                    ) / 100
+                    self.assertAlmostEqual(
+                        levels[i, j], min(max(expected, 0.0), 1.0), places=12
+                    )
+
+        levels = percentiles_confidence_level_batch(accuracies[0, :100], 0.05)
+        self.assertEqual(levels.shape, (1, 1))
+
+        with self.assertRaises(Exception):
+            percentiles_confidence_level_batch(accuracies, [0.1, 0.6])
+        with self.assertRaises(Exception):
+            percentiles_confidence_level_batch([[0.5, 1.1]], 0.1)
+        with self.assertRaises(Exception):
+            percentiles_confidence_level_batch(accuracies, 0.1, method="median")
+
+    def test_wilson_clopper_pearson_sample_size(self):
+        radii = np.array([[0.03], [0.05], [0.1], [0.3], [0.5]])
+        confs = np.array([0.8, 0.9, 0.95, 0.99])
+        for accuracy in [0.0, 0.3, 0.5, 0.8, 0.97]:
+            for scalar_ci, solver in [
+                (wilson_ci, wilson_sample_size_batch),
+                (clopper_pearson_ci, clopper_pearson_sample_size_batch),
+            ]:
+                sizes = solver(radii, confs, accuracy)
+                self.assertEqual(sizes.shape, (5, 4))
+                for i, radius in enumerate(radii[:, 0]):
+                    for j, conf in enumerate(confs):
+                        n = int(sizes[i, j])
+                        ci = scalar_ci(n, accuracy, conf)
+                        self.assertLessEqual((ci[1] - ci[0]) / 2, radius)
+                        if n > 1:
+                            ci = scalar_ci(n - 1, accuracy, conf)
+                            self.assertGreater((ci[1] - ci[0]) / 2, radius)
+
+        self.assertEqual(
+            wilson_sample_size(0.05, 0.9), wilson_sample_size_batch(0.05, 0.9)
+        )
+        # Clopper-Pearson is more conservative than Wilson
+        self.assertGreater(
+            clopper_pearson_sample_size(0.05, 0.9), wilson_sample_size(0.05, 0.9)
+        )
+
+        with self.assertRaises(Exception):
+            wilson_sample_size(0.0, 0.9)
+        with self.assertRaises(Exception):
+            clopper_pearson_sample_size(0.05, 1.0)
+        with self.assertRaises(Exception):
+            wilson_sample_size_batch([0.05, 0.6], 0.9)
+        with self.assertRaises(Exception):
+            clopper_pearson_sample_size(0.05, 0.9, accuracy=1.2)
+
+    def test_wilson_clopper_pearson_confidence_level(self):
+        sizes = np.array([[5], [30], [132], [555], [10000]])
+        for accuracy in [0.0, 0.3, 0.5, 0.8, 1.0]:
+            for conf in [0.5, 0.8, 0.9, 0.95, 0.99]:
+                for ci_batch, level_batch in [
+                    (wilson_ci_batch, wilson_confidence_level_batch),
+                    (clopper_pearson_ci_batch, clopper_pearson_confidence_level_batch),
+                ]:
+                    low, high = ci_batch(sizes, accuracy, conf)
+                    levels = level_batch(sizes, (high - low) / 2, accuracy)
+                    self.assertEqual(levels.shape, (5, 1))
+                    np.testing.assert_allclose(levels, conf, atol=1e-9)
+
+        ci = wilson_ci(300, 0.5, 0.9)
+        self.assertAlmostEqual(
+            wilson_confidence_level(300, (ci[1] - ci[0]) / 2), 0.9, places=9
+        )
+        ci = clopper_pearson_ci(300, 0.75, 0.9)
+        self.assertAlmostEqual(
+            clopper_pearson_confidence_level(300, (ci[1] - ci[0]) / 2, 0.75),
+            0.9,
+            places=9,
+        )
+
+        self.assertEqual(wilson_confidence_level(100, 0.5), 1.0)
+        self.assertEqual(wilson_confidence_level(100, 0.0), 0.0)
+        self.assertEqual(clopper_pearson_confidence_level(100, 0.5), 1.0)
+        self.assertEqual(clopper_pearson_confidence_level(100, 0.0), 0.0)
+
+        levels = wilson_confidence_level_batch([100, 200, 400], 0.05)
+        self.assertTrue(np.all(np.diff(levels) > 0))
+
+        with self.assertRaises(Exception):
+            wilson_confidence_level(0, 0.1)
+        with self.assertRaises(Exception):
+            clopper_pearson_confidence_level(100, 0.6)
+        with self.assertRaises(Exception):
+            wilson_confidence_level_batch([100, 200], 0.1, accuracy=[0.5, -0.1])
+
+    def test_t_test_sample_size(self):
+        for radius, conf in [(0.05, 0.9), (0.01, 0.95), (0.3, 0.99), (0.5, 0.5)]:
+            n = t_test_sample_size(radius, conf)
+            self.assertGreaterEqual(n, z_test_sample_size(radius, conf))
+            self.assertGreaterEqual(t_test_confidence_level(n, radius), conf - 1e-12)
+            if n > 2:
+                self.assertLess(t_test_confidence_level(n - 1, radius), conf)
+
+    def test_nan_parameters(self):
+        # NaN fails every range check, so it is rejected instead of searched for
+        for f, args in [
+            (wilson_sample_size, (np.nan, 0.9)),
+            (clopper_pearson_sample_size, (0.05, np.nan)),
+            (t_test_sample_size, (np.nan, 0.9)),
+            (z_test_ci_batch, ([100, np.nan], 0.8, 0.9)),
+            (wilson_ci, (100, np.nan, 0.9)),
+        ]:
+            with self.assertRaises(Exception):
+                f(*args)
+        with self.assertRaises(Exception):
+            estimate_sample_size(np.nan, 0.9, method="holdout_wilson")
+        with trusted():
+            with self.assertRaises(BatchValidationError):
+                wilson_sample_size_batch([0.05, 0.0], 0.9)
+
+    def test_batch_sample_size_confidence_level(self):
+        radii = np.array([[0.01], [0.05], [0.2], [0.5]])
+        levels = np.array([0.5, 0.8, 0.9, 0.99])
+        for scalar_f, batch_f in [
+            (langford_sample_size, langford_sample_size_batch),
+            (z_test_sample_size, z_test_sample_size_batch),
+            (t_test_sample_size, t_test_sample_size_batch),
+        ]:
+            sizes = batch_f(radii, levels)
+            self.assertEqual(sizes.shape, (4, 4))
+            for i, r in enumerate(radii[:, 0]):
+                for j, conf in enumerate(levels):
+                    self.assertEqual(sizes[i, j], scalar_f(r, conf))
+        sizes = cross_validation_sample_size_batch(0.05, levels, [5, 10, 5, 10])
+        for j, (conf, k) in enumerate(zip(levels, [5, 10, 5, 10])):
+            self.assertEqual(sizes[j], cross_validation_sample_size(0.05, conf, k))
+
+        sample_sizes = np.array([[2], [30], [1000], [10**6]])
+        radii = np.array([0.0, 0.01, 0.05, 0.5])
+        for scalar_f, batch_f in [
+            (langford_confidence_level, langford_confidence_level_batch),
+            (z_test_confidence_level, z_test_confidence_level_batch),
+            (t_test_confidence_level, t_test_confidence_level_batch),
+        ]:
+            confidence_levels = batch_f(sample_sizes, radii)
+            for i, n in enumerate(sample_sizes[:, 0]):
+                for j, r in enumerate(radii):
+                    self.assertAlmostEqual(
+                        confidence_levels[i, j], scalar_f(int(n), r), places=12
+                    )
+        confidence_levels = cross_validation_confidence_level_batch(1000, radii, 5)
+        for j, r in enumerate(radii):
+            self.assertAlmostEqual(
+                confidence_levels[j],
+                cross_validation_confidence_level(1000, r, 5),
+                places=12,
+            )
+
+        with self.assertRaises(Exception):
+            z_test_sample_size_batch([0.05, 0.6], 0.9)
+        with self.assertRaises(Exception):
+            langford_sample_size_batch(0.05, [0.9, 1.0])
+        with self.assertRaises(Exception):
+            cross_validation_sample_size_batch(0.05, 0.9, [5, 0])
+        with self.assertRaises(Exception):
+            t_test_confidence_level_batch([100, 0], 0.05)
+        with self.assertRaises(Exception):
+            cross_validation_confidence_level_batch(100, 0.05, [5, 0])
+
+    def test_trusted_mode(self):
+        self.assertFalse(is_trusted())
+        with trusted():
+            self.assertTrue(is_trusted())
+            self.assertEqual(langford_ci(100, 0.8, 0.9), langford_ci(100, 0.8, 0.9))
+            # validation is skipped, results are still capped
+            self.assertEqual(z_test_ci(100, 1.5, 0.9)[1], 1.0)
+            z_test_ci_batch([100, 100], [0.8, 1.5], 0.9)
+            langford_sample_size(-0.1, 0.9)
+        self.assertFalse(is_trusted())
+        with self.assertRaises(Exception):
+            z_test_ci(100, 1.5, 0.9)
+
+        for n, acc, conf in [(100, 0.8, 0.9), (3, 0.0, 0.5), (1000, 1.0, 0.99)]:
+            for f in [wilson_ci, langford_ci, z_test_ci, t_test_ci, clopper_pearson_ci]:
+                expected = f(n, acc, conf)
+                with trusted():
+                    self.assertEqual(f(n, acc, conf), expected)
+
+    def test_unchecked_kernels(self):
+        for n, acc, conf in [(100, 0.8, 0.9), (3, 0.0, 0.5), (1000, 1.0, 0.99)]:
+            for f in [wilson_ci, langford_ci, z_test_ci, t_test_ci, clopper_pearson_ci]:
+                result = unchecked(f)(n, acc, conf)
+                self.assertIsInstance(result, Interval)
+                self.assertEqual(result, f(n, acc, conf))
+            self.assertEqual(
+                unchecked("cross_validation_ci")(n, 5, acc, conf),
+                cross_validation_ci(n, 5, acc, conf),
+            )
+        # no validation: an invalid accuracy gives a capped, meaningless interval
+        self.assertEqual(unchecked(z_test_ci)(100, 1.5, 0.9)[1], 1.0)
+        with self.assertRaises(Exception):
+            unchecked(percentiles_ci)
+
+    def test_wilson_round_trip(self):
+        # Wilson sample sizes and confidence levels invert the Wilson intervals
+        for n, radius in [(100, 0.1), (300, 0.05), (5000, 0.01)]:
+            for accuracy in [0.5, 0.8]:
+                conf = estimate_confidence_level(
+                    n, radius, method="holdout_wilson", accuracy=accuracy
+                )
+                ci = estimate_confidence_interval(
+                    n, accuracy, conf, method="holdout_wilson"
+                )
+                self.assertAlmostEqual((ci.high - ci.low) / 2, radius)
+        for radius, conf in [(0.1, 0.9), (0.05, 0.95), (0.01, 0.99)]:
+            n = estimate_sample_size(radius, conf, method="holdout_wilson")
+            ci = wilson_ci(n, 0.5, conf)
+            self.assertLessEqual((ci.high - ci.low) / 2, radius)
+            ci = wilson_ci(n - 1, 0.5, conf)
+            self.assertGreater((ci.high - ci.low) / 2, radius)
+
+    def test_batch_validation_indices(self):
+        with self.assertRaises(BatchValidationError) as context:
+            z_test_ci_batch(100, [0.8, 1.5, 0.2, -0.1], 0.9)
+        np.testing.assert_array_equal(context.exception.indices, [1, 3])
+        self.assertEqual(context.exception.shape, (4,))
+        self.assertIn("[1, 3]", str(context.exception))
+
+        with self.assertRaises(BatchValidationError) as context:
+            wilson_ci_batch([[100], [0]], 0.8, [0.9, 0.95])
+        np.testing.assert_array_equal(context.exception.indices, [2, 3])
+        self.assertIn("(1, 0), (1, 1)", str(context.exception))
+
+        with self.assertRaises(BatchValidationError) as context:
+            langford_sample_size_batch(np.full(20, 0.6), 0.9)
+        self.assertEqual(context.exception.indices.size, 20)
+        self.assertTrue(str(context.exception).endswith(", ...]"))
+
+    def test_batch_results_are_clipped(self):
+        low, high = langford_ci_batch([10, 10**6], [0.01, 0.99], 0.9)
+        self.assertEqual(low[0], 0.0)
+        self.assertLessEqual(high[1], 1.0)
+        low, high = z_test_ci_batch(10, 0.0, 0.9)
+        self.assertEqual(low, 0.0)
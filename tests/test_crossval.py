@@ -0,0 +1,134 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+import scipy.stats as st
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+from confidence_planner import *
+
+
+class TestCorrectedResampledT(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.fold_accuracies = np.clip(rng.normal(0.8, 0.03, (20, 10, 5)), 0, 1)
+
+    def test_matches_formula(self):
+        folds = self.fold_accuracies[0]
+        mean, variance = folds.mean(), folds.var(ddof=1)
+        radius = st.t.ppf(0.975, 49) * np.sqrt((1 / 50 + 1 / 4) * variance)
+        ci = corrected_resampled_t_ci(folds, 0.95)
+        self.assertAlmostEqual(ci.low, mean - radius)
+        self.assertAlmostEqual(ci.high, mean + radius)
+
+        ci = corrected_resampled_t_ci(folds[0], 0.9, test_train_ratio=0.5)
+        radius = st.t.ppf(0.95, 4) * np.sqrt((1 / 5 + 0.5) * folds[0].var(ddof=1))
+        self.assertAlmostEqual(ci.radius, radius)
+
+    def test_batch(self):
+        low, high = corrected_resampled_t_ci_batch(
+            self.fold_accuracies, [[0.9], [0.95]]
+        )
+        self.assertEqual(low.shape, (2, 20))
+        for i in range(20):
+            ci = corrected_resampled_t_ci(self.fold_accuracies[i], 0.95)
+            self.assertAlmostEqual(low[1, i], ci.low)
+            self.assertAlmostEqual(high[1, i], ci.high)
+        self.assertTrue(np.all(high[0] - low[0] < high[1] - low[1]))
+
+    def test_counts(self):
+        sizes = np.array([100, 100, 100, 99, 99])
+        counts = np.round(self.fold_accuracies * sizes)
+        low, high = corrected_resampled_t_ci_batch(counts, 0.95, fold_sizes=sizes)
+        expected = corrected_resampled_t_ci_batch(counts / sizes, 0.95)
+        np.testing.assert_allclose(low, expected[0])
+        np.testing.assert_allclose(high, expected[1])
+        with self.assertRaises(BatchValidationError):
+            corrected_resampled_t_ci_batch(counts + 50, 0.95, fold_sizes=sizes)
+
+    def test_unfinished_folds(self):
+        folds = self.fold_accuracies[0].copy()
+        folds[5:] = np.nan
+        ci = corrected_resampled_t_ci(folds, 0.95)
+        expected = corrected_resampled_t_ci(
+            self.fold_accuracies[0, :5], 0.95, test_train_ratio=0.25
+        )
+        self.assertAlmostEqual(ci.low, expected.low)
+        folds[:] = np.nan
+        folds[0, 0] = 0.8
+        self.assertEqual(corrected_resampled_t_ci(folds, 0.95), [0.0, 1.0])
+
+    def test_estimate_confidence_interval(self):
+        folds = self.fold_accuracies[0]
+        ci = estimate_confidence_interval(
+            5000, folds.ravel().tolist(), 0.95, 5, "cv_corrected_t"
+        )
+        self.assertEqual(ci, corrected_resampled_t_ci(folds, 0.95))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(Exception):
+            corrected_resampled_t_ci([[0.8, 1.2]], 0.95)
+        with self.assertRaises(Exception):
+            corrected_resampled_t_ci([[0.8], [0.7]], 0.95)
+        with self.assertRaises(Exception):
+            corrected_resampled_t_ci([[0.8, 0.7]], 1.5)
+        with self.assertRaises(Exception):
+            corrected_resampled_t_ci_batch([0.8, 0.7], 0.95)
+        with self.assertRaises(BatchValidationError):
+            corrected_resampled_t_ci_batch([[0.8, 0.7]], [0.9, np.nan])
+        with self.assertRaises(BatchValidationError):
+            corrected_resampled_t_ci_batch([[80, 70]], 0.9, fold_sizes=np.nan)
+
+
+class TestCrossValidationTracker(unittest.TestCase):
+    def test_incremental(self):
+        rng = np.random.default_rng(8)
+        folds = np.clip(rng.normal(0.7, 0.05, (30, 3, 4)), 0, 1)
+        tracker = CrossValidationTracker(4, 3, shape=30)
+        low, high = tracker.interval()
+        self.assertTrue(np.all(low == 0) and np.all(high == 1))
+        widths = []
+        for repeat in range(3):
+            for fold in range(4):
+                tracker.add(fold, folds[:, repeat, fold], repeat=repeat)
+                widths.append(np.mean(np.subtract(*tracker.interval()[::-1])))
+        self.assertEqual(tracker.n_finished, 12)
+        self.assertLess(widths[-1], widths[1])
+        np.testing.assert_allclose(tracker.accuracy, folds.mean(axis=(1, 2)))
+        expected = corrected_resampled_t_ci_batch(folds, 0.95)
+        np.testing.assert_allclose(tracker.interval()[0], expected[0])
+
+    def test_counts(self):
+        tracker = CrossValidationTracker(3)
+        tracker.add(0, n_correct=80, fold_size=100).add(2, 0.7)
+        self.assertEqual(tracker.n_finished, 2)
+        self.assertAlmostEqual(tracker.accuracy, 0.75)
+        ci = tracker.interval(0.9)
+        self.assertEqual(ci, corrected_resampled_t_ci([0.8, np.nan, 0.7], 0.9))
+
+        # one fold size per tracked run
+        tracker = CrossValidationTracker(3, shape=3)
+        tracker.add(0, n_correct=[50, 60, 70], fold_size=[100, 200, 100])
+        np.testing.assert_allclose(tracker.fold_accuracies[:, 0, 0], [0.5, 0.3, 0.7])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(Exception):
+            CrossValidationTracker(1)
+        tracker = CrossValidationTracker(3)
+        with self.assertRaises(Exception):
+            tracker.accuracy
+        with self.assertRaises(Exception):
+            tracker.add(3, 0.5)
+        with self.assertRaises(Exception):
+            tracker.add(0, 0.5, repeat=1)
+        with self.assertRaises(Exception):
+            tracker.add(0, n_correct=5)
+        with self.assertRaises(Exception):
+            tracker.add(0, 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
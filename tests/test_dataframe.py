@@ -0,0 +1,211 @@
+import importlib.util
+import os
+import sys
+import unittest
+
+import numpy as np
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+from confidence_planner import *
+
+HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def _table(n_rows=1000):
+    rng = np.random.default_rng(9)
+    return {
+        "n": rng.integers(50, 5000, n_rows),
+        "accuracy": rng.uniform(0.5, 0.99, n_rows),
+        "method": rng.choice(["holdout", "cv", "holdout_clopper_pearson"], n_rows),
+        "folds": np.full(n_rows, 5),
+        "conf": rng.choice([0.9, 0.95], n_rows),
+    }
+
+
+class TestAddConfidenceIntervals(unittest.TestCase):
+    def assertMatchesScalar(self, table, result, rows=(0, 1, 2, 500, 999)):
+        for i in rows:
+            ci = estimate_confidence_interval(
+                int(table["n"][i]),
+                float(table["accuracy"][i]),
+                float(table["conf"][i]),
+                5,
+                str(table["method"][i]),
+            )
+            self.assertAlmostEqual(result["ci_low"][i], ci.low)
+            self.assertAlmostEqual(result["ci_high"][i], ci.high)
+
+    def test_dict(self):
+        table = _table()
+        result = add_confidence_intervals(
+            table,
+            confidence_level="conf",
+            method_column="method",
+            n_splits="folds",
+            chunk_size=128,
+        )
+        self.assertMatchesScalar(table, result)
+        self.assertIs(result["n"], table["n"])
+        self.assertNotIn("ci_low", table)
+
+    def test_single_method(self):
+        table = _table()
+        result = add_confidence_intervals(
+            table, method="holdout_langford", low="lower", high="upper"
+        )
+        low, high = langford_ci_batch(table["n"], table["accuracy"], 0.95)
+        np.testing.assert_allclose(result["lower"], low)
+        np.testing.assert_allclose(result["upper"], high)
+
+    def test_errors(self):
+        table = {"n": [100, 0, 200], "accuracy": [0.8, 0.8, 0.9]}
+        with self.assertRaisesRegex(Exception, "Row 1:"):
+            add_confidence_intervals(table)
+        result = add_confidence_intervals(table, errors="coerce", chunk_size=2)
+        self.assertTrue(np.isnan(result["ci_low"][1]))
+        self.assertFalse(np.isnan(result["ci_low"][2]))
+        with self.assertRaises(Exception):
+            add_confidence_intervals(table, method="cv")
+        with self.assertRaises(Exception):
+            add_confidence_intervals(table, method_column="method")
+        with self.assertRaises(Exception):
+            add_confidence_intervals(table, errors="ignore")
+
+    def test_stream(self):
+        table = _table(300)
+        chunks = [
+            {name: values[start : start + 100] for name, values in table.items()}
+            for start in range(0, 300, 100)
+        ]
+        results = list(
+            iter_confidence_intervals(
+                chunks,
+                confidence_level="conf",
+                method_column="method",
+                n_splits=5,
+            )
+        )
+        self.assertEqual(len(results), 3)
+        merged = {
+            name: np.concatenate([result[name] for result in results])
+            for name in ["ci_low", "ci_high"]
+        }
+        self.assertMatchesScalar(table, merged, rows=(0, 150, 299))
+
+        chunks[2]["n"] = chunks[2]["n"].copy()
+        chunks[2]["n"][10] = -1
+        with self.assertRaisesRegex(Exception, "Row 210:"):
+            list(iter_confidence_intervals(chunks))
+
+    @unittest.skipUnless(HAS_PANDAS, "pandas is not installed")
+    def test_pandas(self):
+        import pandas as pd
+
+        table = _table()
+        frame = pd.DataFrame(table)
+        result = add_confidence_intervals(
+            frame,
+            confidence_level="conf",
+            method_column="method",
+            n_splits="folds",
+            chunk_size=300,
+        )
+        self.assertIsInstance(result, pd.DataFrame)
+        self.assertNotIn("ci_low", frame.columns)
+        self.assertMatchesScalar(table, result)
+        self.assertTrue(
+            np.shares_memory(
+                result["accuracy"].to_numpy(), frame["accuracy"].to_numpy()
+            )
+        )
+
+        frame = pd.DataFrame(
+            {"n": pd.array([100, None], dtype="Int64"), "accuracy": [0.8, 0.9]}
+        )
+        result = add_confidence_intervals(frame, errors="coerce")
+        self.assertTrue(np.isnan(result["ci_low"][1]))
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_arrow(self):
+        import pyarrow as pa
+
+        table = _table()
+        arrow_table = pa.table(table)
+        result = add_confidence_intervals(
+            arrow_table,
+            confidence_level="conf",
+            method_column="method",
+            n_splits="folds",
+            chunk_size=300,
+        )
+        self.assertEqual(result.column_names[-2:], ["ci_low", "ci_high"])
+        self.assertMatchesScalar(
+            table,
+            {name: result.column(name).to_numpy() for name in ["ci_low", "ci_high"]},
+        )
+
+        # record batches are sliced into chunks instead of split into batches
+        batch = arrow_table.to_batches()[0]
+        result = add_confidence_intervals(
+            batch,
+            confidence_level="conf",
+            method_column="method",
+            n_splits=5,
+            chunk_size=300,
+        )
+        self.assertIsInstance(result, pa.RecordBatch)
+        self.assertEqual(result.num_rows, batch.num_rows)
+        self.assertEqual(result.schema.names[-1], "ci_high")
+        self.assertMatchesScalar(
+            table,
+            {name: result.column(name).to_numpy() for name in ["ci_low", "ci_high"]},
+        )
+
+        # a reader is consumed batch by batch
+        reader = pa.RecordBatchReader.from_batches(
+            arrow_table.schema, arrow_table.to_batches(max_chunksize=400)
+        )
+        results = list(
+            iter_confidence_intervals(
+                reader, confidence_level="conf", method_column="method", n_splits=5
+            )
+        )
+        self.assertEqual([result.num_rows for result in results], [400, 400, 200])
+        self.assertMatchesScalar(
+            table,
+            {
+                name: np.concatenate([r.column(name).to_numpy() for r in results])
+                for name in ["ci_low", "ci_high"]
+            },
+        )
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_empty_arrow_tables(self):
+        import pyarrow as pa
+
+        # no record batches at all
+        empty = pa.table(_table()).slice(0, 0)
+        result = add_confidence_intervals(
+            empty, confidence_level="conf", method_column="method", n_splits=5
+        )
+        self.assertIsInstance(result, pa.Table)
+        self.assertEqual(result.num_rows, 0)
+        self.assertEqual(result.schema.field("ci_low").type, pa.float64())
+
+        batch = pa.table(_table()).to_batches()[0].slice(0, 0)
+        result = add_confidence_intervals(
+            batch, confidence_level="conf", method_column="method", n_splits=5
+        )
+        self.assertIsInstance(result, pa.RecordBatch)
+        self.assertEqual(result.num_rows, 0)
+        self.assertEqual(result.schema.names[-2:], ["ci_low", "ci_high"])
+
+        with self.assertRaises(Exception):
+            add_confidence_intervals(pa.table({"n": [100]}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+from confidence_planner import *
+
+
+class TestGroupedConfidenceIntervals(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(6)
+        self.country = rng.integers(0, 7, 3000) * 10
+        self.device = np.array(["desktop", "mobile", "tablet"])[
+            rng.integers(0, 3, 3000)
+        ]
+        self.correct = rng.random(3000) < 0.85
+
+    def test_matches_per_group_loop(self):
+        for method in ["holdout", "holdout_clopper_pearson", "holdout_langford"]:
+            table = grouped_confidence_intervals(
+                (self.country, self.device), correct=self.correct, method=method
+            )
+            self.assertEqual(table["n"].sum(), 3000)
+            self.assertEqual(len(table["n"]), 21)
+            for i in range(len(table["n"])):
+                mask = (self.country == table["group_0"][i]) & (
+                    self.device == table["group_1"][i]
+                )
+                n = int(mask.sum())
+                accuracy = self.correct[mask].mean()
+                self.assertEqual(table["n"][i], n)
+                self.assertAlmostEqual(table["accuracy"][i], accuracy)
+                interval = estimate_confidence_interval(
+                    n, accuracy, 0.95, method=method
+                )
+                self.assertAlmostEqual(table["low"][i], interval.low)
+                self.assertAlmostEqual(table["high"][i], interval.high)
+
+    def test_sorted_by_keys(self):
+        table = grouped_confidence_intervals(
+            {"country": self.country, "device": self.device}, correct=self.correct
+        )
+        self.assertEqual(
+            list(table), ["country", "device", "n", "accuracy", "low", "high"]
+        )
+        keys = list(zip(table["country"].tolist(), table["device"].tolist()))
+        self.assertEqual(keys, sorted(keys))
+
+    def test_labels_and_sparse_keys(self):
+        groups = np.array([10**12, 5, 5, 10**12, -3])
+        table = grouped_confidence_intervals(
+            groups, y_true=[1, 2, 3, 4, 5], y_pred=[1, 2, 0, 0, 5]
+        )
+        self.assertEqual(table["group"].tolist(), [-3, 5, 10**12])
+        self.assertEqual(table["n"].tolist(), [1, 2, 2])
+        self.assertEqual(table["accuracy"].tolist(), [1.0, 0.5, 0.5])
+
+    def test_high_cardinality_keys(self):
+        # 10**4 values per key would give 10**20 row-major codes, more than fit into an int64
+        rng = np.random.default_rng(7)
+        keys = tuple(rng.integers(0, 10**4, 50000) * 7 for _ in range(5))
+        for key in keys:
+            # the first rows repeat the next ones, so some groups have two rows
+            key[:100] = key[100:200]
+        correct = rng.random(50000) < 0.8
+        table = grouped_confidence_intervals(keys, correct=correct)
+
+        expected = {}
+        for key, ok in zip(zip(*(key.tolist() for key in keys)), correct.tolist()):
+            n, n_correct = expected.get(key, (0, 0))
+            expected[key] = (n + 1, n_correct + ok)
+        groups = list(zip(*(table[f"group_{i}"].tolist() for i in range(5))))
+        self.assertEqual(groups, sorted(expected))
+        self.assertEqual(table["n"].tolist(), [expected[key][0] for key in groups])
+        self.assertEqual(table["n"][groups.index(tuple(k[0] for k in keys))], 2)
+        self.assertAlmostEqual(
+            table["accuracy"].sum(),
+            sum(n_correct / n for n, n_correct in expected.values()),
+        )
+
+    def test_categorical_keys(self):
+        class Categorical:
+            # Minimal stand-in for pandas.Categorical, with -1 codes for missing values.
+            def __init__(self, codes, categories):
+                self.codes = codes
+                self.categories = categories
+
+        key = Categorical(np.array([0, 2, -1, 2]), np.array(["x", "y", "z"]))
+        table = grouped_confidence_intervals(key, correct=[1, 1, 0, 0])
+        self.assertEqual(table["group"].tolist(), ["x", "z"])
+        self.assertEqual(table["n"].tolist(), [1, 2])
+
+    def test_cross_validation(self):
+        table = grouped_confidence_intervals(
+            self.device, correct=self.correct, method="cv", n_splits=5
+        )
+        self.assertEqual(len(table["n"]), 3)
+        self.assertTrue(np.all(table["low"] <= table["accuracy"]))
+        with self.assertRaises(Exception):
+            grouped_confidence_intervals(self.device, correct=self.correct, method="cv")
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(Exception):
+            grouped_confidence_intervals(
+                self.device, correct=self.correct, method="bootstrap"
+            )
+        with self.assertRaises(Exception):
+            grouped_confidence_intervals(self.device[:10], correct=self.correct)
+        with self.assertRaises(Exception):
+            grouped_confidence_intervals((), correct=self.correct)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import json
+import os
+import sys
+import threading
+import unittest
+
+import numpy as np
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+import confidence_planner as cp
+from confidence_planner import *
+
+
+class TestInstrumentation(unittest.TestCase):
+    def tearDown(self):
+        disable_instrumentation()
+
+    def test_disabled_by_default(self):
+        original = cp.wilson_ci
+        self.assertFalse(is_instrumented())
+        with instrument() as recorder:
+            self.assertTrue(is_instrumented())
+            self.assertIsNot(cp.wilson_ci, original)
+        self.assertFalse(is_instrumented())
+        self.assertIs(cp.wilson_ci, original)
+        self.assertIs(cp.confidence_planner.wilson_ci, original)
+
+        cp.wilson_ci(100, 0.8, 0.9)
+        self.assertEqual(recorder.to_dict(), {"functions": {}, "methods": {}})
+
+    def test_block_records_only_its_thread(self):
+        started, finished = threading.Event(), threading.Event()
+
+        def other_thread():
+            started.wait()
+            cp.langford_ci(100, 0.8, 0.9)
+            finished.set()
+
+        thread = threading.Thread(target=other_thread)
+        thread.start()
+        with instrument() as recorder:
+            started.set()
+            finished.wait()
+            cp.wilson_ci(100, 0.8, 0.9)
+        thread.join()
+        self.assertEqual(list(recorder.to_dict()["functions"]), ["wilson_ci"])
+
+    def test_restores_only_wrappers(self):
+        original = cp.langford_ci
+        replacement = lambda *args: None
+        with instrument():
+            cp.langford_ci = replacement
+        self.assertIs(cp.langford_ci, replacement)
+        self.assertIs(cp.confidence_planner.langford_ci, original)
+        cp.langford_ci = original
+
+    def test_calls_and_methods(self):
+        with instrument() as recorder:
+            for _ in range(10):
+                cp.estimate_confidence_interval(100, 0.8, 0.95)
+            cp.estimate_confidence_interval(100, 0.8, 0.95, 5, method="cv")
+            cp.estimate_sample_size(0.05, 0.95, method="holdout_langford")
+        stats = recorder.to_dict()
+
+        self.assertEqual(
+            stats["functions"]["estimate_confidence_interval"]["calls"], 11
+        )
+        self.assertEqual(stats["functions"]["wilson_ci"]["calls"], 10)
+        self.assertEqual(stats["functions"]["cross_validation_ci"]["calls"], 1)
+        self.assertEqual(stats["functions"]["langford_sample_size"]["calls"], 1)
+        self.assertEqual(
+            stats["methods"]["estimate_confidence_interval[holdout]"]["calls"], 10
+        )
+        self.assertEqual(
+            stats["methods"]["estimate_confidence_interval[cv]"]["calls"], 1
+        )
+        self.assertEqual(
+            stats["methods"]["estimate_sample_size[holdout_langford]"]["calls"], 1
+        )
+
+        entry = stats["functions"]["wilson_ci"]
+        self.assertGreater(entry["total_seconds"], 0)
+        self.assertLessEqual(entry["min_seconds"], entry["p50_seconds"])
+        self.assertLessEqual(entry["p50_seconds"], entry["p99_seconds"])
+        self.assertLessEqual(entry["p99_seconds"], entry["max_seconds"])
+        self.assertEqual(json.loads(recorder.to_json()), stats)
+
+    def test_batch_sizes_and_validation_failures(self):
+        with instrument() as recorder:
+            cp.wilson_ci_batch(np.full(1000, 100), 0.8, 0.9)
+            with self.assertRaises(BatchValidationError):
+                cp.wilson_ci_batch([100, -1, 0], 0.8, 0.9)
+            with self.assertRaises(Exception):
+                cp.estimate_confidence_interval(100, 0.8, 0.95, method="unknown")
+        stats = recorder.to_dict()["functions"]
+
+        self.assertEqual(stats["wilson_ci_batch"]["calls"], 2)
+        self.assertEqual(stats["wilson_ci_batch"]["items"], 1003)
+        self.assertEqual(stats["wilson_ci_batch"]["max_batch_size"], 1000)
+        self.assertEqual(stats["wilson_ci_batch"]["errors"], 1)
+        self.assertEqual(stats["wilson_ci_batch"]["invalid_elements"], 2)
+        self.assertEqual(stats["estimate_confidence_interval"]["errors"], 1)
+
+    def test_callback_and_merge(self):
+        events = []
+        with instrument(callback=events.append) as first:
+            cp.z_test_ci(100, 0.8, 0.9)
+            second = enable_instrumentation()
+            cp.estimate_confidence_interval(100, 0.8, 0.9, method="holdout_z_test")
+        disable_instrumentation(second)
+        self.assertFalse(is_instrumented())
+
+        self.assertEqual(
+            [(event["function"], event["method"]) for event in events],
+            [
+                ("z_test_ci", None),
+                ("z_test_ci", None),
+                ("estimate_confidence_interval", "holdout_z_test"),
+            ],
+        )
+        self.assertEqual(events[0]["batch_size"], 1)
+        self.assertIsNone(events[0]["error"])
+        self.assertEqual(second.to_dict()["functions"]["z_test_ci"]["calls"], 1)
+
+        first.merge(second)
+        self.assertEqual(first.to_dict()["functions"]["z_test_ci"]["calls"], 3)
+        self.assertEqual(first.reset().to_dict()["functions"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
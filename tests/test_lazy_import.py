@@ -0,0 +1,116 @@
+import os
+import subprocess
+import sys
+import unittest
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+
+HEAVY_MODULES = [
+    "matplotlib",
+    "matplotlib.pyplot",
+    "statsmodels",
+    "scipy.stats",
+    "multiprocessing",
+    "concurrent.futures",
+]
+
+
+def _run(code):
+    env = dict(os.environ, MPLBACKEND="Agg")
+    env["PYTHONPATH"] = os.pathsep.join([parent, env.get("PYTHONPATH", "")])
+    output = subprocess.check_output([sys.executable, "-c", code], env=env, cwd=parent)
+    return output.decode().split()
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_import_does_not_load_heavy_modules(self):
+        loaded = _run(
+            "import sys\n"
+            "import confidence_planner\n"
+            f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        )
+        self.assertEqual(loaded, [])
+
+    def test_default_estimators_do_not_load_heavy_modules(self):
+        loaded = _run(
+            "import sys\n"
+            "import confidence_planner as cp\n"
+            "cp.estimate_confidence_interval(100, 0.8, 0.9)\n"
+            "cp.estimate_sample_size(0.05, 0.9)\n"
+            "cp.estimate_confidence_level(100, 0.05)\n"
+            "print(' '.join(m for m in ['matplotlib', 'statsmodels'] if m in sys.modules))"
+        )
+        self.assertEqual(loaded, [])
+
+    def test_plotting_loaded_on_first_use(self):
+        loaded = _run(
+            "import sys\n"
+            "import confidence_planner as cp\n"
+            "f = cp.plot_classifier_intervals\n"
+            "assert f is cp.plotting.plot_classifier_intervals\n"
+            "print(' '.join(m for m in ['matplotlib'] if m in sys.modules))"
+        )
+        self.assertEqual(loaded, ["matplotlib"])
+
+    def test_rendering_does_not_load_pyplot(self):
+        loaded = _run(
+            "import sys\n"
+            "import confidence_planner as cp\n"
+            "image = cp.render_classifier_intervals(['a', 'b'], [100, 200], [0.8, 0.9], 'holdout')\n"
+            "assert image.startswith(b'\\x89PNG')\n"
+            "print(' '.join(m for m in ['matplotlib.pyplot'] if m in sys.modules))"
+        )
+        self.assertEqual(loaded, [])
+
+    def test_submodules_loaded_on_first_use(self):
+        loaded = _run(
+            "import sys\n"
+            "import confidence_planner as cp\n"
+            "assert 'cv_corrected_t' in cp.available_methods()\n"
+            "assert 'confidence_planner.crossval' not in sys.modules\n"
+            "f = cp.estimate_batch\n"
+            "assert f is cp.parallel.estimate_batch\n"
+            "print(' '.join(m for m in ['concurrent.futures'] if m in sys.modules))"
+        )
+        self.assertEqual(loaded, ["concurrent.futures"])
+
+    def test_star_import(self):
+        import importlib
+
+        import confidence_planner
+
+        namespace = {}
+        exec("from confidence_planner import *", namespace)
+        for module_name, attributes in confidence_planner._LAZY_MODULES.items():
+            module = importlib.import_module(f"confidence_planner.{module_name}")
+            self.assertEqual(sorted(attributes), sorted(module.__all__))
+            for name in attributes:
+                self.assertIs(namespace[name], getattr(module, name))
+        for name in ["np", "importlib", "math", "functools", "contextvars"]:
+            self.assertNotIn(name, namespace)
+        self.assertEqual(
+            len(confidence_planner.__all__), len(set(confidence_planner.__all__))
+        )
+
+    def test_star_import_loads_plotting_lazily(self):
+        loaded = _run(
+            "import sys\n"
+            "import confidence_planner\n"
+            "assert 'plot_classifier_intervals' in confidence_planner.__all__\n"
+            "assert 'confidence_planner.plotting' not in sys.modules\n"
+            "from confidence_planner import *\n"
+            "assert plot_classifier_intervals is confidence_planner.plotting.plot_classifier_intervals\n"
+            "print(' '.join(m for m in ['confidence_planner.plotting'] if m in sys.modules))"
+        )
+        self.assertEqual(loaded, ["confidence_planner.plotting"])
+
+    def test_unknown_attribute(self):
+        import confidence_planner
+
+        with self.assertRaises(AttributeError):
+            confidence_planner.no_such_attribute
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+from confidence_planner import *
+
+
+class TestOnlineEvaluator(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.y_true = rng.integers(0, 3, 5000)
+        self.y_pred = np.where(
+            rng.random(5000) < 0.8, self.y_true, (self.y_true + 1) % 3
+        )
+        self.correct = self.y_true == self.y_pred
+
+    def test_matches_batch_computation(self):
+        evaluator = OnlineEvaluator(confidence_level=0.9)
+        for i, is_correct in enumerate(self.correct[:1000]):
+            evaluator.update(correct=bool(is_correct))
+            if i % 100 == 99:
+                n = i + 1
+                self.assertEqual(
+                    evaluator.interval(),
+                    langford_ci(n, np.mean(self.correct[:n]), 0.9),
+                )
+        for start in range(1000, 5000, 250):
+            evaluator.update(
+                self.y_true[start : start + 250], self.y_pred[start : start + 250]
+            )
+        evaluator.update(correct=[])
+
+        self.assertEqual(evaluator.n, 5000)
+        self.assertAlmostEqual(evaluator.accuracy, np.mean(self.correct))
+        self.assertEqual(
+            evaluator.interval(),
+            estimate_confidence_interval(
+                5000, np.mean(self.correct), 0.9, method="progressive"
+            ),
+        )
+        self.assertEqual(
+            evaluator.interval(0.99), langford_ci(5000, np.mean(self.correct), 0.99)
+        )
+
+    def test_other_methods(self):
+        for method in ["holdout", "holdout_clopper_pearson", "holdout_t_test"]:
+            evaluator = OnlineEvaluator(0.95, method).update(correct=self.correct)
+            self.assertEqual(
+                evaluator.interval(),
+                estimate_confidence_interval(
+                    5000, np.mean(self.correct), 0.95, method=method
+                ),
+            )
+
+        with self.assertRaises(Exception):
+            OnlineEvaluator(method="cv")
+        with self.assertRaises(Exception):
+            OnlineEvaluator(method="bootstrap")
+        with self.assertRaises(Exception):
+            OnlineEvaluator(confidence_level=1.0)
+        with self.assertRaises(Exception):
+            OnlineEvaluator().interval()
+        with self.assertRaises(Exception):
+            OnlineEvaluator().update(correct=[0, 2])
+
+    def test_merge_and_checkpoint(self):
+        first = OnlineEvaluator(0.9, "holdout_wilson").update(
+            correct=self.correct[:2000]
+        )
+        second = OnlineEvaluator(0.9, "holdout_wilson").update(
+            correct=self.correct[2000:]
+        )
+        restored = OnlineEvaluator.from_bytes(first.to_bytes())
+        self.assertEqual((restored.n, restored.n_correct), (first.n, first.n_correct))
+        self.assertEqual(restored.method, "holdout_wilson")
+        self.assertEqual(restored.interval(), first.interval())
+
+        restored.merge(second)
+        self.assertEqual(
+            restored.interval(),
+            OnlineEvaluator(0.9, "holdout_wilson")
+            .update(correct=self.correct)
+            .interval(),
+        )
+        self.assertEqual(restored.reset().n, 0)
+        with self.assertRaises(Exception):
+            OnlineEvaluator.from_bytes(b"\0" * 64)
+
+    def test_checkpoint_layout(self):
+        evaluator = OnlineEvaluator(0.9, "holdout_clopper_pearson").update(
+            correct=self.correct
+        )
+        self.assertEqual(len(evaluator.to_bytes()), 64)
+
+        name = "holdout_" + "w" * 40
+        register_method(
+            EstimationMethod(
+                name, interval=get_method("holdout_wilson").kernel("interval")
+            )
+        )
+        try:
+            with self.assertRaisesRegex(Exception, "too long"):
+                OnlineEvaluator(method=name).to_bytes()
+        finally:
+            unregister_method(name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from confidence_planner import (
+    estimate_batch,
+    estimate_confidence_interval,
+    estimate_confidence_level,
+    estimate_sample_size,
+)
+
+
+class TestEstimateBatch(unittest.TestCase):
+    def test_intervals_match_scalar(self):
+        rng = np.random.default_rng(0)
+        methods = [
+            "holdout",
+            "holdout_wilson",
+            "holdout_clopper_pearson",
+            "holdout_langford",
+            "holdout_z_test",
+            "holdout_t_test",
+            "cv",
+        ]
+        n_rows = 70
+        requests = {
+            "sample_size": rng.integers(10, 1000, n_rows),
+            "accuracy": rng.uniform(0, 1, n_rows),
+            "confidence_level": rng.uniform(0.5, 0.99, n_rows),
+            "n_splits": np.full(n_rows, 5),
+            "method": [methods[i % len(methods)] for i in range(n_rows)],
+        }
+
+        for backend in ("serial", "thread", "process"):
+            result = estimate_batch(requests, backend=backend, n_jobs=2, chunk_size=4)
+            self.assertTrue(all(e is None for e in result["error"]))
+            for i in range(n_rows):
+                expected = estimate_confidence_interval(
+                    int(requests["sample_size"][i]),
+                    requests["accuracy"][i],
+                    requests["confidence_level"][i],
+                    n_splits=5,
+                    method=requests["method"][i],
+                )
+                np.testing.assert_allclose(
+                    [result["low"][i], result["high"][i]], expected, atol=1e-12
+                )
+
+    def test_per_row_errors(self):
+        requests = {
+            "sample_size": [100, 100, 100, 100],
+            "accuracy": [0.8, 1.5, 0.8, 0.8],
+            "confidence_level": [0.95, 0.95, 0.95, 0.95],
+            "method": ["holdout", "holdout", "cv", "unknown"],
+        }
+        result = estimate_batch(requests, backend="thread")
+
+        self.assertIsNone(result["error"][0])
+        self.assertIn("accuracy", result["error"][1].lower())
+        self.assertIn("n_splits", result["error"][2])
+        self.assertIn("Unknown CI estimation method", result["error"][3])
+        np.testing.assert_allclose(
+            [result["low"][0], result["high"][0]],
+            estimate_confidence_interval(100, 0.8, 0.95),
+        )
+        self.assertTrue(np.isnan(result["low"][1:]).all())
+
+    def test_invalid_folds_keep_vectorized_path(self):
+        requests = {
+            "sample_size": [100, 200, 300, 400],
+            "accuracy": [0.8, 0.8, 0.9, 0.9],
+            "confidence_level": [0.95] * 4,
+            "n_splits": [5, 1, np.nan, 10],
+            "method": ["cv"] * 4,
+        }
+        with mock.patch(
+            "confidence_planner.parallel._evaluate_rows",
+            side_effect=AssertionError("row-by-row fallback"),
+        ):
+            result = estimate_batch(requests, backend="serial")
+
+        for i in (0, 3):
+            self.assertIsNone(result["error"][i])
+            ci = estimate_confidence_interval(
+                requests["sample_size"][i],
+                requests["accuracy"][i],
+                0.95,
+                requests["n_splits"][i],
+                method="cv",
+            )
+            self.assertAlmostEqual(result["low"][i], ci.low)
+            self.assertAlmostEqual(result["high"][i], ci.high)
+        for i in (1, 2):
+            self.assertIn("n_splits", result["error"][i])
+            self.assertTrue(np.isnan(result["low"][i]))
+
+    def test_nan_rows(self):
+        result = estimate_batch(
+            {
+                "interval_radius": [0.05, np.nan, 0.05],
+                "confidence_level": [0.9, 0.9, np.nan],
+                "method": ["holdout_wilson"] * 3,
+            },
+            kind="sample_size",
+        )
+        self.assertEqual(
+            result["sample_size"][0],
+            estimate_sample_size(0.05, 0.9, method="holdout_wilson"),
+        )
+        self.assertIsNone(result["error"][0])
+        self.assertIsNotNone(result["error"][1])
+        self.assertIsNotNone(result["error"][2])
+
+        result = estimate_batch(
+            {
+                "sample_size": [np.nan, 100],
+                "accuracy": [0.8, np.nan],
+                "confidence_level": [0.9, 0.9],
+            }
+        )
+        self.assertTrue(all(error is not None for error in result["error"]))
+
+    def test_sample_size_and_confidence_level(self):
+        requests = {
+            "interval_radius": [0.05, 0.05, 0.1, 0.02],
+            "confidence_level": [0.95, 0.9, 0.95, 0.99],
+            "method": ["holdout", "holdout_wilson", "holdout_clopper_pearson", "cv"],
+            "n_splits": [0, 0, 0, 10],
+        }
+        result = estimate_batch(requests, kind="sample_size")
+        for i in range(4):
+            self.assertEqual(
+                result["sample_size"][i],
+                estimate_sample_size(
+                    requests["interval_radius"][i],
+                    requests["confidence_level"][i],
+                    n_splits=requests["n_splits"][i] or None,
+                    method=requests["method"][i],
+                ),
+            )
+
+        requests = {
+            "sample_size": [100, 1000, 500],
+            "interval_radius": [0.05, 0.05, 0.1],
+            "method": ["holdout", "holdout_wilson", "holdout_clopper_pearson"],
+        }
+        result = estimate_batch(requests, kind="confidence_level", backend="process")
+        for i in range(3):
+            self.assertAlmostEqual(
+                result["confidence_level"][i],
+                estimate_confidence_level(
+                    requests["sample_size"][i],
+                    requests["interval_radius"][i],
+                    method=requests["method"][i],
+                ),
+            )
+
+    def test_bootstrap_rows(self):
+        requests = {
+            "sample_size": [0, 0],
+            "accuracy": [[0.7, 0.8, 0.9, 0.85], [0.5, 0.6]],
+            "confidence_level": [0.9, 0.9],
+            "method": ["bootstrap", "bootstrap"],
+        }
+        result = estimate_batch(requests)
+        np.testing.assert_allclose(
+            [result["low"][0], result["high"][0]],
+            estimate_confidence_interval(
+                0, [0.7, 0.8, 0.9, 0.85], 0.9, method="bootstrap"
+            ),
+        )
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(Exception):
+            estimate_batch({"sample_size": [1]}, kind="unknown")
+        with self.assertRaises(Exception):
+            estimate_batch({"sample_size": [1]}, backend="gpu")
+        with self.assertRaises(Exception):
+            estimate_batch({"sample_size": [100], "accuracy": [0.5]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+import matplotlib
+import numpy as np
+
+matplotlib.use("Agg")
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+from confidence_planner import *
+from confidence_planner.plotting import (
+    _classifier_intervals,
+    plot_classifier_intervals,
+    render_classifier_intervals,
+)
+
+
+class TestPlotting(unittest.TestCase):
+    def setUp(self):
+        self.names = [f"model {i}" for i in range(50)]
+        self.sizes = np.arange(50) * 10 + 100
+        self.accuracies = np.linspace(0.6, 0.95, 50)
+
+    def test_intervals_match_scalar_estimates(self):
+        for method, n_splits in [("holdout", None), ("cv", 5), ("progressive", None)]:
+            means, low, high = _classifier_intervals(
+                self.sizes, self.accuracies, method, 0.95, n_splits
+            )
+            for i in [0, 25, 49]:
+                ci = estimate_confidence_interval(
+                    int(self.sizes[i]), self.accuracies[i], 0.95, n_splits, method
+                )
+                self.assertAlmostEqual(low[i], ci.low)
+                self.assertAlmostEqual(high[i], ci.high)
+
+        replicates = [[0.7, 0.8, 0.75], [0.5, 0.6, 0.55]]
+        means, low, high = _classifier_intervals(
+            [100, 100], replicates, "bootstrap", 0.9, None
+        )
+        self.assertAlmostEqual(means[1], 0.55)
+        self.assertEqual(low[0], percentiles_ci(replicates[0], 0.9).low)
+
+    def test_one_artist_per_confidence_level(self):
+        import matplotlib.pyplot as plt
+
+        f = plot_classifier_intervals(
+            self.names, self.sizes, self.accuracies, "holdout"
+        )
+        self.assertEqual(len(f.axes[0].containers), 3)
+        self.assertEqual(len(f.axes[0].get_legend().get_texts()), 3)
+        plt.close(f)
+
+    def test_render(self):
+        image = render_classifier_intervals(
+            self.names, self.sizes, self.accuracies, "holdout"
+        )
+        self.assertTrue(image.startswith(b"\x89PNG"))
+
+        buffer = io.BytesIO()
+        render_classifier_intervals(
+            self.names[:5],
+            self.sizes[:5],
+            self.accuracies[:5],
+            "cv",
+            buffer,
+            format="svg",
+            n_splits=10,
+        )
+        self.assertIn(b"<svg", buffer.getvalue())
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "intervals.svg")
+            render_classifier_intervals(
+                self.names[:5], self.sizes[:5], self.accuracies[:5], "holdout", path
+            )
+            with open(path, "rb") as file:
+                self.assertIn(b"<svg", file.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
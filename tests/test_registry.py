@@ -0,0 +1,100 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+from confidence_planner import *
+
+
+def _fixed_ci(n, acc, conf, n_splits):
+    return [max(acc - 0.1, 0.0), min(acc + 0.1, 1.0)]
+
+
+def _fixed_ci_batch(n, acc, conf, n_splits):
+    acc = np.broadcast_to(acc, np.broadcast(n, acc, conf).shape)
+    return np.maximum(acc - 0.1, 0.0), np.minimum(acc + 0.1, 1.0)
+
+
+class TestMethodRegistry(unittest.TestCase):
+    def tearDown(self):
+        if "fixed" in available_methods():
+            unregister_method("fixed")
+
+    def test_builtin_methods(self):
+        self.assertEqual(
+            available_methods("interval"),
+            [
+                "holdout",
+                "holdout_wilson",
+                "holdout_langford",
+                "holdout_clopper_pearson",
+                "holdout_z_test",
+                "holdout_t_test",
+                "bootstrap",
+                "cv",
+                "progressive",
+                "cv_corrected_t",
+            ],
+        )
+        self.assertIn("holdout_t_test", available_methods("sample_size"))
+        self.assertNotIn("bootstrap", available_methods("interval", batch=True))
+        self.assertTrue(get_method("cv").requires_n_splits)
+        self.assertTrue(get_method("bootstrap").uses_replicates)
+        self.assertEqual(
+            get_method("holdout").capabilities(),
+            ["interval", "sample_size", "confidence_level"],
+        )
+
+        with self.assertRaises(Exception):
+            get_method("random_method")
+        with self.assertRaises(Exception):
+            get_method("holdout", "random_kind")
+        with self.assertRaises(Exception):
+            get_method("bootstrap").kernel("interval", batch=True)
+        with self.assertRaises(Exception):
+            get_method("cv").check_n_splits(None)
+
+    def test_custom_method(self):
+        method = register_method(
+            EstimationMethod(
+                "fixed", interval=_fixed_ci, interval_batch=_fixed_ci_batch
+            )
+        )
+        self.assertIs(get_method("fixed"), method)
+        self.assertEqual(
+            estimate_confidence_interval(100, 0.5, 0.9, method="fixed"), [0.4, 0.6]
+        )
+        with self.assertRaises(Exception):
+            estimate_sample_size(0.05, 0.9, method="fixed")
+
+        result = estimate_batch(
+            {
+                "sample_size": [100, 100, 100],
+                "accuracy": [0.5, 0.95, 0.5],
+                "confidence_level": [0.9, 0.9, 0.9],
+                "method": ["fixed", "fixed", "holdout"],
+            }
+        )
+        np.testing.assert_allclose(result["low"][:2], [0.4, 0.85])
+        np.testing.assert_allclose(result["high"][:2], [0.6, 1.0])
+
+        with self.assertRaises(Exception):
+            register_method(EstimationMethod("fixed", interval=_fixed_ci))
+        register_method(EstimationMethod("fixed", interval=_fixed_ci), replace=True)
+        self.assertFalse(get_method("fixed").supports("interval", batch=True))
+
+        self.assertEqual(unregister_method("fixed").name, "fixed")
+        with self.assertRaises(Exception):
+            estimate_confidence_interval(100, 0.5, 0.9, method="fixed")
+        with self.assertRaises(Exception):
+            unregister_method("fixed")
+        with self.assertRaises(Exception):
+            register_method("fixed")
+
+
+if __name__ == "__main__":
+    unittest.main()
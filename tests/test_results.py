@@ -0,0 +1,67 @@
+import os
+import json
+import pickle
+import sys
+import unittest
+
+import numpy as np
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+from confidence_planner import *
+
+
+class TestInterval(unittest.TestCase):
+    def test_compatibility_with_lists(self):
+        ci = langford_ci(100, 0.8, 0.9)
+        self.assertIsInstance(ci, Interval)
+        low, high = ci
+        self.assertEqual((ci[0], ci[1]), (low, high))
+        self.assertEqual((ci.low, ci.high), (low, high))
+        self.assertEqual(len(ci), 2)
+        self.assertEqual(ci, [low, high])
+        self.assertEqual([low, high], ci)
+        self.assertNotEqual(ci, [low, high + 1])
+        self.assertEqual(ci.tolist(), [low, high])
+        self.assertEqual(json.loads(json.dumps(ci)), [low, high])
+        self.assertEqual(pickle.loads(pickle.dumps(ci)), ci)
+        self.assertIsInstance(pickle.loads(pickle.dumps(ci)), Interval)
+        np.testing.assert_array_equal(np.asarray(ci), [low, high])
+
+    def test_properties(self):
+        ci = Interval(0.25, 0.75)
+        self.assertEqual(ci.width, 0.5)
+        self.assertEqual(ci.radius, 0.25)
+        self.assertEqual(repr(ci), "Interval(low=0.25, high=0.75)")
+        self.assertEqual(hash(ci), hash((0.25, 0.75)))
+        self.assertFalse(hasattr(ci, "__dict__"))
+        with self.assertRaises(AttributeError):
+            ci.low = 0.1
+        with self.assertRaises(TypeError):
+            ci[0] = 0.1
+
+        ci = wilson_ci(100, 1.0, 0.9)
+        self.assertEqual(ci.high, 1.0)
+        for method in available_methods("interval"):
+            replicates = get_method(method).uses_replicates
+            accuracy = [0.7, 0.8, 0.9, 0.75, 0.85] if replicates else 0.8
+            ci = estimate_confidence_interval(100, accuracy, 0.9, 5, method)
+            self.assertIsInstance(ci, Interval)
+
+    def test_interval_array(self):
+        bounds = wilson_ci_batch([[100], [1000]], [0.1, 0.5, 0.9], 0.95)
+        intervals = interval_array(bounds)
+        self.assertEqual(intervals.shape, (2, 3))
+        self.assertEqual(intervals.dtype, interval_dtype())
+        np.testing.assert_array_equal(intervals["low"], bounds[0])
+        np.testing.assert_array_equal(intervals["high"], bounds[1])
+
+        intervals = interval_array(bounds, dtype=np.float32)
+        self.assertEqual(intervals.itemsize, 8)
+        np.testing.assert_allclose(intervals["low"], bounds[0], rtol=1e-6)
+        np.testing.assert_allclose(intervals["high"], bounds[1], rtol=1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
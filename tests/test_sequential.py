@@ -0,0 +1,108 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+from confidence_planner import *
+
+
+class TestConfidenceSequence(unittest.TestCase):
+    def test_coverage(self):
+        rng = np.random.default_rng(0)
+        for method in ["betting", "normal_mixture"]:
+            misses = 0
+            for i in range(200):
+                accuracy = [0.5, 0.8, 0.97][i % 3]
+                sequence = ConfidenceSequence(0.9, method, grid_size=200)
+                covered = True
+                for _ in range(20):
+                    sequence.update(correct=rng.random(25) < accuracy)
+                    low, high = sequence.interval()
+                    covered &= low <= accuracy <= high
+                misses += not covered
+            self.assertLessEqual(misses / 200, 0.15, method)
+
+    def test_intervals_never_widen(self):
+        rng = np.random.default_rng(1)
+        for method in ["betting", "normal_mixture"]:
+            sequence = ConfidenceSequence(method=method)
+            self.assertEqual(sequence.interval(), [0.0, 1.0])
+            previous = sequence.interval()
+            for _ in range(30):
+                sequence.update(correct=rng.random(20) < 0.7)
+                interval = sequence.interval()
+                self.assertGreaterEqual(interval.low, previous.low)
+                self.assertLessEqual(interval.high, previous.high)
+                previous = interval
+            self.assertLess(previous.radius, 0.5)
+            self.assertAlmostEqual(sequence.accuracy, sequence.n_correct / 600)
+
+    def test_chunking_does_not_change_betting(self):
+        correct = np.random.default_rng(2).random(700) < 0.9
+        whole = ConfidenceSequence().update(correct=correct)
+        chunked = ConfidenceSequence()
+        for start in range(0, 700, 33):
+            chunked.update(correct=correct[start : start + 33])
+        # Running intersections are taken after every prediction, so only floating point noise can differ.
+        self.assertAlmostEqual(whole.interval().low, chunked.interval().low)
+        self.assertAlmostEqual(whole.interval().high, chunked.interval().high)
+
+    def test_labels(self):
+        y_true = np.array([0, 1, 2, 1] * 50)
+        y_pred = np.array([0, 1, 2, 0] * 50)
+        sequence = ConfidenceSequence().update(y_true, y_pred)
+        self.assertEqual(sequence.n, 200)
+        self.assertEqual(sequence.n_correct, 150)
+        self.assertTrue(sequence.interval().low <= 0.75 <= sequence.interval().high)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(Exception):
+            ConfidenceSequence(1.0)
+        with self.assertRaises(Exception):
+            ConfidenceSequence(method="bootstrap")
+        with self.assertRaises(Exception):
+            ConfidenceSequence(grid_size=1)
+        with self.assertRaises(Exception):
+            ConfidenceSequence().accuracy
+
+
+class TestSequentialEvaluation(unittest.TestCase):
+    def test_stops_early_for_high_accuracy(self):
+        rng = np.random.default_rng(4)
+        chunks = (rng.random(10) < 0.95 for _ in range(10000))
+        result = sequential_evaluation(chunks, 0.05, 0.95)
+        self.assertTrue(result["stopped"])
+        self.assertLessEqual(result["interval"].radius, 0.05)
+        self.assertLess(result["sample_size"], estimate_sample_size(0.05, 0.95))
+        self.assertTrue(result["interval"].low <= 0.95 <= result["interval"].high)
+
+    def test_max_sample_size(self):
+        rng = np.random.default_rng(5)
+        chunks = (rng.random(100) < 0.5 for _ in range(10000))
+        result = sequential_evaluation(
+            chunks, 0.01, method="normal_mixture", max_sample_size=500
+        )
+        self.assertFalse(result["stopped"])
+        self.assertEqual(result["sample_size"], 500)
+
+    def test_label_chunks(self):
+        chunks = [([1, 0, 1, 1], [1, 0, 1, 1])] * 100
+        result = sequential_evaluation(chunks, 0.1)
+        self.assertTrue(result["stopped"])
+        self.assertEqual(result["accuracy"], 1.0)
+
+    def test_empty_stream(self):
+        result = sequential_evaluation([], 0.1)
+        self.assertFalse(result["stopped"])
+        self.assertEqual(result["sample_size"], 0)
+        self.assertIsNone(result["accuracy"])
+        with self.assertRaises(Exception):
+            sequential_evaluation([], 0.7)
+
+
+if __name__ == "__main__":
+    unittest.main()
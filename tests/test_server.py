@@ -0,0 +1,174 @@
+import asyncio
+import json
+import os
+import sys
+import unittest
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+from confidence_planner import *
+from confidence_planner.server import EstimationServer
+
+
+async def _request(address, method, path, body=None, raw=None, length=None):
+    reader, writer = await asyncio.open_connection(*address)
+    payload = raw if raw is not None else json.dumps(body).encode()
+    length = len(payload) if length is None else length
+    writer.write(
+        (
+            f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+            f"Content-Length: {length}\r\nConnection: close\r\n\r\n"
+        ).encode()
+        + payload
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(content)
+
+
+class TestEstimationServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = EstimationServer(port=0, batch_window=0.01)
+        self.address = await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_endpoints(self):
+        status, response = await _request(
+            self.address,
+            "POST",
+            "/confidence_interval",
+            {"sample_size": 100, "accuracy": 0.8, "confidence_level": 0.95},
+        )
+        self.assertEqual(status, 200)
+        ci = estimate_confidence_interval(100, 0.8, 0.95)
+        self.assertAlmostEqual(response["low"], ci.low)
+        self.assertAlmostEqual(response["high"], ci.high)
+
+        _, response = await _request(
+            self.address,
+            "POST",
+            "/sample_size",
+            {
+                "interval_radius": 0.05,
+                "confidence_level": 0.9,
+                "method": "cv",
+                "n_splits": 5,
+            },
+        )
+        self.assertEqual(
+            response["sample_size"], estimate_sample_size(0.05, 0.9, 5, method="cv")
+        )
+
+        _, response = await _request(
+            self.address,
+            "POST",
+            "/confidence_level",
+            {
+                "sample_size": 1000,
+                "interval_radius": 0.05,
+                "method": "holdout_langford",
+            },
+        )
+        self.assertAlmostEqual(
+            response["confidence_level"],
+            estimate_confidence_level(1000, 0.05, method="holdout_langford"),
+        )
+
+    async def test_bootstrap(self):
+        accuracies = [0.8, 0.82, 0.85, 0.79, 0.9, 0.84]
+        _, response = await _request(
+            self.address,
+            "POST",
+            "/confidence_interval",
+            {
+                "sample_size": 6,
+                "accuracy": accuracies,
+                "confidence_level": 0.9,
+                "method": "bootstrap",
+            },
+        )
+        ci = estimate_confidence_interval(6, accuracies, 0.9, method="bootstrap")
+        self.assertAlmostEqual(response["low"], ci.low)
+        self.assertAlmostEqual(response["high"], ci.high)
+
+    async def test_concurrent_requests_are_batched(self):
+        bodies = [
+            {"sample_size": 50 + i, "accuracy": 0.8, "confidence_level": 0.9}
+            for i in range(40)
+        ]
+        responses = await asyncio.gather(
+            *[
+                _request(self.address, "POST", "/confidence_interval", body)
+                for body in bodies
+            ]
+        )
+        for body, (status, response) in zip(bodies, responses):
+            self.assertEqual(status, 200)
+            ci = estimate_confidence_interval(body["sample_size"], 0.8, 0.9)
+            self.assertAlmostEqual(response["low"], ci.low)
+
+        _, stats = await _request(self.address, "GET", "/stats", raw=b"")
+        self.assertEqual(stats["requests"], 40)
+        self.assertLess(stats["batches"], 40)
+        self.assertGreater(stats["max_batch_size"], 1)
+
+    async def test_errors(self):
+        status, response = await _request(
+            self.address,
+            "POST",
+            "/confidence_interval",
+            {"sample_size": 0, "accuracy": 0.8, "confidence_level": 0.9},
+        )
+        self.assertEqual(status, 400)
+        self.assertIn("error", response)
+
+        status, response = await _request(
+            self.address,
+            "POST",
+            "/confidence_interval",
+            {"accuracy": 0.8, "confidence_level": 0.9},
+        )
+        self.assertEqual(status, 400)
+        self.assertIn('Missing "sample_size"', response["error"])
+
+        status, response = await _request(
+            self.address,
+            "POST",
+            "/sample_size",
+            [
+                {"interval_radius": 0.05, "confidence_level": 0.9},
+                {"interval_radius": 0.05, "confidence_level": 0.9, "method": "x"},
+            ],
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(response[0]["sample_size"], estimate_sample_size(0.05, 0.9))
+        self.assertIn("error", response[1])
+
+        status, _ = await _request(self.address, "POST", "/sample_size", raw=b"{")
+        self.assertEqual(status, 400)
+        status, _ = await _request(self.address, "POST", "/unknown", {})
+        self.assertEqual(status, 404)
+        status, _ = await _request(self.address, "GET", "/sample_size", raw=b"")
+        self.assertEqual(status, 405)
+
+    async def test_invalid_content_length(self):
+        body = b'{"interval_radius": 0.05, "confidence_level": 0.9}'
+        for length in ["abc", "-5", "1.5"]:
+            status, response = await _request(
+                self.address, "POST", "/sample_size", raw=body, length=length
+            )
+            self.assertEqual(status, 400)
+            self.assertIn("Content-Length", response["error"])
+
+        # the server keeps running
+        status, _ = await _request(self.address, "POST", "/sample_size", raw=body)
+        self.assertEqual(status, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
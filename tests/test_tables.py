@@ -0,0 +1,156 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+from confidence_planner import *
+
+
+class TestPlanningTables(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.radii = np.geomspace(0.01, 0.5, 24)
+        self.confidence_levels = np.sort(1 - np.geomspace(1e-3, 0.5, 32))
+        self.sample_sizes = np.unique(np.round(np.geomspace(1, 10**6, 64)))
+        rng = np.random.default_rng(5)
+        self.query_radii = rng.uniform(0.01, 0.5, 300)
+        self.query_confidence_levels = rng.uniform(0.5, 0.999, 300)
+        self.query_sizes = np.round(rng.uniform(1, 10**6, 300))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _build(self, method, **kwargs):
+        path = os.path.join(self.directory.name, method)
+        build_planning_table(
+            path,
+            method,
+            radii=self.radii,
+            confidence_levels=self.confidence_levels,
+            sample_sizes=self.sample_sizes,
+            **kwargs,
+        )
+        return PlanningTable(path)
+
+    def test_lookups_match_exact_estimates(self):
+        for method, n_splits in [
+            ("holdout", None),
+            ("holdout_wilson", None),
+            ("holdout_clopper_pearson", None),
+            ("holdout_langford", None),
+            ("holdout_t_test", None),
+            ("cv", 5),
+        ]:
+            table = self._build(method, n_splits=n_splits)
+            self.assertIsInstance(table._data, np.memmap)
+            self.assertEqual(table.method, method)
+            self.assertEqual(table.n_splits, n_splits)
+
+            sizes = table.sample_size(self.query_radii, self.query_confidence_levels)
+            expected = [
+                estimate_sample_size(r, c, n_splits=n_splits, method=method)
+                for r, c in zip(self.query_radii, self.query_confidence_levels)
+            ]
+            # interpolated sample sizes are off by at most rounding errors for small sizes and 1% for large ones
+            np.testing.assert_allclose(sizes, expected, rtol=0.01, atol=2)
+
+            levels = table.confidence_level(self.query_sizes, self.query_radii)
+            expected = [
+                estimate_confidence_level(int(n), r, n_splits=n_splits, method=method)
+                for n, r in zip(self.query_sizes, self.query_radii)
+            ]
+            np.testing.assert_allclose(levels, expected, atol=2e-3)
+
+            # grid points are exact
+            conf = self.confidence_levels[20]
+            self.assertEqual(
+                table.sample_size(self.radii[3], conf),
+                estimate_sample_size(self.radii[3], conf, n_splits, method),
+            )
+            self.assertEqual(
+                table.confidence_level(self.sample_sizes[10], self.radii[5]),
+                estimate_confidence_level(
+                    int(self.sample_sizes[10]), self.radii[5], n_splits, method
+                ),
+            )
+
+            # queries outside of the grid are estimated exactly
+            self.assertEqual(
+                table.sample_size(0.005, 0.9),
+                estimate_sample_size(0.005, 0.9, n_splits, method),
+            )
+            self.assertEqual(
+                table.sample_size(0.05, 0.9999),
+                estimate_sample_size(0.05, 0.9999, n_splits, method),
+            )
+            self.assertEqual(
+                table.confidence_level(5 * 10**6, 0.001),
+                estimate_confidence_level(5 * 10**6, 0.001, n_splits, method),
+            )
+
+    def test_partial_tables(self):
+        register_method(
+            EstimationMethod(
+                "confidence_only",
+                confidence_level=lambda n, r, k, acc: z_test_confidence_level(n, r),
+            )
+        )
+        try:
+            table = self._build("confidence_only")
+        finally:
+            unregister_method("confidence_only")
+        table.confidence_level(1000, 0.05)
+        with self.assertRaises(Exception):
+            table.sample_size(0.05, 0.9)
+
+        table = self._build("bootstrap")
+        conf = self.confidence_levels[20]
+        self.assertEqual(
+            table.sample_size(self.radii[3], conf),
+            z_test_sample_size(self.radii[3], conf),
+        )
+        with self.assertRaises(Exception):
+            table.confidence_level(1000, 0.05)
+
+    def test_shared_table(self):
+        first = self._build("holdout")
+        second = PlanningTable(os.path.join(self.directory.name, "holdout"))
+        np.testing.assert_array_equal(
+            first.sample_size(self.query_radii, 0.9),
+            second.sample_size(self.query_radii, 0.9),
+        )
+        with self.assertRaises(Exception):
+            first._size_grid[0, 0] = 1
+
+    def test_nan_queries_are_validated(self):
+        table = self._build("holdout")
+        with self.assertRaises(Exception):
+            table.sample_size(np.nan, 0.9)
+        with self.assertRaises(Exception):
+            table.sample_size([0.05, 0.1], [0.9, np.nan])
+        with self.assertRaises(Exception):
+            table.confidence_level(np.nan, 0.05)
+        with self.assertRaises(Exception):
+            table.confidence_level(1000, [0.05, np.nan])
+
+    def test_invalid_tables(self):
+        path = os.path.join(self.directory.name, "invalid")
+        with open(path, "wb") as f:
+            f.write(b"\0" * 256)
+        with self.assertRaises(Exception):
+            PlanningTable(path)
+        with self.assertRaises(Exception):
+            build_planning_table(path, "random_method", radii=self.radii)
+        with self.assertRaises(Exception):
+            build_planning_table(path, radii=[0.0, 0.1])
+        with self.assertRaisesRegex(Exception, "too long"):
+            build_planning_table(path, "holdout_" + "w" * 40, radii=self.radii)
+
+
+if __name__ == "__main__":
+    unittest.main()